@@ -1,4 +1,6 @@
 -- Query for Base Views 
+-- Rows flagged `warmup` (initial transient detected by the simulation, see
+-- simulation/output_analysis.py) are excluded so KPIs average over steady state only.
 
 CREATE MATERIALIZED VIEW analytics.v_work_order_lifecycle AS
 
@@ -97,6 +99,8 @@ LEFT JOIN quality_agg qa
 	ON fwo.work_order_id = qa.work_order_id
 	AND fwo.scenario_id = qa.scenario_id
 
+WHERE NOT fwo.warmup
+
 GROUP BY
 	fwo.work_order_id,
 	fwo.product_id,
@@ -196,7 +200,9 @@ LEFT JOIN downtime_agg da
 LEFT JOIN quality_agg qa
     ON fpe.work_order_id = qa.work_order_id
    AND fpe.batch_id = qa.batch_id
-   AND fpe.scenario_id = qa.scenario_id;
+   AND fpe.scenario_id = qa.scenario_id
+
+WHERE NOT fpe.warmup;
 -----------------------------------------------------------------------------------------------------
 CREATE MATERIALIZED VIEW analytics.v_machine_utilization AS
 WITH downtime_agg AS (
@@ -209,6 +215,7 @@ WITH downtime_agg AS (
 
 		scenario_id
 	FROM staging.fact_downtime_event
+	WHERE NOT warmup
 	GROUP BY machine_id, scenario_id
 ),
 
@@ -220,10 +227,19 @@ production_agg AS (
 		SUM(process_end - process_start) AS total_processing_time,
 		AVG(actual_cycle_time - ideal_cycle_time) AS avg_cycle_time_difference,
 		MAX(process_end) AS simulation_horizon_time,
-		SUM(process_end - process_start) / NULLIF(MAX(process_end), 0) AS utilization_pct,
+		-- Utilization over the observed (post-warm-up) window
+		SUM(process_end - process_start) / NULLIF(MAX(process_end) - MAX(observation_start), 0) AS utilization_pct,
 
 		scenario_id
-	FROM staging.fact_production_event
+	FROM (
+		SELECT
+			fpe.*,
+			COALESCE(ds.warmup_end_time, 0) AS observation_start
+		FROM staging.fact_production_event fpe
+		JOIN staging.dim_scenario ds
+			ON fpe.scenario_id = ds.scenario_id
+		WHERE NOT fpe.warmup
+	) fpe
 	GROUP BY machine_id, scenario_id
 ),
 
@@ -242,6 +258,7 @@ quality_agg AS (
 
 		scenario_id
 	FROM staging.fact_quality_event
+	WHERE NOT warmup
 	GROUP BY machine_id, scenario_id
 ),
 
@@ -269,6 +286,7 @@ downtime_production_failures_comb AS (
 				AND fde.process_id = fpe.process_id
 				AND fde.process_route_id = fpe.process_route_id
 				AND fde.scenario_id = fpe.scenario_id
+			WHERE NOT fde.warmup
 			GROUP BY
 				fde.machine_id,
 				fde.failure_start,
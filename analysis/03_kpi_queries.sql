@@ -91,6 +91,7 @@ fwo AS (
         COUNT(DISTINCT work_order_id) AS total_work_orders
     FROM staging.fact_work_order
     WHERE scenario_id = p_scenario_id
+      AND NOT warmup
 ),
 tcal AS (
     SELECT
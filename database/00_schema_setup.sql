@@ -11,6 +11,9 @@ CREATE SCHEMA analytics;
 CREATE SCHEMA staging;
 CREATE SCHEMA testing;
 
+-- Transient per-run tables of load_to_postgres.load_run_atomically (created and dropped by each load)
+CREATE SCHEMA IF NOT EXISTS load_staging;
+
 SET search_path TO analytics;
 
 CREATE TABLE dim_scenario (
@@ -21,6 +24,7 @@ CREATE TABLE dim_scenario (
     wip_limit 				INT NOT NULL,
     wip_poll_interval 		INT NOT NULL,
     sim_horizon_days 		INT NOT NULL,
+    warmup_end_time 		NUMERIC,
 	
     created_at 				TIMESTAMP DEFAULT NOW()
 );
@@ -101,6 +105,7 @@ CREATE TABLE fact_work_order (
 	work_order_start_time	NUMERIC NOT NULL,
 	work_order_end_time		NUMERIC NOT NULL,
 
+	warmup				BOOLEAN NOT NULL DEFAULT FALSE,
 	scenario_id				TEXT NOT NULL,
 	created_at          	TIMESTAMP DEFAULT NOW(),
 
@@ -131,6 +136,7 @@ CREATE TABLE fact_production_event (
     
 	event_status        TEXT NOT NULL,
 
+	warmup			BOOLEAN NOT NULL DEFAULT FALSE,
 	scenario_id			TEXT NOT NULL,
     created_at          TIMESTAMP DEFAULT NOW(),
 
@@ -164,6 +170,7 @@ CREATE TABLE fact_downtime_event (
     failure_start       NUMERIC NOT NULL,
     failure_end         NUMERIC NOT NULL,
 
+	warmup			BOOLEAN NOT NULL DEFAULT FALSE,
 	scenario_id			TEXT NOT NULL,
 	created_at          TIMESTAMP DEFAULT NOW(),
 
@@ -198,6 +205,7 @@ CREATE TABLE fact_quality_event (
 
 	event_time          NUMERIC NOT NULL,
 
+	warmup			BOOLEAN NOT NULL DEFAULT FALSE,
 	scenario_id			TEXT NOT NULL,
     created_at          TIMESTAMP DEFAULT NOW(),
 
@@ -226,6 +234,7 @@ CREATE TABLE dim_scenario (
     wip_limit 				INT NOT NULL,
     wip_poll_interval 		INT NOT NULL,
     sim_horizon_days 		INT NOT NULL,
+    warmup_end_time 		NUMERIC,
 	
     created_at 				TIMESTAMP DEFAULT NOW()
 );
@@ -306,6 +315,7 @@ CREATE TABLE fact_work_order (
 	work_order_start_time	NUMERIC NOT NULL,
 	work_order_end_time		NUMERIC NOT NULL,
 
+	warmup				BOOLEAN NOT NULL DEFAULT FALSE,
 	scenario_id				TEXT NOT NULL,
 	created_at          	TIMESTAMP DEFAULT NOW(),
 
@@ -336,6 +346,7 @@ CREATE TABLE fact_production_event (
     
 	event_status        TEXT NOT NULL,
 
+	warmup			BOOLEAN NOT NULL DEFAULT FALSE,
 	scenario_id			TEXT NOT NULL,
     created_at          TIMESTAMP DEFAULT NOW(),
 
@@ -369,6 +380,7 @@ CREATE TABLE fact_downtime_event (
     failure_start       NUMERIC NOT NULL,
     failure_end         NUMERIC NOT NULL,
 
+	warmup			BOOLEAN NOT NULL DEFAULT FALSE,
 	scenario_id			TEXT NOT NULL,
 	created_at          TIMESTAMP DEFAULT NOW(),
 
@@ -403,6 +415,7 @@ CREATE TABLE fact_quality_event (
 
 	event_time          NUMERIC NOT NULL,
 
+	warmup			BOOLEAN NOT NULL DEFAULT FALSE,
 	scenario_id			TEXT NOT NULL,
     created_at          TIMESTAMP DEFAULT NOW(),
 
@@ -431,6 +444,7 @@ CREATE TABLE dim_scenario (
     wip_limit 				INT NOT NULL,
     wip_poll_interval 		INT NOT NULL,
     sim_horizon_days 		INT NOT NULL,
+    warmup_end_time 		NUMERIC,
 	
     created_at 				TIMESTAMP DEFAULT NOW()
 );
@@ -511,6 +525,7 @@ CREATE TABLE fact_work_order (
 	work_order_start_time	NUMERIC NOT NULL,
 	work_order_end_time		NUMERIC NOT NULL,
 
+	warmup				BOOLEAN NOT NULL DEFAULT FALSE,
 	scenario_id				TEXT NOT NULL,
 	created_at          	TIMESTAMP DEFAULT NOW(),
 
@@ -541,6 +556,7 @@ CREATE TABLE fact_production_event (
     
 	event_status        TEXT NOT NULL,
 
+	warmup			BOOLEAN NOT NULL DEFAULT FALSE,
 	scenario_id			TEXT NOT NULL,
     created_at          TIMESTAMP DEFAULT NOW(),
 
@@ -574,6 +590,7 @@ CREATE TABLE fact_downtime_event (
     failure_start       NUMERIC NOT NULL,
     failure_end         NUMERIC NOT NULL,
 
+	warmup			BOOLEAN NOT NULL DEFAULT FALSE,
 	scenario_id			TEXT NOT NULL,
 	created_at          TIMESTAMP DEFAULT NOW(),
 
@@ -608,6 +625,7 @@ CREATE TABLE fact_quality_event (
 
 	event_time          NUMERIC NOT NULL,
 
+	warmup			BOOLEAN NOT NULL DEFAULT FALSE,
 	scenario_id			TEXT NOT NULL,
     created_at          TIMESTAMP DEFAULT NOW(),
 
@@ -0,0 +1,196 @@
+### AntitheticGenerator Class Definition for Production Plant Simulation ###
+"""
+AntitheticGenerator class for Production Plant Simulation.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+Inverse-transform sampling wrapper around a NumPy Generator for antithetic
+variates. The two runs of an antithetic pair use the same seed; in the base
+run every mirrored variate is F^-1(U), in the mirror run F^-1(1 - U). Short
+interarrivals, small batches, cycle times, failure times and repairs in one
+run then meet their opposites in the other, the KPIs of the pair are
+negatively correlated and the pair mean has a lower variance than the mean
+of two independent runs.
+
+Notes / Conventions
+-------------------
+- NumPy's samplers do not work by inversion, so both runs of a pair draw
+  the mirrored distributions (`normal`, `lognormal`, `gamma`,
+  `exponential`, `poisson`) through the wrapper; the base run is not
+  bit-identical to a run without antithetic sampling.
+- Normal and lognormal variates invert `statistics.NormalDist`; gamma
+  variates use the Wilson-Hilferty cube transform of the normal quantile,
+  which is accurate for the shape values used by the interarrival presets
+  (shape >= 1) and clipped at zero below that. Exponential variates are
+  inverted exactly and Poisson variates by a search of the CDF.
+- Only the streams the Plant wraps are mirrored (see `Plant.antithetic_rng`);
+  the plant structure and work order attributes are shared by both runs.
+- All other methods (`integers`, `binomial`, `choice`, `bit_generator`, ...)
+  are forwarded to the wrapped Generator unchanged, so the wrapper can stand
+  in wherever a Generator is passed and checkpoints still see the wrapped
+  Generator's state.
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import math
+from statistics import NormalDist
+
+####################################################################
+
+# Standard normal used for the inverse transforms
+_STANDARD_NORMAL = NormalDist()
+
+## AntitheticGenerator Class Definition ##
+class AntitheticGenerator(object):
+    """
+    Generator whose continuous and Poisson draws are (optionally mirrored) inversions.
+
+    Attributes
+    ----------
+    rng : numpy.random.Generator
+        Wrapped generator supplying the uniforms.
+    mirror : bool
+        True for the mirror run of a pair (uses 1 - U).
+    """
+
+    ### Initialization Method ###
+    def __init__(self, rng, mirror=False):
+        """
+        Initialize the wrapper.
+
+        Parameters
+        ----------
+        rng : numpy.random.Generator
+            Generator to draw uniforms from (shared, not copied).
+        mirror : bool, optional
+            Mirror every uniform (default False, the base run).
+        """
+        self.rng = rng
+        self.mirror = mirror
+
+    def __getattr__(self, name):
+        # Only reached for attributes not defined here: forward to the wrapped Generator
+        if name == 'rng':
+            raise AttributeError(name)
+        return getattr(self.rng, name)
+
+    def uniform_quantile(self) -> float:
+        """
+        Return the uniform of the next draw, U or 1 - U, strictly inside (0, 1).
+
+        Returns
+        -------
+        float
+        """
+        u = self.rng.random()
+        while u == 0.0:
+            u = self.rng.random()
+        return 1.0 - u if self.mirror else u
+
+    def standard_normal(self) -> float:
+        """
+        Return a standard normal variate by inversion.
+
+        Returns
+        -------
+        float
+        """
+        return _STANDARD_NORMAL.inv_cdf(self.uniform_quantile())
+
+    def normal(self, loc=0.0, scale=1.0) -> float:
+        """
+        Return a normal variate by inversion.
+
+        Parameters
+        ----------
+        loc : float, optional
+            Mean.
+        scale : float, optional
+            Standard deviation.
+
+        Returns
+        -------
+        float
+        """
+        return loc + scale * self.standard_normal()
+
+    def lognormal(self, mean=0.0, sigma=1.0) -> float:
+        """
+        Return a lognormal variate by inversion.
+
+        Parameters
+        ----------
+        mean : float, optional
+            Mean of the underlying normal.
+        sigma : float, optional
+            Standard deviation of the underlying normal.
+
+        Returns
+        -------
+        float
+        """
+        return math.exp(mean + sigma * self.standard_normal())
+
+    def exponential(self, scale=1.0) -> float:
+        """
+        Return an exponential variate by exact inversion.
+
+        Parameters
+        ----------
+        scale : float, optional
+            Mean of the distribution.
+
+        Returns
+        -------
+        float
+        """
+        return -scale * math.log(self.uniform_quantile())
+
+    def poisson(self, lam=1.0) -> int:
+        """
+        Return a Poisson variate by sequential search of the CDF.
+
+        Parameters
+        ----------
+        lam : float, optional
+            Mean of the distribution (small values such as batch sizes; the
+            search takes about `lam` steps).
+
+        Returns
+        -------
+        int
+        """
+        u = self.uniform_quantile()
+        k = 0
+        probability = math.exp(-lam)
+        cumulative = probability
+        while u > cumulative and probability > 0.0:
+            k += 1
+            probability *= lam / k
+            cumulative += probability
+        return k
+
+    def gamma(self, shape, scale=1.0) -> float:
+        """
+        Return a gamma variate by the Wilson-Hilferty approximation of its quantile.
+
+        Parameters
+        ----------
+        shape : float
+            Shape (k) parameter.
+        scale : float, optional
+            Scale (theta) parameter.
+
+        Returns
+        -------
+        float
+        """
+        c = 1.0 / (9.0 * shape)
+        cube_root = 1.0 - c + self.standard_normal() * math.sqrt(c)
+        return shape * scale * max(cube_root, 0.0) ** 3
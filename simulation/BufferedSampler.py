@@ -0,0 +1,175 @@
+### BufferedSampler Class Definition for Production Plant Simulation ###
+"""
+BufferedSampler class for Production Plant Simulation.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+Block-buffered sampling wrapper around a NumPy Generator.
+
+The hot paths of a run draw one scalar at a time: cycle-time noise per
+step, time to failure per failure, repair time per repair, interarrival
+time and batch size per arrival. Each scalar call into NumPy pays
+microseconds of overhead for a few nanoseconds of work. `BufferedSampler`
+draws a block of standard variates per distribution (`block_size` at once)
+and serves them sequentially as Python scalars, applying location and scale
+in Python.
+
+Notes / Conventions
+-------------------
+- Standard variates are shared by all parameter values (`normal`,
+  `lognormal` use one standard-normal block, `exponential` one
+  standard-exponential block); `gamma`, `integers` and `poisson` keep one
+  block per parameter value, which the simulation holds fixed per run.
+- Deterministic for a seed, but not the same sequence as unbuffered scalar
+  calls on the same Generator: the blocks of different distributions are
+  drawn from the stream in the order their blocks run out.
+- The unserved part of each block belongs to the simulation state:
+  checkpoints save it with `snapshot()` and restore it with `restore()`;
+  `reset()` discards it after the wrapped Generator is reseeded.
+- Methods without a buffered version (`binomial`, `choice`,
+  `bit_generator`, ...) are forwarded to the wrapped Generator.
+- Measured effect (`benchmarks.benchmark_buffered_sampling`, scenario C,
+  5 days): scalar draws cost 0.7-3.8 us unbuffered and 0.5-1.0 us buffered,
+  but a run spends about 30 us of SimPy scheduling per event, so end-to-end
+  throughput is unchanged within noise (about 30,000 events/s with and
+  without `rng_block_size=4096`). The sampler only pays off in code that
+  draws many variates per event.
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import math
+
+####################################################################
+
+# Variates drawn per block
+DEFAULT_BLOCK_SIZE = 4096
+
+## BufferedSampler Class Definition ##
+class BufferedSampler(object):
+    """
+    Generator wrapper serving scalar variates from pre-drawn blocks.
+
+    Attributes
+    ----------
+    rng : numpy.random.Generator
+        Wrapped generator the blocks are drawn from.
+    block_size : int
+        Variates per block.
+    """
+
+    ### Initialization Method ###
+    def __init__(self, rng, block_size=DEFAULT_BLOCK_SIZE):
+        """
+        Initialize the sampler with empty blocks.
+
+        Parameters
+        ----------
+        rng : numpy.random.Generator
+            Generator to draw blocks from (shared, not copied).
+        block_size : int, optional
+            Variates per block (default `DEFAULT_BLOCK_SIZE`).
+        """
+        if block_size < 1:
+            raise ValueError(f"block_size must be positive, not {block_size}")
+        self.rng = rng
+        self.block_size = int(block_size)
+        # Block key (Generator method, *args) -> drawn values, and the iterator serving them
+        self._blocks = {}
+        self._iterators = {}
+
+    def __getattr__(self, name):
+        # Only reached for attributes not defined here: forward to the wrapped Generator
+        if name == 'rng':
+            raise AttributeError(name)
+        return getattr(self.rng, name)
+
+    def _next(self, key):
+        """
+        Return the next value of block `key` = (Generator method, *args), drawing a new block when it runs out.
+        """
+        try:
+            return next(self._iterators[key])
+        except (KeyError, StopIteration):
+            method, *args = key
+            values = getattr(self.rng, method)(*args, size=self.block_size).tolist()
+            self._blocks[key] = values
+            iterator = self._iterators[key] = iter(values)
+            return next(iterator)
+
+    def random(self) -> float:
+        """
+        Return a uniform variate on [0, 1).
+        """
+        return self._next(('random',))
+
+    def normal(self, loc=0.0, scale=1.0) -> float:
+        """
+        Return a normal variate with mean `loc` and standard deviation `scale`.
+        """
+        return loc + scale * self._next(('standard_normal',))
+
+    def lognormal(self, mean=0.0, sigma=1.0) -> float:
+        """
+        Return a lognormal variate whose logarithm has mean `mean` and standard deviation `sigma`.
+        """
+        return math.exp(mean + sigma * self._next(('standard_normal',)))
+
+    def exponential(self, scale=1.0) -> float:
+        """
+        Return an exponential variate with mean `scale`.
+        """
+        return scale * self._next(('standard_exponential',))
+
+    def gamma(self, shape, scale=1.0) -> float:
+        """
+        Return a gamma variate with shape `shape` and scale `scale`.
+        """
+        return scale * self._next(('standard_gamma', shape))
+
+    def integers(self, low, high=None) -> int:
+        """
+        Return an integer from [low, high) (or [0, low) when `high` is None).
+        """
+        return self._next(('integers', low, high))
+
+    def poisson(self, lam=1.0) -> int:
+        """
+        Return a Poisson variate with mean `lam`.
+        """
+        return self._next(('poisson', lam))
+
+    def snapshot(self) -> dict:
+        """
+        Return the unserved part of every block (picklable).
+
+        Returns
+        -------
+        dict
+            Block key -> list of values not yet served.
+        """
+        remaining = {key: iterator.__length_hint__() for key, iterator in self._iterators.items()}
+        return {key: values[len(values) - remaining[key]:] for key, values in self._blocks.items()}
+
+    def restore(self, snapshot):
+        """
+        Replace the blocks with a `snapshot()` result.
+
+        Parameters
+        ----------
+        snapshot : dict
+        """
+        self._blocks = {key: list(values) for key, values in snapshot.items()}
+        self._iterators = {key: iter(values) for key, values in self._blocks.items()}
+
+    def reset(self):
+        """
+        Discard all buffered values (e.g. after reseeding the wrapped Generator).
+        """
+        self._blocks = {}
+        self._iterators = {}
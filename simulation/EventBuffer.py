@@ -0,0 +1,220 @@
+### EventBuffer Class Definition for Production Plant Simulation ###
+"""
+EventBuffer class for Production Plant Simulation.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+Typed, array-backed log for simulation events.
+
+Machines log one production, one quality and (on failures) one downtime event
+per processed step. Keeping each event as a dict of boxed Python values costs
+roughly a kilobyte per event, which dominates memory on long horizons.
+`EventBuffer` stores each field in its own preallocated NumPy array (grown by
+doubling) and encodes low-cardinality string fields such as `event_status` and
+`failure_type` as small integer codes, bringing the cost down to a few bytes
+per field.
+
+Notes / Conventions
+-------------------
+- The schema is an ordered mapping field name -> NumPy dtype; `append()` takes
+  values positionally in schema order.
+- Categorical fields are declared with their expected categories. Values not
+  seen before are added to that buffer's category list on the fly.
+- `to_frame()` wraps the filled part of each array without copying; the
+  result should be treated as read-only.
+- With an `EventSink` attached, the buffer never grows past the sink's
+  `chunk_size`: a full buffer is written to the sink and cleared, and
+  `flush()` writes whatever remains. `to_frame()` then only covers the rows
+  not yet flushed.
+- `snapshot()` / `restore()` copy the unflushed rows and category lists in
+  and out (used by simulation checkpoints), so a restored buffer produces the
+  same codes and chunk boundaries as the original.
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import numpy as np
+import pandas as pd
+
+####################################################################
+
+## EventBuffer Class Definition ##
+class EventBuffer(object):
+    """
+    Column-per-field event log with categorical encoding.
+
+    Attributes
+    ----------
+    schema : dict
+        Ordered mapping field name -> NumPy dtype.
+    categories : dict
+        Mapping categorical field name -> list of category labels.
+    sink : EventSink or None
+        Destination for full chunks (None keeps every event in memory).
+    table_name : str or None
+        Table name passed to the sink with each chunk.
+    """
+    ### Initialization Method ###
+    def __init__(self, schema, categories=None, capacity=1024, sink=None, table_name=None):
+        """
+        Initialize an empty buffer.
+
+        Parameters
+        ----------
+        schema : dict
+            Ordered mapping field name -> NumPy dtype. Categorical fields
+            may use any dtype here; they are stored as int16 codes.
+        categories : dict, optional
+            Mapping field name -> iterable of expected category labels.
+        capacity : int, optional
+            Number of rows preallocated per field (default 1024). Ignored when
+            a sink is given; the sink's `chunk_size` is used instead.
+        sink : EventSink, optional
+            Sink receiving a chunk every time the buffer fills up.
+        table_name : str, optional
+            Table name for the chunks (required with `sink`).
+        """
+        if sink is not None and table_name is None:
+            raise ValueError("EventBuffer with a sink requires a table_name")
+        self.sink = sink
+        self.table_name = table_name
+        self.schema = dict(schema)
+        self.categories = {name: list(labels) for name, labels in (categories or {}).items()}
+        self._codes = {name: {label: code for code, label in enumerate(labels)} for name, labels in self.categories.items()}
+
+        # Preallocated field arrays and fill level
+        self._capacity = sink.chunk_size if sink is not None else max(1, int(capacity))
+        self._size = 0
+        self._arrays = [
+            np.empty(self._capacity, dtype=np.int16 if name in self.categories else dtype)
+            for name, dtype in self.schema.items()
+        ]
+        # Per-field code maps in schema order (None for non-categorical fields)
+        self._encoders = [self._codes.get(name) for name in self.schema]
+
+    def __len__(self):
+        return self._size
+
+    ### Capacity Management Method ###
+    def _grow(self):
+        """
+        Double the capacity of every field array.
+        """
+        new_capacity = self._capacity * 2
+        for i, array in enumerate(self._arrays):
+            grown = np.empty(new_capacity, dtype=array.dtype)
+            grown[:self._size] = array[:self._size]
+            self._arrays[i] = grown
+        self._capacity = new_capacity
+
+    def _encode(self, position, label):
+        """
+        Return the integer code for a categorical label, registering new labels.
+        """
+        encoder = self._encoders[position]
+        code = encoder.get(label)
+        if code is None:
+            name = list(self.schema)[position]
+            code = len(self.categories[name])
+            self.categories[name].append(label)
+            encoder[label] = code
+        return code
+
+    ### Append Method ###
+    def append(self, *values):
+        """
+        Append one event.
+
+        Parameters
+        ----------
+        *values
+            One value per schema field, in schema order.
+        """
+        if self._size == self._capacity:
+            if self.sink is not None:
+                self.flush()
+            else:
+                self._grow()
+        row = self._size
+        for position, value in enumerate(values):
+            if self._encoders[position] is not None:
+                value = self._encode(position, value)
+            self._arrays[position][row] = value
+        self._size = row + 1
+
+    ### Reset Method ###
+    def clear(self):
+        """
+        Drop all logged rows while keeping the allocated arrays.
+        """
+        self._size = 0
+
+    ### Flush Method ###
+    def flush(self):
+        """
+        Write the buffered rows to the sink and clear the buffer.
+
+        Does nothing when no sink is attached.
+        """
+        if self.sink is None or self._size == 0:
+            return
+        self.sink.write(self.table_name, self.to_frame())
+        self.clear()
+
+    ### Checkpoint Methods ###
+    def snapshot(self):
+        """
+        Return a copy of the unflushed rows and category lists.
+
+        Returns
+        -------
+        dict
+            'arrays' (one array per field, filled part only) and 'categories'.
+        """
+        return {
+            'arrays': [array[:self._size].copy() for array in self._arrays],
+            'categories': {name: list(labels) for name, labels in self.categories.items()},
+        }
+
+    def restore(self, snapshot):
+        """
+        Replace the buffer contents with a `snapshot()`.
+
+        Parameters
+        ----------
+        snapshot : dict
+            Result of `snapshot()` taken from a buffer with the same schema.
+        """
+        rows = len(snapshot['arrays'][0]) if snapshot['arrays'] else 0
+        while self._capacity < rows:
+            self._grow()
+        for array, saved in zip(self._arrays, snapshot['arrays']):
+            array[:rows] = saved
+        self._size = rows
+        self.categories = {name: list(labels) for name, labels in snapshot['categories'].items()}
+        self._codes = {name: {label: code for code, label in enumerate(labels)} for name, labels in self.categories.items()}
+        self._encoders = [self._codes.get(name) for name in self.schema]
+
+    ### DataFrame View Method ###
+    def to_frame(self):
+        """
+        Return the logged events as a DataFrame without copying field arrays.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One column per schema field; categorical fields use pandas
+            `category` dtype.
+        """
+        columns = {}
+        for (name, _), array in zip(self.schema.items(), self._arrays):
+            column = array[:self._size]
+            if name in self.categories:
+                column = pd.Categorical.from_codes(column, categories=self.categories[name])
+            columns[name] = column
+        return pd.DataFrame(columns, copy=False)
@@ -0,0 +1,351 @@
+### EventSink Class Definitions for Production Plant Simulation ###
+"""
+Event sink classes for Production Plant Simulation.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+Destinations for chunks of logged simulation events.
+
+By default every event stays in memory (in each Machine's `EventBuffer`)
+until `Plant.collect_results` runs, so peak memory grows with the horizon and
+an interrupted run loses all events. When a sink is attached, each
+`EventBuffer` hands its rows to the sink every `chunk_size` events and starts
+over, which bounds the memory held per buffer.
+
+Classes
+-------
+- `EventSink`: abstract interface. Subclasses implement `write()` and `read()`.
+- `ChunkedFileSink`: writes each chunk as a Parquet file under
+  `<directory>/<table_name>/part-<n>.parquet`.
+- `ChunkedTable`: read-only view of one table's part files. It is what
+  `read()` returns and what `Plant.collect_results` hands to the exporters
+  and loaders, which process it one part at a time (`table_frames`), so
+  memory stays bounded by the chunk size after the run as well.
+
+Notes / Conventions
+-------------------
+- Chunk files are written to a temporary name and renamed into place, so a
+  crash never leaves a half-written part behind; all completed parts can be
+  read back with `ChunkedFileSink(directory, keep_parts=True).read(table_name)`.
+- A sink opened without `keep_parts` deletes the part files already in its
+  directory, so a new run reusing a folder never reads back events of an
+  earlier run. Resumed runs keep them and `truncate()` the parts written
+  after their checkpoint.
+- Parts keep the buffer dtypes (categoricals are stored dictionary-encoded),
+  so they can be exported or loaded as they are.
+- A `ChunkedTable` lists rows in part (write) order, not sorted by time.
+- `part_count()` / `truncate()` let a resumed run drop parts written after
+  the checkpoint it resumes from (see `checkpoint`).
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import os
+import shutil
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import pandas as pd
+import pyarrow
+import pyarrow.parquet
+
+####################################################################
+
+# Parquet codec of the chunk files
+PART_COMPRESSION = 'zstd'
+
+####################################################################
+
+def table_frames(table):
+    """
+    Yield the rows of a result table as DataFrames.
+
+    Parameters
+    ----------
+    table : pandas.DataFrame or ChunkedTable
+
+    Yields
+    ------
+    pandas.DataFrame
+        The DataFrame itself, or each part of a `ChunkedTable` in turn.
+    """
+    if isinstance(table, ChunkedTable):
+        yield from table.iter_frames()
+    else:
+        yield table
+
+## ChunkedTable Class Definition ##
+class ChunkedTable(object):
+    """
+    Read-only view of an event table stored as Parquet part files.
+
+    Parts are read one at a time; the `warmup` flag and `scenario_id` columns
+    that `Plant.collect_results` adds to every fact table are appended to
+    each part as it is read.
+
+    Attributes
+    ----------
+    paths : list of pathlib.Path
+        Part files in part order.
+    warmup_column : str or None
+        Time column compared against `warmup_end` for the `warmup` flag
+        (None adds neither `warmup` nor `scenario_id`).
+    warmup_end : float
+        Rows with `warmup_column` before this time are flagged as warm-up.
+    scenario_id : str or None
+        Value of the added `scenario_id` column.
+    """
+    ### Initialization Method ###
+    def __init__(self, paths, warmup_column=None, warmup_end=0.0, scenario_id=None):
+        """
+        Parameters
+        ----------
+        paths : iterable of str or pathlib.Path
+            Part files in part order.
+        warmup_column : str, optional
+        warmup_end : float, optional
+        scenario_id : str, optional
+        """
+        self.paths = [Path(path) for path in paths]
+        self.warmup_column = warmup_column
+        self.warmup_end = warmup_end
+        self.scenario_id = scenario_id
+        # Row count from the Parquet footers, read on first use
+        self._rows = None
+
+    def __len__(self):
+        if self._rows is None:
+            self._rows = sum(pyarrow.parquet.read_metadata(path).num_rows for path in self.paths)
+        return self._rows
+
+    def annotate(self, warmup_column, warmup_end, scenario_id):
+        """
+        Return a view over the same parts with the `warmup` and `scenario_id` columns added.
+
+        Parameters
+        ----------
+        warmup_column : str
+        warmup_end : float
+        scenario_id : str
+
+        Returns
+        -------
+        ChunkedTable
+        """
+        return ChunkedTable(self.paths, warmup_column, warmup_end, scenario_id)
+
+    def read_part(self, part):
+        """
+        Read one part as a DataFrame.
+
+        Parameters
+        ----------
+        part : int
+            Index into `paths`.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        frame = pd.read_parquet(self.paths[part])
+        if self.warmup_column is not None:
+            frame['warmup'] = frame[self.warmup_column] < self.warmup_end
+            frame['scenario_id'] = self.scenario_id
+        return frame
+
+    def iter_frames(self):
+        """
+        Yield every part as a DataFrame, in part order.
+        """
+        for part in range(len(self.paths)):
+            yield self.read_part(part)
+
+    def head(self, n=5):
+        """
+        Return the first `n` rows of the first part.
+        """
+        return self.read_part(0).head(n)
+
+    @property
+    def columns(self):
+        return self.head(0).columns
+
+    @property
+    def dtypes(self):
+        return self.head(0).dtypes
+
+    def to_frame(self):
+        """
+        Concatenate every part into one DataFrame (holds the whole table in memory).
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        return pd.concat(list(self.iter_frames()), ignore_index=True)
+
+## EventSink Class Definition ##
+class EventSink(ABC):
+    """
+    Abstract interface for receiving chunks of logged events.
+
+    Attributes
+    ----------
+    chunk_size : int
+        Number of events an `EventBuffer` accumulates before writing a chunk.
+    """
+    ### Initialization Method ###
+    def __init__(self, chunk_size=50_000):
+        """
+        Parameters
+        ----------
+        chunk_size : int, optional
+            Rows per chunk (default 50,000).
+        """
+        if int(chunk_size) <= 0:
+            raise ValueError(f"chunk_size must be positive, not {chunk_size}")
+        self.chunk_size = int(chunk_size)
+
+    @abstractmethod
+    def write(self, table_name, frame):
+        """
+        Persist one chunk of events for `table_name`.
+
+        Parameters
+        ----------
+        table_name : str
+            Logical table name (e.g. "fact_production_event").
+        frame : pandas.DataFrame
+            Events in the chunk. The frame may be a view over reusable
+            buffers, so implementations must not keep a reference to it.
+        """
+
+    @abstractmethod
+    def read(self, table_name):
+        """
+        Return a view of every chunk written for `table_name`.
+
+        Parameters
+        ----------
+        table_name : str
+
+        Returns
+        -------
+        ChunkedTable
+            View over the chunks in write order (no parts if none was written).
+        """
+
+    def close(self):
+        """
+        Release any resources held by the sink (no-op by default).
+        """
+        pass
+
+## ChunkedFileSink Class Definition ##
+class ChunkedFileSink(EventSink):
+    """
+    Sink that writes each chunk to a Parquet file.
+
+    Attributes
+    ----------
+    directory : pathlib.Path
+        Root folder; each table gets its own subfolder of part files.
+    """
+    ### Initialization Method ###
+    def __init__(self, directory, chunk_size=50_000, keep_parts=False):
+        """
+        Parameters
+        ----------
+        directory : str or pathlib.Path
+            Root folder for chunk files (created if missing).
+        chunk_size : int, optional
+            Rows per chunk (default 50,000).
+        keep_parts : bool, optional
+            Keep the part files already in `directory` (resuming a run from a
+            checkpoint, or reading back a finished run). Default False deletes
+            them so a new run starts from an empty folder.
+        """
+        super().__init__(chunk_size)
+        self.directory = Path(directory)
+        if not keep_parts and self.directory.exists():
+            # Table folders of an earlier run in the same folder
+            for table_dir in self.directory.iterdir():
+                if table_dir.is_dir() and any(table_dir.glob('part-*.parquet*')):
+                    shutil.rmtree(table_dir)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Next part number per table (continues after existing parts)
+        self._part_counters = {}
+
+    def _table_dir(self, table_name):
+        return self.directory / table_name
+
+    def _next_part(self, table_name):
+        part = self.part_count(table_name)
+        self._part_counters[table_name] = part + 1
+        return part
+
+    ### Write Method ###
+    def write(self, table_name, frame):
+        """
+        Write one chunk as `<directory>/<table_name>/part-<n>.parquet`.
+
+        Parameters
+        ----------
+        table_name : str
+        frame : pandas.DataFrame
+        """
+        if len(frame) == 0:
+            return
+
+        # Write to a temporary file and move it into place atomically
+        table_dir = self._table_dir(table_name)
+        table_dir.mkdir(parents=True, exist_ok=True)
+        part_path = table_dir / f"part-{self._next_part(table_name):05d}.parquet"
+        tmp_path = part_path.with_name(part_path.name + '.tmp')
+        arrow_table = pyarrow.Table.from_pandas(frame, preserve_index=False)
+        pyarrow.parquet.write_table(arrow_table, tmp_path, compression=PART_COMPRESSION)
+        os.replace(tmp_path, part_path)
+
+    ### Checkpoint Methods ###
+    def part_count(self, table_name):
+        """
+        Return the number of parts written so far for `table_name`.
+        """
+        if table_name not in self._part_counters:
+            self._part_counters[table_name] = len(list(self._table_dir(table_name).glob('part-*.parquet')))
+        return self._part_counters[table_name]
+
+    def truncate(self, table_name, parts):
+        """
+        Delete every part of `table_name` after the first `parts`.
+
+        Parameters
+        ----------
+        table_name : str
+        parts : int
+            Number of leading parts to keep.
+        """
+        for part_path in sorted(self._table_dir(table_name).glob('part-*.parquet'))[parts:]:
+            part_path.unlink()
+        self._part_counters[table_name] = parts
+
+    ### Read Method ###
+    def read(self, table_name):
+        """
+        Return a view of all completed chunks for `table_name`, in part order.
+
+        Parameters
+        ----------
+        table_name : str
+
+        Returns
+        -------
+        ChunkedTable
+            View with no parts if no chunk has been written.
+        """
+        return ChunkedTable(sorted(self._table_dir(table_name).glob('part-*.parquet')))
@@ -21,6 +21,18 @@ Notes / Conventions
     by the simulation environment (the project uses seconds elsewhere).
 - Several RNGs are injected via `rngs` to keep sampling deterministic when a
     seed is provided by the caller.
+- In common-random-numbers mode the Plant also passes per-machine substreams
+    (`entity_rngs`: failure timing, failure type, repair) and per-work-order
+    substreams (`process_order(..., rngs=...)`: cycle noise, quality), so the
+    draws of a machine or work order do not depend on the rest of the plant.
+- Failures run either on calendar time (`start_failure_process`: a
+    background process per machine that wakes at every sampled failure,
+    busy or idle) or on operating time (`time_to_failure` set: the time to
+    failure only runs down while a step is processing and the failure is
+    raised inside `process_order`, so idle machines schedule no events).
+- A step that no failure can reach (`failure_free`) is run by the work order
+    process itself with `begin_step` / `hold_step` / `finish_step`: one
+    timeout and no nested `process_order` process.
 - Methods that use `env` assume they are run inside a SimPy process (i.e.,
     they may `yield env.timeout(...)` or rely on `env.now`).
 """
@@ -33,6 +45,7 @@ import helper_functions as hf
 import numpy as np
 import simpy
 from itertools import count
+from EventBuffer import EventBuffer
 
 # Local RNG for non-seeded randomness
 local_rng = np.random.default_rng()
@@ -44,11 +57,57 @@ _batch_id_counter = count(start=1)
 _downtime_id_counter = count(start=1)
 _quality_id_counter = count(start=1)
 
+# Failure modes sampled by `cause_failure` (also the categories of `failure_type`)
+FAILURE_TYPES = ["Bearing Seizure", "Drive Belt Snapped", "Hydraulic Fluid Leak", "Pneumatic Pressure Loss", "Motor Overheating", "Electrical Short Circuit", "Sensor Misalignment", "PLC Logic Error", "Lubrication Starvation", "Vacuum Pump Cavitation", "Chamber Contamination", "MFC Drift", "Wafer Handling Robot Jam", "ESD Event", "RF Generator Arc-over", "Ion Source Depletion", "Mask Misalignment", "CDS Clog", "Turbo Pump Vibration", "Calibration Drift"]
+# Production event outcomes (categories of `event_status`)
+EVENT_STATUSES = ["completed", "interrupted", "failed"]
+
+# Field layouts of the per-machine event logs (field name -> dtype, in logging order).
+# Dimension keys are drawn below 1e9 and fit in int32; step numbers fit in int16.
+PRODUCTION_EVENT_SCHEMA = {
+    'event_id': np.int64,
+    'work_order_id': object,
+    'machine_id': np.int32,
+    'process_id': np.int32,
+    'process_route_id': np.int32,
+    'step_number': np.int16,
+    'batch_id': np.int64,
+    'process_start': np.float64,
+    'process_end': np.float64,
+    'ideal_cycle_time': np.int32,
+    'actual_cycle_time': np.float64,
+    'event_status': object,
+}
+DOWNTIME_EVENT_SCHEMA = {
+    'downtime_id': np.int64,
+    'work_order_id': object,
+    'process_id': np.int32,
+    'process_route_id': np.int32,
+    'machine_id': np.int32,
+    'failure_type': object,
+    'usage_duration': np.float64,
+    'failure_start': np.float64,
+    'failure_end': np.float64,
+}
+QUALITY_EVENT_SCHEMA = {
+    'quality_id': np.int64,
+    'work_order_id': object,
+    'machine_id': np.int32,
+    'process_id': np.int32,
+    'process_route_id': np.int32,
+    'step_number': np.int16,
+    'batch_id': np.int64,
+    'initial_quantity': np.int32,
+    'units_approved': np.int32,
+    'units_scrapped': np.int32,
+    'event_time': np.float64,
+}
+
 ####################################################################
 
 ## Machine Class Definition ##
 class Machine(object):
-    def __init__(self, env, dim_machine_row, work_order, rngs):
+    def __init__(self, env, dim_machine_row, work_order, rngs, event_sink=None, entity_rngs=None):
         """
         Initialize a Machine instance.
 
@@ -64,6 +123,13 @@ class Machine(object):
         rngs : dict
             Dictionary containing RNGs used by the machine. Expected keys:
             - 'processing', 'failure', 'quality'
+        event_sink : EventSink, optional
+            Sink receiving the event logs in fixed-size chunks during the run
+            (None keeps every event in memory until the run ends).
+        entity_rngs : dict, optional
+            Per-machine substreams keyed 'failure', 'failure_type' and 'repair'
+            (common-random-numbers mode, see `Plant.entity_rng`). Default None
+            draws from the module-level generators and `rngs['failure']`.
         """
         # Simulation environment reference
         self.env = env
@@ -77,10 +143,15 @@ class Machine(object):
         # Dynamic state
         self.is_operational = True            # whether the machine can operate (not failed)
         self.current_work_order = work_order  # id of work order currently assigned
-        self.production_log = []              # list of production event dicts
-        self.downtime_log = []                # list of downtime event dicts
-        self.quality_log = []                 # list of quality check event dicts
+        self.production_log = EventBuffer(PRODUCTION_EVENT_SCHEMA, {'event_status': EVENT_STATUSES}, sink=event_sink, table_name='fact_production_event')  # columnar production events
+        self.downtime_log = EventBuffer(DOWNTIME_EVENT_SCHEMA, {'failure_type': FAILURE_TYPES}, sink=event_sink, table_name='fact_downtime_event')  # columnar downtime events
+        self.quality_log = EventBuffer(QUALITY_EVENT_SCHEMA, sink=event_sink, table_name='fact_quality_event')                                              # columnar quality check events
         self.current_process = None           # reference to the active SimPy process, if any
+        self.step_state = None                # explicit state of the step in progress (see `process_order`)
+        self.failure_process = None           # background failure process (see `start_failure_process`)
+        self.time_to_failure = None           # failure config when failures run on operating time (see `process_order`)
+        self.operating_ttf = None             # operating time left until the next failure (operating-time failures)
+        self.next_failure_time = None         # time of the pending failure (calendar-time failures)
         self.start_quantity = 0               # units at process start
         self.end_quantity = 0                 # units after processing
         self.is_busy = False                  # convenience flag for local scheduling
@@ -90,7 +161,14 @@ class Machine(object):
         self.failure_rng = rngs['failure']
         self.quality_rng = rngs['quality']
 
-    def vary_cycle_time(self, process_noise):
+        # Per-machine substreams (common random numbers) or the shared fallbacks
+        self.entity_rngs = entity_rngs or {}
+        self.ttf_rng = self.entity_rngs.get('failure', local_rng)
+        self.failure_type_rng = self.entity_rngs.get('failure_type', self.failure_rng)
+        self.repair_rng = self.entity_rngs.get('repair', hf.local_rng)
+        self.noise_rng = local_rng            # cycle noise when the work order has no substream
+
+    def vary_cycle_time(self, process_noise, rng=None):
         """
         Compute an actual cycle time from nominal `ideal_cycle_time` with noise.
 
@@ -99,6 +177,8 @@ class Machine(object):
         process_noise : dict
             Noise configuration with keys:
             - 'mean_val', 'var_val', 'min_val', 'max_val'
+        rng : numpy.random.Generator, optional
+            Generator for the noise draw (default: `self.noise_rng`, the module-level `local_rng`).
 
         Returns
         -------
@@ -115,7 +195,9 @@ class Machine(object):
         max_val = process_noise['max_val']
 
         # Sample noise and compute actual cycle time
-        noise = np.clip(local_rng.normal(mean_val, var_val), min_val, max_val)
+        rng = self.noise_rng if rng is None else rng
+        # (min/max rather than np.clip: same result without NumPy's scalar overhead on this per-step path)
+        noise = min(max(rng.normal(mean_val, var_val), min_val), max_val)
         actual_cycle_time = nominal * noise
         # Return rounded actual cycle time
         return round(actual_cycle_time, 0)
@@ -132,9 +214,8 @@ class Machine(object):
         """
         Log a production event for the current work order.
 
-        The method generates unique `event_id` and `batch_id` values using the
-        machine's processing RNG and appends an event dictionary to
-        `self.production_log`.
+        The method generates unique `event_id` and `batch_id` values from the
+        module-level counters and appends an event row to `self.production_log`.
 
         Parameters
         ----------
@@ -162,22 +243,21 @@ class Machine(object):
         event_id = next(_event_id_counter)
         batch_id = next(_batch_id_counter)
 
-        # Append production event record
-        self.production_log.append({
-            'event_id': event_id,
-            'work_order_id': self.current_work_order,
-            'machine_id': self.machine_id,
-            'process_id': process_id,
-            'process_route_id': process_route_id,
-            'step_number': step_number,
-            'batch_id': batch_id,
-            'process_start': process_start,
-            'process_end': process_end,
-            'ideal_cycle_time': self.ideal_cycle_time,
-            'actual_cycle_time': actual_cycle_time,
-            'event_status': event_status
-                
-        })  
+        # Append production event record (fields in PRODUCTION_EVENT_SCHEMA order)
+        self.production_log.append(
+            event_id,
+            self.current_work_order,
+            self.machine_id,
+            process_id,
+            process_route_id,
+            step_number,
+            batch_id,
+            process_start,
+            process_end,
+            self.ideal_cycle_time,
+            actual_cycle_time,
+            event_status
+        )
         return batch_id
 
 
@@ -208,18 +288,18 @@ class Machine(object):
        # Collect existing downtime ids to avoid collisions
         downtime_id = next(_downtime_id_counter)
 
-        # Append downtime record
-        self.downtime_log.append({
-            'downtime_id': downtime_id,
-            'work_order_id': self.current_work_order,
-            'process_id': process_id,
-            'process_route_id': process_route_id,
-            'machine_id': self.machine_id,
-            'failure_type': failure_type,
-            'usage_duration': usage_duration,
-            'failure_start': failure_start,
-            'failure_end': failure_end
-        })
+        # Append downtime record (fields in DOWNTIME_EVENT_SCHEMA order)
+        self.downtime_log.append(
+            downtime_id,
+            self.current_work_order,
+            process_id,
+            process_route_id,
+            self.machine_id,
+            failure_type,
+            usage_duration,
+            failure_start,
+            failure_end
+        )
 
     def log_quality_event(self, env,
                           process_id,
@@ -249,72 +329,63 @@ class Machine(object):
         # Collect existing quality ids to avoid collisions
         quality_id = next(_quality_id_counter)
 
-        # Append quality event record
-        self.quality_log.append({
-            'quality_id': quality_id,
-            'work_order_id': self.current_work_order,
-            'machine_id': self.machine_id,
-            'process_id': process_id,
-            'process_route_id': process_route_id,
-            'step_number': step_number,
-            'batch_id': batch_id,
-            'initial_quantity': initial_quantity,
-            'units_approved': good_units,
-            'units_scrapped': scrap_units,
-            'event_time': env.now
-        })
+        # Append quality event record (fields in QUALITY_EVENT_SCHEMA order)
+        self.quality_log.append(
+            quality_id,
+            self.current_work_order,
+            self.machine_id,
+            process_id,
+            process_route_id,
+            step_number,
+            batch_id,
+            initial_quantity,
+            good_units,
+            scrap_units,
+            env.now
+        )
     
-    def start_failure_process(self, time_to_failure):
+    def draw_time_to_failure(self, time_to_failure) -> float:
         """
-        Launch the background failure generator process for this machine.
+        Sample the time until the next failure.
 
         Parameters
         ----------
         time_to_failure : dict
-            Configuration used by `cause_failure`.
-        """
+            Expected keys:
+            - 'low_range', 'high_range' : range bounds used to draw mean time-to-failure.
 
-        # Start the failure process
-        self.env.process(self.cause_failure(time_to_failure))
-        
-    def process_order(self, env, work_order_id, step_number, num_steps, process_id, process_route_id, target_yield, current_quantity, process_noise, repair_behavior, quality):
+        Returns
+        -------
+        float
+            Exponential time to failure around a mean drawn from the range.
         """
-        SimPy process to execute a work order step on this machine.
+        mean_ttf = self.ttf_rng.integers(low=time_to_failure['low_range'], high=time_to_failure['high_range'])
+        return self.ttf_rng.exponential(mean_ttf)
 
-        This method is intended to be used as a process body (i.e., called by
-        `env.process(machine.process_order(...))` or yielded by another process).
-        It handles:
-         - checking & setting busy state
-         - applying variable cycle time
-         - yielding to env.timeout and catching simpy.Interrupt for failures
-         - applying repair delays and logging downtime
-         - computing quality outcome and logging production/quality events
+    def begin_step(self, work_order_id, current_quantity, process_noise, rngs=None) -> float:
+        """
+        Mark the machine busy with a work order step and draw its cycle time.
 
         Parameters
         ----------
-        env : simpy.Environment
         work_order_id : int|str
-        step_number : int
-        num_steps : int
-            Total number of steps in the route (used to distribute target yield).
-        process_id, process_route_id : identifiers for logging
-        target_yield : float
-            Overall target yield for the work order (0..1).
         current_quantity : int
             Units entering this step.
         process_noise : dict
             Passed to `vary_cycle_time`.
-        repair_behavior : dict
-            Passed to `hf.vary_repair_time` when interrupted.
-        quality : dict
-            Configuration values such as 'interrupt_penalty' and 'min_yield'.
+        rngs : dict, optional
+            Work order substreams (see `process_order`).
+
+        Returns
+        -------
+        float
+            Actual cycle time of the step.
 
         Raises
         ------
         AssertionError
-            If the machine is already processing or if timestamps/quantities are invalid.
-        """    
-
+            If the machine is already processing or the cycle time is not positive.
+        """
         # Ensure machine is not already busy
         assert self.current_process is None, (
             f"Machine {self.machine_id} started a new process while still busy"
@@ -329,86 +400,113 @@ class Machine(object):
         self.start_quantity = current_quantity
 
         # Determine actual cycle time with noise
-        actual_cycle_time = self.vary_cycle_time(process_noise)
+        actual_cycle_time = self.vary_cycle_time(process_noise, (rngs or {}).get('processing'))
 
         # Validate actual cycle time
         assert actual_cycle_time > 0, (
             f"Non-positive cycle time on machine {self.machine_id}: {actual_cycle_time}"
         )
-        
-        # Reference to the active process for interruption handling
+        return actual_cycle_time
+
+    def failure_free(self, cycle_time) -> bool:
+        """
+        Check whether a step of `cycle_time` starting now ends before the machine's next failure.
+
+        With operating-time failures the time to failure is drawn here if none
+        is pending (the draw `process_order` would make); with calendar-time
+        failures the pending failure must fall strictly after the step ends.
+
+        Parameters
+        ----------
+        cycle_time : float
+
+        Returns
+        -------
+        bool
+        """
+        if self.time_to_failure is not None:
+            if self.operating_ttf is None:
+                self.operating_ttf = self.draw_time_to_failure(self.time_to_failure)
+            return self.operating_ttf >= cycle_time
+        return self.next_failure_time is None or self.next_failure_time > self.env.now + cycle_time
+
+    def hold_step(self, env, work_order_id, step_number, num_steps, process_id, process_route_id, target_yield, actual_cycle_time):
+        """
+        Run a failure-free step (see `failure_free`) in the calling process.
+
+        The caller yields the returned timeout and then calls `finish_step`.
+        The step is recorded in `step_state` like a `process_order` segment,
+        with 'fast' set so checkpoints resume it the same way.
+
+        Parameters
+        ----------
+        env : simpy.Environment
+        work_order_id, step_number, num_steps, process_id, process_route_id, target_yield
+            As for `process_order`.
+        actual_cycle_time : float
+            Cycle time returned by `begin_step`.
+
+        Returns
+        -------
+        simpy.events.Timeout
+            Timeout ending the step.
+        """
+        if self.time_to_failure is not None:
+            # The whole step is processing time, rounded as `process_order` measures it (end - start)
+            self.operating_ttf -= (env.now + actual_cycle_time) - env.now
         self.current_process = env.active_process
+        self.step_state = {
+            'work_order_id': work_order_id,
+            'step_number': step_number,
+            'num_steps': num_steps,
+            'process_id': process_id,
+            'process_route_id': process_route_id,
+            'target_yield': target_yield,
+            'actual_cycle_time': actual_cycle_time,
+            'process_start': env.now,
+            'phase': 'segment',
+            'remaining_time': actual_cycle_time,
+            'counter': 0,
+            'loop_guard': 0,
+            'segment_start': env.now,
+            'segment_fails': False,
+            'fast': True,
+        }
+        return env.timeout(actual_cycle_time)
+
+    def finish_step(self, env, quality, counter=0, rngs=None):
+        """
+        Complete the step in `step_state`: free the machine, draw the good units
+        and log the production and quality events.
 
-        # Process the work order step, handling interruptions for failures
-        remaining_time = actual_cycle_time
-        counter = 0
-        loop_guard = 0
-        process_start = env.now
-        process_end = None
-        batch_id = 0
+        Parameters
+        ----------
+        env : simpy.Environment
+        quality : dict
+            Configuration values such as 'interrupt_penalty' and 'min_yield'.
+        counter : int, optional
+            Failures during the step (-1 if it was abandoned by the loop guard).
+        rngs : dict, optional
+            Work order substreams (see `process_order`).
 
-        # Main processing loop with interruption handling
-        while remaining_time > 0:
-            # Validate remaining time has not increased
-            assert remaining_time <= actual_cycle_time, (
-                f"Remaining time increased unexpectedly on machine {self.machine_id}"
-            )
-            # Infinite loop guard
-            loop_guard +=1
-            # Break if loop guard exceeds threshold of 1000 iterations
-            if loop_guard > 1000:
-                # Log error and break to avoid infinite loop
-                print(
-                        f"[ERROR] Infinite loop detected\n"
-                        f"Machine: {self.machine_id}\n"
-                        f"WO: {self.current_work_order}\n"
-                        f"Remaining: {remaining_time}\n"
-                        f"Now: {env.now}\n"
-                        f"Operational: {self.is_operational}"
-                    )
-                counter = -1
-                break
-            # Attempt to process the remaining time segment
-            try:
-                # Record segment start time
-                segment_start = env.now
-                # Yield timeout for remaining processing time
-                yield env.timeout(remaining_time)
-                # If completed without interruption, set remaining time to zero
-                remaining_time = 0
-            # Handle interruptions due to failures
-            except simpy.Interrupt as downtime:
-                # Mark machine as non-operational during failure
-                self.is_operational = False
-                counter += 1
-                # Record failure start time and type
-                failure_start = env.now
-                failure_type = downtime.cause
-                # Compute elapsed processing time before interruption
-                elapsed = env.now - segment_start
-                if elapsed <= 0:
-                    elapsed = min(1e-6, remaining_time)
-                # Update remaining time
-                remaining_time -= elapsed
-                if remaining_time < 0:
-                    remaining_time = 0
-                # Simulate repair time
-                repair_time = hf.vary_repair_time(repair_behavior)
-                yield env.timeout(repair_time) 
-                failure_end = env.now
-                # Log the downtime event
-                self.log_downtime_event(process_id, process_route_id, failure_type, elapsed, failure_start, failure_end)
-                # Mark machine as operational again
-                self.is_operational = True
-        # End of processing loop
+        Raises
+        ------
+        AssertionError
+            If quantities or timestamps are invalid.
+        """
+        step = self.step_state
+        work_order_id = step['work_order_id']
+        step_number = step['step_number']
+        process_start = step['process_start']
         process_end = env.now
         self.current_process = None
+        self.step_state = None
         self.is_busy = False
         # Compute quality outcome
         interrupt_penalty = counter * quality["interrupt_penalty"]
-        distributed_target = target_yield ** (1 / num_steps)
+        distributed_target = step['target_yield'] ** (1 / step['num_steps'])
         step_yield = max(quality["min_yield"], distributed_target - interrupt_penalty)
-        good_units = self.quality_rng.binomial(self.start_quantity, step_yield)
+        good_units = (rngs or {}).get('quality', self.quality_rng).binomial(self.start_quantity, step_yield)
         
         # Compute scrap units and finalize quantities
         good_units = int(round(good_units, 0))
@@ -426,14 +524,208 @@ class Machine(object):
         )
         
         # Log production and quality events
-        batch_id = self.log_production_event(process_id, process_route_id, step_number, process_start, process_end, actual_cycle_time, event_status="interrupted" if counter > 0 else("failed" if counter < 0 else "completed"))
-        self.log_quality_event(env, process_id, process_route_id, step_number, batch_id, self.start_quantity, good_units, scrap_units)
+        batch_id = self.log_production_event(step['process_id'], step['process_route_id'], step_number, process_start, process_end, step['actual_cycle_time'], event_status="interrupted" if counter > 0 else("failed" if counter < 0 else "completed"))
+        self.log_quality_event(env, step['process_id'], step['process_route_id'], step_number, batch_id, self.start_quantity, good_units, scrap_units)
 
         # Final log message and clear current work order context
         print(f'Work order processing ended for WO: {work_order_id} on Machine: {self.machine_id}')
         self.current_work_order = None
 
-    def cause_failure(self, time_to_failure):
+    def start_failure_process(self, time_to_failure, pending_failure=None):
+        """
+        Launch the background failure generator process for this machine.
+
+        Parameters
+        ----------
+        time_to_failure : dict
+            Configuration used by `cause_failure`.
+        pending_failure : simpy.events.Event, optional
+            Failure already scheduled before a checkpoint (see `cause_failure`).
+        """
+
+        # Start the failure process
+        self.failure_process = self.env.process(self.cause_failure(time_to_failure, pending_failure))
+        
+    def process_order(self, env, work_order_id, step_number, num_steps, process_id, process_route_id, target_yield, current_quantity, process_noise, repair_behavior, quality, resume=None, rngs=None, actual_cycle_time=None):
+        """
+        SimPy process to execute a work order step on this machine.
+
+        This method is intended to be used as a process body (i.e., called by
+        `env.process(machine.process_order(...))` or yielded by another process).
+        It handles:
+         - checking & setting busy state
+         - applying variable cycle time
+         - yielding to env.timeout and catching simpy.Interrupt for failures
+           (or, with operating-time failures, ending the segment at the
+           failure when the machine's time to failure runs out first)
+         - applying repair delays and logging downtime
+         - computing quality outcome and logging production/quality events
+
+        Parameters
+        ----------
+        env : simpy.Environment
+        work_order_id : int|str
+        step_number : int
+        num_steps : int
+            Total number of steps in the route (used to distribute target yield).
+        process_id, process_route_id : identifiers for logging
+        target_yield : float
+            Overall target yield for the work order (0..1).
+        current_quantity : int
+            Units entering this step.
+        process_noise : dict
+            Passed to `vary_cycle_time`.
+        repair_behavior : dict
+            Passed to `hf.vary_repair_time` when interrupted.
+        quality : dict
+            Configuration values such as 'interrupt_penalty' and 'min_yield'.
+        resume : dict, optional
+            `step_state` of a step restored from a checkpoint (see `checkpoint`),
+            with 'event' set to its restored pending timeout. The step continues
+            from that processing segment or repair instead of starting over.
+        rngs : dict, optional
+            Substreams of the work order keyed 'processing' (cycle noise) and
+            'quality' (good units) in common-random-numbers mode. Default None
+            uses the module-level `local_rng` and `self.quality_rng`.
+        actual_cycle_time : float, optional
+            Cycle time of a step already started with `begin_step` (e.g. by a
+            caller that checked `failure_free`). Default None starts the step here.
+
+        Raises
+        ------
+        AssertionError
+            If the machine is already processing or if timestamps/quantities are invalid.
+        """    
+
+        if resume is None:
+            if actual_cycle_time is None:
+                actual_cycle_time = self.begin_step(work_order_id, current_quantity, process_noise, rngs)
+
+            # Process the work order step, handling interruptions for failures
+            remaining_time = actual_cycle_time
+            counter = 0
+            loop_guard = 0
+            process_start = env.now
+            phase = None
+            pending = None
+        else:
+            # Continue a step restored from a checkpoint at its pending segment or repair
+            actual_cycle_time = resume['actual_cycle_time']
+            remaining_time = resume['remaining_time']
+            counter = resume['counter']
+            loop_guard = resume['loop_guard']
+            process_start = resume['process_start']
+            segment_start = resume['segment_start']
+            failure_start = resume.get('failure_start')
+            failure_type = resume.get('failure_type')
+            elapsed = resume.get('elapsed')
+            segment_fails = resume.get('segment_fails', False)
+            phase = resume['phase']
+            pending = resume['event']
+
+        # Reference to the active process for interruption handling
+        self.current_process = env.active_process
+
+        # Explicit step state at each suspension point (read by checkpoints)
+        self.step_state = step_state = {
+            'work_order_id': work_order_id,
+            'step_number': step_number,
+            'num_steps': num_steps,
+            'process_id': process_id,
+            'process_route_id': process_route_id,
+            'target_yield': target_yield,
+            'actual_cycle_time': actual_cycle_time,
+            'process_start': process_start,
+        }
+
+        # Main processing loop with interruption handling
+        while remaining_time > 0:
+            # Validate remaining time has not increased
+            assert remaining_time <= actual_cycle_time, (
+                f"Remaining time increased unexpectedly on machine {self.machine_id}"
+            )
+            if phase != 'repair':
+                if pending is None:
+                    # Infinite loop guard
+                    loop_guard +=1
+                    # Break if loop guard exceeds threshold of 1000 iterations
+                    if loop_guard > 1000:
+                        # Log error and break to avoid infinite loop
+                        print(
+                                f"[ERROR] Infinite loop detected\n"
+                                f"Machine: {self.machine_id}\n"
+                                f"WO: {self.current_work_order}\n"
+                                f"Remaining: {remaining_time}\n"
+                                f"Now: {env.now}\n"
+                                f"Operational: {self.is_operational}"
+                            )
+                        counter = -1
+                        break
+                    # Record segment start time and schedule the remaining processing time
+                    segment_start = env.now
+                    segment = remaining_time
+                    segment_fails = False
+                    if self.time_to_failure is not None:
+                        # Operating-time failures: end the segment at the failure if it comes first
+                        if self.operating_ttf is None:
+                            self.operating_ttf = self.draw_time_to_failure(self.time_to_failure)
+                        if self.operating_ttf < remaining_time:
+                            segment = self.operating_ttf
+                            segment_fails = True
+                    pending = env.timeout(segment)
+                step_state.update(phase='segment', remaining_time=remaining_time, counter=counter,
+                                  loop_guard=loop_guard, segment_start=segment_start, segment_fails=segment_fails)
+                # Attempt to process the remaining time segment
+                try:
+                    yield pending
+                    pending = None
+                    failure_cause = None
+                    if self.time_to_failure is not None:
+                        # Run the time to failure down by the processing time of the segment
+                        self.operating_ttf -= env.now - segment_start
+                        if segment_fails:
+                            self.operating_ttf = None
+                            failure_cause = self.failure_type_rng.choice(FAILURE_TYPES)
+                    if failure_cause is None:
+                        # If completed without interruption, set remaining time to zero
+                        remaining_time = 0
+                # Handle interruptions due to failures
+                except simpy.Interrupt as downtime:
+                    failure_cause = downtime.cause
+                if failure_cause is not None:
+                    # Mark machine as non-operational during failure
+                    self.is_operational = False
+                    counter += 1
+                    # Record failure start time and type
+                    failure_start = env.now
+                    failure_type = failure_cause
+                    # Compute elapsed processing time before interruption
+                    elapsed = env.now - segment_start
+                    if elapsed <= 0:
+                        elapsed = min(1e-6, remaining_time)
+                    # Update remaining time
+                    remaining_time -= elapsed
+                    if remaining_time < 0:
+                        remaining_time = 0
+                    # Simulate repair time
+                    repair_time = hf.vary_repair_time(repair_behavior, self.repair_rng)
+                    phase = 'repair'
+                    pending = env.timeout(repair_time)
+            if phase == 'repair':
+                step_state.update(phase='repair', remaining_time=remaining_time, counter=counter, loop_guard=loop_guard,
+                                  segment_start=segment_start, failure_start=failure_start, failure_type=failure_type, elapsed=elapsed)
+                yield pending
+                phase = None
+                pending = None
+                failure_end = env.now
+                # Log the downtime event
+                self.log_downtime_event(process_id, process_route_id, failure_type, elapsed, failure_start, failure_end)
+                # Mark machine as operational again
+                self.is_operational = True
+        # End of processing loop
+        self.finish_step(env, quality, counter, rngs)
+
+    def cause_failure(self, time_to_failure, pending_failure=None):
         """
         Continuous process that generates random failure events and interrupts the
         current processing job when a failure occurs.
@@ -443,21 +735,24 @@ class Machine(object):
         time_to_failure : dict
             Expected keys:
             - 'low_range', 'high_range' : range bounds used to draw mean time-to-failure.
+        pending_failure : simpy.events.Event, optional
+            Failure timeout restored from a checkpoint; it is waited on before
+            the next time-to-failure is drawn.
         """
-        # Extract bounds for mean time-to-failure sampling
-        low_bound = time_to_failure['low_range']
-        high_bound = time_to_failure['high_range']
         # Continuous failure generation loop
         while True:
-            # Sample mean time-to-failure and actual failure time
-            mean_ttf = local_rng.integers(low=low_bound, high=high_bound)
-            failure_time = local_rng.exponential(mean_ttf)
+            if pending_failure is None:
+                # Sample the failure time
+                failure_time = self.draw_time_to_failure(time_to_failure)
+                pending_failure = self.env.timeout(failure_time)
+                self.next_failure_time = self.env.now + failure_time
             # Wait until failure time
-            yield self.env.timeout(failure_time)
+            yield pending_failure
+            pending_failure = None
             # If machine is operational, select a failure type and interrupt current process
             if self.is_operational:
                 # Select failure type
-                failure_type_selection = self.failure_rng.choice(["Bearing Seizure", "Drive Belt Snapped", "Hydraulic Fluid Leak", "Pneumatic Pressure Loss", "Motor Overheating", "Electrical Short Circuit", "Sensor Misalignment", "PLC Logic Error", "Lubrication Starvation", "Vacuum Pump Cavitation", "Chamber Contamination", "MFC Drift", "Wafer Handling Robot Jam", "ESD Event", "RF Generator Arc-over", "Ion Source Depletion", "Mask Misalignment", "CDS Clog", "Turbo Pump Vibration", "Calibration Drift"])
+                failure_type_selection = self.failure_type_rng.choice(FAILURE_TYPES)
                 # Interrupt the current process if one is active
                 if self.current_process is not None:
                     self.current_process.interrupt(cause=failure_type_selection)
@@ -23,6 +23,33 @@ Notes / Conventions
 - Docstrings follow numpy-style conventions used across the codebase.
 - RNG injection pattern: `rngs` is passed to allow reproducible independent
   streams for arrivals, processing, failures, quality and structural sampling.
+- Common random numbers (`run_specs.crn`): every machine and work order gets
+  its own substreams, derived from one root seed by (stream, entity index)
+  via `numpy.random.SeedSequence` spawn keys (`entity_rng`). Entities are
+  indexed by machine position and work order staging row, so two scenarios
+  run with the same seed draw the same failures, repairs, cycle noise and
+  yields for the same machine or work order and their KPI differences are paired.
+- Antithetic variates (`run_specs.antithetic` = 'base' or 'mirror', set by
+  `run_simulation.run_antithetic_pair`): interarrival, batch-size,
+  cycle-noise, failure-time and repair draws go through
+  `AntitheticGenerator`, which samples by inversion and uses 1 - U in the
+  mirror run of a pair.
+- Buffered sampling (`run_specs.rng_block_size`): the arrival stream and the
+  module-level generators behind cycle noise, failure timing and repairs
+  are wrapped in `BufferedSampler`s (`self.samplers`, one per stream) that
+  serve block-drawn variates. Per-entity substreams are left unbuffered,
+  since each of them serves only a handful of draws.
+- Failure clock (`run_specs.failure_clock`): 'calendar' (default) runs a
+  background failure process per machine that fires on wall-clock time,
+  busy or idle; 'operating' counts the time to failure down only while a
+  step is processing (MTBF in operating hours) and arms it inside
+  `Machine.process_order`, so idle machines schedule no failure events.
+- Fast path (`run_specs.fast_path`, off by default): a step that ends before
+  its machine's next failure is run by the work order process as a single
+  timeout (`run_work_order`). The step draws and time-to-failure bookkeeping
+  match `Machine.process_order`, but the work order resumes one event earlier,
+  so events that share a timestamp with a step end can be ordered
+  differently; seeded runs are only identical when no such ties occur.
 """
 
 ####################################################################
@@ -30,16 +57,30 @@ Notes / Conventions
 ####################################################################
 
 # Import necessary modules
+from AntitheticGenerator import AntitheticGenerator
+from BufferedSampler import BufferedSampler
+from EventSink import ChunkedTable, table_frames
 from Machine import Machine
 from MachineType import MachineType
+from WorkOrderStore import WorkOrderStore
 
 import pandas as pd
 import numpy as np
 import data_generators as dg
 import helper_functions as hf
+import output_analysis as oa
+import structure_cache as sc
 
 import simpy
 import warnings
+from itertools import islice
+
+####################################################################
+
+# Common-random-numbers substreams (their order fixes the SeedSequence spawn keys)
+CRN_STREAMS = ['failure', 'failure_type', 'repair', 'processing', 'quality']
+MACHINE_CRN_STREAMS = ['failure', 'failure_type', 'repair']
+WORK_ORDER_CRN_STREAMS = ['processing', 'quality']
 
 ####################################################################
 
@@ -70,12 +111,45 @@ class Plant(object):
         Instantiated `Machine` objects used by the Plant.
     machine_types : dict
         Mapping machine_type -> MachineType wrapper containing simpy.Resource and machines list.
+    route_templates : dict
+        Mapping product_id -> tuple of `RouteStep` (see `hf.build_route_templates`).
+    work_order_staging : WorkOrderStore
+        Append-only column store holding every work order generated so far.
     active_work_orders : list
         List of simpy Process objects representing in-flight work orders.
+    event_sink : EventSink or None
+        Sink the Machines stream their event logs to (None keeps events in memory).
+    structure_cache : pathlib.Path or str or None
+        Folder of the dimension-table cache (see `structure_cache`); None always regenerates.
+    work_order_state : dict
+        Explicit state of each in-flight work order (step index, quantity,
+        resource request, machine), keyed by work_order_id; read by checkpoints.
+    release_phase : str or None
+        What the release process is waiting on: 'interarrival', 'wip' (WIP
+        limit poll) or 'drain' (completion of the remaining work orders).
+    release_backlog : list
+        Work orders of the current batch not yet released.
+    release_horizon : float or None
+        Simulation time (seconds) at which time-driven release stops.
+    warm_start_completed : set
+        Work orders completed before the snapshot a warm-started run was
+        restored from (see `checkpoint.warm_start_plant`); left out of
+        `fact_work_order`.
+    steady_state_samples : dict
+        Lists 'time', 'wip', 'completed' (cumulative completed work orders),
+        'lead_time' (cumulative lead time of those work orders) and 'busy'
+        (busy machines) sampled by `steady_state_monitor` when
+        `run_specs['warmup_detection']` or `run_specs['precision_target']` is set.
+    warmup_end_time : float or None
+        End of the detected warm-up (see `output_analysis`); None if
+        detection is off or steady state was not reached.
+    precision_stop_time : float or None
+        Time release was stopped because the KPI confidence intervals met
+        `run_specs['precision_target']`; None if the run went to its horizon.
     final_tables : list
         List of final tables produced by the run for export.
     """
-    def __init__(self, env, scenario_val, scenario_name, config, rngs):
+    def __init__(self, env, scenario_val, scenario_name, config, rngs, event_sink=None, structure_cache=None):
         """
         Initialize a Plant instance.
 
@@ -91,6 +165,12 @@ class Plant(object):
             Full configuration dictionary (includes run_specs and stochastic parameters).
         rngs : dict
             RNG streams. Expected keys: 'arrival', 'processing', 'failure', 'quality', 'structure'.
+        event_sink : EventSink, optional
+            Sink receiving machine event logs in fixed-size chunks during the run
+            (e.g. `EventSink.ChunkedFileSink`). Default None keeps all events in memory.
+        structure_cache : str or pathlib.Path, optional
+            Folder for cached dimension tables (see `structure_cache`). Default
+            None generates the structure on every run.
         """
         # Store config
         self.scenario_id = scenario_val
@@ -100,9 +180,19 @@ class Plant(object):
 
         # Set random value generators to set seeds if required
         self.rngs = rngs
-        self.arrival_rng = rngs['arrival']
+        self.antithetic = self.run_specs.get('antithetic')
+        self.rng_block_size = self.run_specs.get('rng_block_size')
+        self.samplers = {}
+        self.failure_clock = self.run_specs.get('failure_clock') or 'calendar'
+        self.fast_path = self.run_specs.get('fast_path', False)
+        self.arrival_rng = self.antithetic_rng(self.buffered_rng('arrival', rngs['arrival']))
         self.structure_rng = rngs['structure']
 
+        # Common random numbers: root seed of the per-entity substreams (see `entity_rng`)
+        self.crn = bool(self.run_specs.get('crn'))
+        self.crn_seed = int(rngs['processing'].integers(2**63)) if self.crn else None
+        self.work_order_rngs = {}
+
         # Interpret run mode and number of work orders
         if self.run_specs['num_work_orders'] in [None, 0]:
             self.num_work_orders = None
@@ -140,10 +230,30 @@ class Plant(object):
         self.dim_product = []
         self.dim_process = []
         self.dim_process_route = []
-        self.work_order_staging = None
+        self.route_templates = {}
+        self._dispatch_cache = {}
+        self.work_order_staging = WorkOrderStore()
+        self.event_sink = event_sink
+        self.structure_cache = structure_cache
         self.fact_work_order = []
+
+        # Explicit release / work order state (see `checkpoint`)
+        self.work_order_state = {}
+        self.release_process = None
+        self.release_phase = None
+        self.release_backlog = []
+        self.release_ids = []
+        self.release_position = 0
+        self.release_horizon = None
+        self.warm_start_completed = set()
         self.final_tables = []
 
+        # Output series for warm-up detection (see `output_analysis`)
+        self.steady_state_samples = {'time': [], 'wip': [], 'completed': [], 'lead_time': [], 'busy': []}
+        self.monitor_process = None
+        self.warmup_end_time = None
+        self.precision_stop_time = None
+
     # ---------------------------------------------------------------------
     # Initialization helpers
     # ---------------------------------------------------------------------
@@ -156,54 +266,240 @@ class Plant(object):
         volume-driven) in the SimPy environment.
         """
         print("Plant initialization started...\n")
-        self.dim_machine = self.build_machines()
+        # Reuse cached dimension tables when an identical structure was generated before
+        cache_key = self.structure_cache_key()
+        cached = self.load_cached_structure(cache_key)
+        if cached is not None:
+            self.dim_machine = self.build_machines(cached['dim_machine'])
+        else:
+            self.dim_machine = self.build_machines()
         print("Machine objects built.\n")
         self.build_machine_type_resources()
         print("Machine type resources built.\n")
 
-        (self.dim_product,
-         self.dim_process,
-         self.dim_process_route
-        ) = self.generate_products_and_processes(
-             self.dim_machine, 
-             self.config['step_bounds']
-             )
-
-        print("Products and process routes generated.\n")
+        if cached is not None:
+            self.dim_product = cached['dim_product']
+            self.dim_process = cached['dim_process']
+            self.dim_process_route = cached['dim_process_route']
+            print("Products and process routes loaded from structure cache.\n")
+        else:
+            (self.dim_product,
+             self.dim_process,
+             self.dim_process_route
+            ) = self.generate_products_and_processes(
+                 self.dim_machine, 
+                 self.config['step_bounds']
+                 )
+
+            print("Products and process routes generated.\n")
+            if cache_key is not None:
+                self.save_cached_structure(cache_key)
+
+        # Index routes by product once; every released work order shares its product's RouteStep tuple
+        self.route_templates = hf.build_route_templates(self.dim_process, self.dim_process_route)
         
         print("Generating initial work orders...")
-        self.work_order_staging = self.generate_work_orders(self.dim_product)
+        self.generate_work_orders(self.dim_product)
         print("Initial work orders generated.\n")
 
-    def build_machines(self):
+    def structure_cache_key(self):
+        """
+        Return the structure cache key for this run, or None when caching is off.
+
+        Must be called before the structure is generated (the key includes the
+        current states of the structure RNGs).
         """
-        Instantiate `Machine` objects and start their background failure processes.
+        if self.structure_cache is None:
+            return None
+        return sc.structure_key(self.config, self.structure_rng, dg.local_rng)
+
+    def load_cached_structure(self, key):
+        """
+        Load the dimension tables from the structure cache if an entry exists.
+
+        On a hit the structure RNGs are moved to their post-generation states,
+        so the remainder of the run matches an uncached run draw for draw.
+
+        Parameters
+        ----------
+        key : str or None
+            Key returned by `structure_cache_key` (None disables the lookup).
+
+        Returns
+        -------
+        dict or None
+            Mapping table name -> DataFrame, or None on a miss / with caching off.
+        """
+        if key is None:
+            return None
+        entry = sc.load_structure(self.structure_cache, key)
+        if entry is None:
+            return None
+        self.structure_rng.bit_generator.state = entry['rng_states']['structure']
+        dg.local_rng.bit_generator.state = entry['rng_states']['fallback']
+        print(f"Structure tables loaded from cache entry {key[:12]}.\n")
+        return entry['tables']
+
+    def save_cached_structure(self, key):
+        """
+        Store the freshly generated dimension tables under `key`.
+
+        Parameters
+        ----------
+        key : str
+            Key returned by `structure_cache_key` before generation.
+        """
+        tables = {
+            'dim_machine': self.dim_machine,
+            'dim_product': self.dim_product,
+            'dim_process': self.dim_process,
+            'dim_process_route': self.dim_process_route,
+        }
+        sc.save_structure(self.structure_cache, key, tables, self.structure_rng, dg.local_rng)
+
+    def build_machines(self, dim_machine=None, start_failures=True):
+        """
+        Instantiate `Machine` objects and start their background failure processes
+        (calendar-time failures) or hand them the failure config (operating-time
+        failures, `run_specs.failure_clock`).
+
+        Parameters
+        ----------
+        dim_machine : pandas.DataFrame, optional
+            Existing machine dimension (e.g. from the structure cache). Default
+            None generates a new one with `data_generators.create_machines`.
+        start_failures : bool, optional
+            Start each machine's failure process (default True). Restored
+            checkpoints start them with their pending failure instead.
 
         Returns
         -------
         pandas.DataFrame
-            The dimension table used to create the `Machine` objects (from data_generators).
+            The dimension table used to create the `Machine` objects.
         """
         print("Building machine objects...")
+        if dim_machine is None:
+            dim_machine = dg.create_machines(self.num_machines, self.rngs)
+
         # Instantiate machine objects
-        dim_machine = dg.create_machines(self.num_machines, self.rngs)
 
         i = 1
         for row in dim_machine.itertuples(index=True, name='Plant_Machine_'+str(i)):
+            # Per-machine substreams are indexed by position, not by the (process-wide) machine_id
+            entity_rngs = None
+            if self.crn:
+                entity_rngs = {name: self.entity_rng(name, len(self.Machines)) for name in MACHINE_CRN_STREAMS}
             machine = Machine(
                 env=self.env,
                 dim_machine_row=row,
                 work_order=[],
-                rngs=self.rngs
+                rngs=self.rngs,
+                event_sink=self.event_sink,
+                entity_rngs=entity_rngs
                 )
+            if not self.crn:
+                # Shared module-level generators: one sampler per generator for all machines
+                machine.noise_rng = machine.ttf_rng = self.buffered_rng('Machine', machine.noise_rng)
+                machine.repair_rng = self.buffered_rng('helper_functions', machine.repair_rng)
+            machine.noise_rng = self.antithetic_rng(machine.noise_rng)
+            machine.repair_rng = self.antithetic_rng(machine.repair_rng)
+            machine.ttf_rng = self.antithetic_rng(machine.ttf_rng)
 
             self.Machines.append(machine)
             i +=1
-            # start background failure processes
-            machine.start_failure_process(self.config['time_to_failure'])
+            # Operating-time failures are armed per step by `process_order`; calendar ones run in the background
+            if self.failure_clock == 'operating':
+                machine.time_to_failure = self.config['time_to_failure']
+            elif start_failures:
+                machine.start_failure_process(self.config['time_to_failure'])
         
         return dim_machine
 
+    def buffered_rng(self, name, rng):
+        """
+        Return the block-buffered sampler of a stream when buffered sampling is on.
+
+        Parameters
+        ----------
+        name : str
+            Stream name, the key of the sampler in `self.samplers` (and in checkpoints).
+        rng : numpy.random.Generator
+
+        Returns
+        -------
+        BufferedSampler or numpy.random.Generator
+            `rng` itself when `run_specs.rng_block_size` is not set.
+        """
+        if not self.rng_block_size:
+            return rng
+        sampler = self.samplers.get(name)
+        if sampler is None:
+            sampler = self.samplers[name] = BufferedSampler(rng, self.rng_block_size)
+        return sampler
+
+    def antithetic_rng(self, rng):
+        """
+        Wrap a generator for antithetic sampling when this run is part of an antithetic pair.
+
+        Parameters
+        ----------
+        rng : numpy.random.Generator
+
+        Returns
+        -------
+        AntitheticGenerator or numpy.random.Generator
+            `rng` itself when `run_specs.antithetic` is not set.
+        """
+        if not self.antithetic:
+            return rng
+        return AntitheticGenerator(rng, mirror=self.antithetic == 'mirror')
+
+    def entity_rng(self, stream, index):
+        """
+        Return a fresh generator for one substream of one entity (common random numbers).
+
+        Parameters
+        ----------
+        stream : str
+            One of `CRN_STREAMS`.
+        index : int
+            Machine position in `self.Machines`, or work order staging row.
+
+        Returns
+        -------
+        numpy.random.Generator
+            Generator seeded from `self.crn_seed` with spawn key (stream, index).
+        """
+        seed = np.random.SeedSequence(self.crn_seed, spawn_key=(CRN_STREAMS.index(stream), int(index)))
+        return np.random.default_rng(seed)
+
+    def work_order_substreams(self, work_order_id):
+        """
+        Return the substreams of a work order, creating them on first use.
+
+        Parameters
+        ----------
+        work_order_id : str
+            Staged work order.
+
+        Returns
+        -------
+        dict or None
+            Generators keyed by `WORK_ORDER_CRN_STREAMS`, or None when
+            common random numbers are off.
+        """
+        if not self.crn:
+            return None
+        rngs = self.work_order_rngs.get(work_order_id)
+        if rngs is None:
+            row = self.work_order_staging.row_index[work_order_id]
+            rngs = {name: self.entity_rng(name, row) for name in WORK_ORDER_CRN_STREAMS}
+            self.work_order_rngs[work_order_id] = rngs
+        if self.antithetic:
+            # Wrap on hand-out so `work_order_rngs` keeps plain generators (checkpointed as-is)
+            return dict(rngs, processing=self.antithetic_rng(rngs['processing']))
+        return rngs
+
     def build_machine_type_resources(self):
         """
         Create MachineType wrappers (simpy.Resource per machine type) and
@@ -258,14 +554,16 @@ class Plant(object):
     # ---------------------------------------------------------------------
     def generate_work_orders(self, dim_product):
         """
-        Produce a batch of new work orders.
+        Produce a batch of new work orders and append it to the staging store.
 
         Behavior
         --------
-        - On the first call (work_order_staging is None) the function generates
+        - On the first call (work_order_staging is empty) the function generates
           a complete set of work orders determined by `self.num_work_orders`.
         - On subsequent calls it generates a group determined by `batch_sizes`
           configuration using `helper_functions.generate_batch_group_size()`.
+        - New rows are appended to `self.work_order_staging` (a `WorkOrderStore`)
+          so the existing table is never copied or re-scanned for IDs.
 
         Parameters
         ----------
@@ -275,46 +573,105 @@ class Plant(object):
         Returns
         -------
         pandas.DataFrame
-            fact_work_order table with new/updated work orders.
+            The newly generated work order rows.
         """
-        # Create work order records
-        if self.work_order_staging is None:
-            fact_work_order, _ = dg.create_work_orders(dim_product, num_work_orders=self.num_work_orders, rngs=self.rngs)
+        # Determine how many work orders to create
+        if len(self.work_order_staging) == 0:
+            num_val = self.num_work_orders
         else:
             poisson_params = self.config['batch_sizes']
             lam = poisson_params['lambda']
             min_val = poisson_params['min_val']
             max_val = poisson_params['max_val']
             num_val = hf.generate_batch_group_size(lam, min_val, max_val, self.arrival_rng)
-            fact_work_order, _ = dg.create_work_orders(dim_product, self.work_order_staging, num_work_orders=num_val, rngs=self.rngs)
 
-        return fact_work_order
+        # Create work order records and append them to the staging store
+        new_work_orders = dg.create_work_order_batch(
+            dim_product,
+            num_work_orders=num_val,
+            rngs=self.rngs,
+            existing_ids=self.work_order_staging.ids,
+            start_index=len(self.work_order_staging)
+        )
+        self.work_order_staging.append(new_work_orders)
+
+        return new_work_orders
 
-    def dispatch_work_order(self, work_order_df):
+    def dispatch_work_order(self, product_id):
         """
-        Map a work order's route steps to MachineType resources.
+        Map a product's route steps to MachineType resources.
+
+        Both the route steps and the matching machine pool are shared by every
+        work order of the product, so after the first dispatch of a product
+        this is a single dictionary lookup.
 
         Parameters
         ----------
-        work_order_df : pandas.DataFrame
-            Rows for a single work order describing process_route steps.
+        product_id : int
+            Product of the work order being released.
 
         Returns
         -------
         tuple
-            (machine_pool, work_order_steps) where machine_pool is a list of
-            MachineType objects (one per step) and work_order_steps is a list
-            of step tuples for execution.
+            (machine_pool, work_order_steps) where machine_pool is a tuple of
+            MachineType objects (one per step) and work_order_steps is the
+            tuple of `RouteStep` records for execution.
+        """
+        # Reuse the cached dispatch plan for this product when available
+        dispatch = self._dispatch_cache.get(product_id)
+        if dispatch is None:
+            # Route the product's steps to machine type resources
+            work_order_steps = self.route_templates[product_id]
+            machine_pool = tuple(self.machine_types[step.machine_type] for step in work_order_steps)
+            dispatch = (machine_pool, work_order_steps)
+            self._dispatch_cache[product_id] = dispatch
+
+        return dispatch
+
+    def release_work_order(self, work_order_id, resume=None):
+        """
+        Start the SimPy process that executes a single staged work order.
+
+        Parameters
+        ----------
+        work_order_id : str
+            Identifier of a work order present in `self.work_order_staging`.
+        resume : dict, optional
+            Restored work order state (see `run_work_order`).
+
+        Returns
+        -------
+        simpy.events.Process
+            The process running `run_work_order` for this work order.
+        """
+        # Pull work order attributes through the staging index (O(1) each)
+        product_id = self.work_order_staging.lookup(work_order_id, 'product_id')
+        target_yield = self.work_order_staging.lookup(work_order_id, 'target_yield_rate')
+        planned_quantity = self.work_order_staging.lookup(work_order_id, 'planned_quantity')
+
+        machine_pool, work_order_steps = self.dispatch_work_order(product_id)
+        proc = self.env.process(self.run_work_order(work_order_id, target_yield, work_order_steps, machine_pool, planned_quantity, resume))
+        self.active_work_orders.append(proc)
+        return proc
+
+    def _releasable_work_order_ids(self, start=0, stop=None):
         """
-        # Route work orders to machines
-        work_order_steps = []
-        machine_pool = []
-        for step in work_order_df.itertuples(index=False, name='Process_Step'):
-            machine_type = step.machine_type
-            work_order_steps.append(step)
-            machine_pool.append(self.machine_types[machine_type])
+        Return staged work order IDs in dispatch order (ascending work_order_id),
+        skipping any work order whose product has no process route.
+
+        Parameters
+        ----------
+        start, stop : int, optional
+            Row range of `self.work_order_staging` to consider.
 
-        return machine_pool, work_order_steps
+        Returns
+        -------
+        list of str
+        """
+        work_order_ids = self.work_order_staging.column('work_order_id', start, stop)
+        product_ids = self.work_order_staging.column('product_id', start, stop)
+        releasable = [wo_id for wo_id, product_id in zip(work_order_ids, product_ids) if product_id in self.route_templates]
+        return sorted(releasable)
 
     def _cleanup_active_work_orders(self) -> int:
         """
@@ -333,22 +690,34 @@ class Plant(object):
     # ---------------------------------------------------------------------
     # Per-work-order execution
     # ---------------------------------------------------------------------
-    def run_work_order(self, work_order_steps, machine_pool, planned_quantity):
+    def run_work_order(self, work_order_id, target_yield, work_order_steps, machine_pool, planned_quantity, resume=None):
         """
         SimPy process that executes all steps for a single work order.
 
         It obtains a resource by machine type, selects a concrete machine,
         runs the machine's `process_order` (which yields to env.timeout and
         may be interrupted by failures), and logs start/end times for the work order.
+        Steps the machine's next failure cannot reach (`Machine.failure_free`)
+        take a fast path: a single timeout yielded by this process instead of
+        a nested `process_order` process.
 
         Parameters
         ----------
-        work_order_steps : list
-            Ordered list of step objects for the work order.
-        machine_pool : list
-            List of `MachineType` objects aligned with steps.
+        work_order_id : str
+            Identifier of the work order being executed.
+        target_yield : float
+            Overall target yield for the work order (0..1).
+        work_order_steps : sequence of RouteStep
+            Ordered route steps for the work order.
+        machine_pool : sequence
+            `MachineType` objects aligned with steps.
         planned_quantity : int
             Initial unit count for the work order.
+        resume : dict, optional
+            Work order state restored from a checkpoint (see `checkpoint`):
+            'step_index', 'current_quantity', the restored resource 'request'
+            and, for a step in progress, its 'machine' and 'step_process' (or,
+            for a fast-path step, its restored timeout 'step_event').
 
         Notes
         -----
@@ -357,35 +726,69 @@ class Plant(object):
         to `self.work_order_start_times` and `self.work_order_end_times`.
         """
         current_quantity = planned_quantity
-
-        for idx, step in enumerate(work_order_steps):
-            assert idx < len(machine_pool), (
-                f"Step index {idx} out of range for machine pool"
-            )
-            work_order_id = step.work_order_id
+        num_steps = len(machine_pool)
+        first_step = 0
+        if resume is not None:
+            first_step = resume['step_index']
+            current_quantity = resume['current_quantity']
+
+        # Explicit state of this work order at each suspension point (read by checkpoints)
+        state = {'process': self.env.active_process, 'step_index': first_step, 'current_quantity': current_quantity,
+                 'request': None, 'machine': None}
+        self.work_order_state[work_order_id] = state
+        substreams = self.work_order_substreams(work_order_id)
+
+        for idx in range(first_step, num_steps):
+            step = work_order_steps[idx]
             step_number = step.step_number
-            num_steps = len(machine_pool)
             process_id = step.process_id
             process_route_id = step.process_route_id
-            target_yield = step.target_yield_rate
-            
+
+            if resume is None:
+                type_req = machine_pool[idx].resource.request()
+                step_process = step_event = None
+            else:
+                type_req = resume['request']
+                machine = resume['machine']
+                step_process = resume['step_process']
+                step_event = resume.get('step_event')
+                resume = None
+            state['step_index'] = idx
+            state['current_quantity'] = current_quantity
+            state['request'] = type_req
+            state['machine'] = None
+
             # Run processes for machine environments
-            with machine_pool[idx].resource.request() as type_req:
-                if work_order_id not in self.work_order_start_times:
-                    self.work_order_start_times[work_order_id] = self.env.now
-                
-                yield type_req
-                machine = machine_pool[idx].select_machine()
-                machine.start_quantity = current_quantity
-
-                if machine is None:
-                    raise RuntimeError(f"No idle machine found for {step.machine_type}")  
-                
-                yield self.env.process(machine.process_order(self.env, work_order_id, step_number, num_steps, process_id, process_route_id, target_yield, current_quantity, self.config["process_noise"], self.config["repair_behavior"], self.config["quality"]))
+            with type_req:
+                if step_process is None and step_event is None:
+                    if work_order_id not in self.work_order_start_times:
+                        self.work_order_start_times[work_order_id] = self.env.now
+
+                    yield type_req
+                    machine = machine_pool[idx].select_machine()
+                    machine.start_quantity = current_quantity
+
+                    if machine is None:
+                        raise RuntimeError(f"No idle machine found for {step.machine_type}")
+
+                    actual_cycle_time = machine.begin_step(work_order_id, current_quantity, self.config["process_noise"], substreams)
+                    if self.fast_path and machine.failure_free(actual_cycle_time):
+                        # Fast path: no failure falls within the step, so wait out the cycle here
+                        step_event = machine.hold_step(self.env, work_order_id, step_number, num_steps, process_id, process_route_id, target_yield, actual_cycle_time)
+                    else:
+                        step_process = self.env.process(machine.process_order(self.env, work_order_id, step_number, num_steps, process_id, process_route_id, target_yield, current_quantity, self.config["process_noise"], self.config["repair_behavior"], self.config["quality"], rngs=substreams, actual_cycle_time=actual_cycle_time))
+                state['machine'] = machine
+                if step_event is not None:
+                    yield step_event
+                    machine.finish_step(self.env, self.config["quality"], rngs=substreams)
+                else:
+                    yield step_process
                 current_quantity = machine.end_quantity
                 machine.start_quantity = 0
                 machine.end_quantity = 0
 
+        del self.work_order_state[work_order_id]
+        self.work_order_rngs.pop(work_order_id, None)
         assert work_order_id not in self.work_order_end_times,(
             f"Duplicate completion detected for WO {work_order_id}"
         )
@@ -395,73 +798,110 @@ class Plant(object):
     # ---------------------------------------------------------------------
     # Release processes (time- and volume-driven)
     # ---------------------------------------------------------------------
-    def work_order_release_process(self, sim_horizon):
+    def _release_backlog(self, pending_poll=None, settle=True):
+        """
+        Release the work orders in `self.release_backlog` in order, holding
+        each back while the optional WIP limit is reached.
+
+        Parameters
+        ----------
+        pending_poll : simpy.events.Event, optional
+            WIP poll restored from a checkpoint; waited on before WIP is re-checked.
+        settle : bool, optional
+            Yield a zero-delay timeout after each release so the new work order
+            starts before the next one is released (time-driven mode).
+        """
+        wip_limit = self.run_specs.get('wip_limit')
+        poll_interval = self.run_specs.get('wip_poll_interval', 60)
+        while self.release_backlog:
+            work_order_id = self.release_backlog[0]
+            if pending_poll is not None or (wip_limit and int(wip_limit) > 0):
+                current_wip = None if pending_poll is not None else self._cleanup_active_work_orders()
+                while pending_poll is not None or current_wip >= int(wip_limit):
+                    # wait and re-check
+                    if pending_poll is None:
+                        pending_poll = self.env.timeout(poll_interval)
+                    self.release_phase = 'wip'
+                    yield pending_poll
+                    pending_poll = None
+                    current_wip = self._cleanup_active_work_orders()
+                    print('\n\n\n\nWIP Limit Hit....Work Order Release Halted\n\n\n\n')
+            print(f'Releasing work order {work_order_id} at time {self.env.now}')
+            self.release_work_order(work_order_id)
+            self.release_backlog.pop(0)
+
+            if settle:
+                yield self.env.timeout(0)
+
+    def _stage_time_driven_batch(self):
+        """
+        Generate the next batch of work orders and queue its releasable work
+        orders in `self.release_backlog` (time-driven mode).
+        """
+        initial_length = len(self.work_order_staging)
+        if initial_length == 1:
+            initial_length = 0
+
+        self.generate_work_orders(self.dim_product)
+
+        final_length = len(self.work_order_staging)
+        print('New work orders added: ', final_length - initial_length)
+        self.release_backlog = self._releasable_work_order_ids(initial_length, final_length)
+
+    def work_order_release_process(self, sim_horizon, resume=None):
         """
         Time-driven release process.
 
         This process runs until `sim_horizon` and on each interarrival:
           - generates a batch of new work orders (via `generate_work_orders`)
-          - prioritizes and groups them
+          - orders them for dispatch (ascending work_order_id)
           - releases them to the plant (subject to optional WIP limiter)
 
         Parameters
         ----------
         sim_horizon : float
             Simulation horizon in seconds (time-driven mode).
+        resume : simpy.events.Event, optional
+            Pending event restored from a checkpoint (see `checkpoint`); the
+            release state (`release_phase`, `release_backlog`) must be restored
+            first. None for the drain phase or a fresh run.
+        """
+        self.release_process = self.env.active_process
+        self.release_horizon = sim_horizon
+        phase = self.release_phase if resume is not None or self.release_phase == 'drain' else None
+
+        if phase != 'drain':
+            # Finish the batch that was in progress at the checkpoint
+            if phase == 'interarrival':
+                yield resume
+                self._stage_time_driven_batch()
+                resume = None
+            if phase is not None:
+                yield from self._release_backlog(pending_poll=resume)
+
+            # `release_horizon` moves forward to now when the precision target is reached
+            while self.env.now < self.release_horizon:
+                interarrival = hf.generate_interarrival(self.config['work_order_interarrival'], self.arrival_rng)
+                self.release_phase = 'interarrival'
+                yield self.env.timeout(interarrival)
+
+                self._stage_time_driven_batch()
+                yield from self._release_backlog()
+                print('Work orders remaining in batch: ', len(self.release_backlog))
+
+            yield self.env.timeout(0)
+            assert len(self.active_work_orders) > 0, "No work orders were scheduled"
+
+        yield from self._drain_work_orders()
+        assert all(p.triggered for p in self.active_work_orders), \
+            "Simulation ended with unfinished work orders"
+
+    def _drain_work_orders(self):
         """
-        work_order_batch_lengths = [0]
-        release_times = []
-        work_order_ids = []
-        while self.env.now < sim_horizon:
-            interarrival = hf.generate_interarrival(self.config['work_order_interarrival'], self.arrival_rng)
-            yield self.env.timeout(interarrival)
-            
-            initial_length = len(self.work_order_staging.index)
-            if initial_length == 1:
-                initial_length = 0
-
-            self.work_order_staging = self.generate_work_orders(self.dim_product)
-
-            final_length = len(self.work_order_staging.index)
-
-            num_work_orders_added = final_length - initial_length
-            work_order_batch_lengths.append(num_work_orders_added)
-            
-            work_orders_remaining = num_work_orders_added
-            print('New work orders added: ', num_work_orders_added)
-            while work_orders_remaining > 0:
-                new_work_orders_df = self.work_order_staging.iloc[initial_length:final_length+1]
-                work_order_df_ready = hf.prioritize_dispatches(new_work_orders_df, self.dim_process, self.dim_process_route)
-                new_work_orders_grouped = work_order_df_ready.groupby('work_order_id', sort=False)
-                for work_order_id, work_order_set in new_work_orders_grouped:
-                    wip_limit = self.run_specs.get('wip_limit')
-                    poll_interval = self.run_specs.get('wip_poll_interval', 60)
-                    if wip_limit and int(wip_limit) > 0:
-                        current_wip = self._cleanup_active_work_orders()
-                        while current_wip >= int(wip_limit):
-                            # wait and re-check
-                            yield self.env.timeout(poll_interval)
-                            current_wip = self._cleanup_active_work_orders()
-                            print('\n\n\n\nWIP Limit Hit....Work Order Release Halted\n\n\n\n')
-                    machine_pool, work_order_steps = self.dispatch_work_order(work_order_set)
-                    print(f'Releasing work order {work_order_id} at time {self.env.now}')
-                    work_order_row = self.work_order_staging.loc[self.work_order_staging['work_order_id'] == work_order_id, ['planned_quantity']]
-                    planned_quantity = work_order_row['planned_quantity'].values[0]
-                    proc = self.env.process(self.run_work_order(work_order_steps, machine_pool, planned_quantity))
-                    self.active_work_orders.append(proc)
-                    
-                    yield self.env.timeout(0)
-
-                    release_time = self.env.now
-                    work_order_ids.append(work_order_id)
-                    release_times.append(release_time)
-
-                    work_orders_remaining -= 1
-                
-                print('Work orders remaining in batch: ', work_orders_remaining)
-            
-        yield self.env.timeout(0)
-        assert len(self.active_work_orders) > 0, "No work orders were scheduled"
+        Wait for every released work order to complete, then finalize the
+        work order table and trigger `self.done`.
+        """
+        self.release_phase = 'drain'
         print('\nWaiting for all work orders to complete...\n')
 
         # Trim completed processes and wait for the remainder to finish
@@ -476,7 +916,11 @@ class Plant(object):
         print('\nAll work orders completed\n')
         
         # Set final work order table and finalize outputs
-        self.fact_work_order = self.work_order_staging
+        self.fact_work_order = self.work_order_staging.to_frame()
+        if self.warm_start_completed:
+            # Work orders finished during the warm-up belong to the snapshot's run
+            completed = self.fact_work_order['work_order_id'].isin(self.warm_start_completed)
+            self.fact_work_order = self.fact_work_order[~completed].reset_index(drop=True)
 
         self.final_tables = [
             self.dim_machine, 
@@ -487,8 +931,6 @@ class Plant(object):
         ]
         
         self.done.succeed()
-        assert all(p.triggered for p in self.active_work_orders), \
-            "Simulation ended with unfinished work orders"
 
     def run(self):
         """
@@ -497,6 +939,9 @@ class Plant(object):
         """
         self.initialize_simulation()
 
+        if self.run_specs.get('warmup_detection') or self.run_specs.get('precision_target'):
+            self.env.process(self.steady_state_monitor(self.run_specs.get('warmup_sample_interval') or 3600))
+
         if self.run_specs['run_mode'] == 'time':
             yield from self.run_time_driven()
 
@@ -515,84 +960,266 @@ class Plant(object):
         sim_horizon = self.run_specs['sim_horizon_days'] * 24 * 3600
         yield self.env.process(self.work_order_release_process(sim_horizon))
     
-    def run_volume_driven(self):
+    def run_volume_driven(self, resume=None):
         """
         Volume-driven run that releases a fixed total number of work orders.
 
-        The function consumes batches produced by `hf.get_work_order_sets` and
+        The function consumes batches produced by `hf.get_work_order_id_sets` and
         releases each work order (subject to optional WIP throttling).
-        """
-        print("Starting volume-driven simulation...\n")
-        final_work_orders = hf.prioritize_dispatches(self.work_order_staging, self.dim_process, self.dim_process_route)
-
-        release_times = []
-        work_order_ids = []
-        work_orders_remaining = self.num_work_orders
 
-        while work_orders_remaining > 0:
-            print(f'Work orders remaining at start of processing: {work_orders_remaining}')
-            for batch in hf.get_work_order_sets(final_work_orders, self.config['batch_sizes'], self.arrival_rng):  
+        Parameters
+        ----------
+        resume : simpy.events.Event, optional
+            Pending event restored from a checkpoint (see `checkpoint`); the
+            release state (`release_phase`, `release_backlog`, `release_ids`,
+            `release_position`) must be restored first.
+        """
+        self.release_process = self.env.active_process
+        phase = self.release_phase if resume is not None or self.release_phase == 'drain' else None
+
+        if phase != 'drain':
+            if phase is None:
+                print("Starting volume-driven simulation...\n")
+                self.release_ids = self._releasable_work_order_ids()
+                self.release_position = 0
+
+            # Finish the batch that was in progress at the checkpoint
+            if phase == 'interarrival':
+                yield resume
+                resume = None
+            if phase is not None:
+                yield from self._release_backlog(pending_poll=resume, settle=False)
+
+            print(f'Work orders remaining at start of processing: {len(self.release_ids) - self.release_position}')
+            remaining_ids = self.release_ids[self.release_position:]
+            for batch in hf.get_work_order_id_sets(remaining_ids, self.config['batch_sizes'], self.arrival_rng):
                 print('Work order batch size: ', len(batch))
+                self.release_position += len(batch)
+                self.release_backlog = list(batch)
                 interarrival_time = hf.generate_interarrival(self.config['work_order_interarrival'], self.arrival_rng)
+                self.release_phase = 'interarrival'
                 yield self.env.timeout(interarrival_time)
 
-                for work_order_df in batch:
-                    wip_limit = self.run_specs.get('wip_limit')
-                    poll_interval = self.run_specs.get('wip_poll_interval', 60)
-                    if wip_limit and int(wip_limit) > 0:
-                        current_wip = self._cleanup_active_work_orders()
-                        while current_wip >= int(wip_limit):
-                            yield self.env.timeout(poll_interval)
-                            current_wip = self._cleanup_active_work_orders()
-                    machine_pool, work_order_steps = self.dispatch_work_order(work_order_df)
-                    print(f'Releasing work order {work_order_df["work_order_id"].iloc[0]} at time {self.env.now}\n')
-                    work_order_row = self.work_order_staging.loc[self.work_order_staging['work_order_id'] == work_order_df['work_order_id'].iloc[0], ['planned_quantity']]
-                    planned_quantity = work_order_row['planned_quantity'].values[0]
-                    proc = self.env.process(self.run_work_order(work_order_steps, machine_pool, planned_quantity))
-                    self.active_work_orders.append(proc)
-                    release_time = self.env.now
-                    wo_id = str(work_order_df['work_order_id'].iloc[0])
-                    work_order_ids.append(wo_id)
-                    release_times.append(release_time)
-
-                work_orders_remaining -= len(batch)
-            
-            print(f'Work orders remaining at end of processing: {work_orders_remaining}\n')
-        
-        yield self.env.timeout(0)
-        print('\nWaiting for all work orders to complete...\n')
+                yield from self._release_backlog(settle=False)
 
-        # Trim completed processes and wait for the remainder to finish
-        self._cleanup_active_work_orders()
-        if self.active_work_orders:
-            print("Active Work Orders:", len(self.active_work_orders))
-            print("Unfinished:", sum(not p.triggered for p in self.active_work_orders))
-            assert all(isinstance(p, simpy.events.Process) for p in self.active_work_orders), "Active work orders list contains invalid processes"
-            yield simpy.events.AllOf(self.env, self.active_work_orders)
-            assert all(p.triggered for p in self.active_work_orders), "Simulation advanced before all work orders completed"
-        
-        print('\nAll work orders completed\n')
-        
-        # Set final work order table and finalize outputs
-        self.fact_work_order = self.work_order_staging
+            print(f'Work orders remaining at end of processing: {len(self.release_ids) - self.release_position}\n')
+            yield self.env.timeout(0)
 
-        self.final_tables = [
-            self.dim_machine, 
-            self.dim_product, 
-            self.dim_process, 
-            self.dim_process_route, 
-            self.fact_work_order
-        ]
-        
-        self.done.succeed()
+        yield from self._drain_work_orders()
     
+    def steady_state_monitor(self, interval, resume=None):
+        """
+        Sample WIP, completions, lead time and busy machines every `interval`
+        seconds until release ends (the drain phase is a shutdown transient,
+        not steady state).
+
+        With `run_specs['precision_target']` set, the KPI confidence intervals
+        are checked after every sample and time-driven release stops early
+        once all of them are tight enough (see `precision_reached`).
+
+        Parameters
+        ----------
+        interval : float
+            Sampling interval in seconds.
+        resume : simpy.events.Event, optional
+            Pending sampling timeout restored from a checkpoint (see `checkpoint`).
+        """
+        self.monitor_process = self.env.active_process
+        samples = self.steady_state_samples
+        target = self.run_specs.get('precision_target')
+        while self.release_phase != 'drain':
+            yield resume if resume is not None else self.env.timeout(interval)
+            resume = None
+            if self.release_phase == 'drain':
+                break
+
+            # Lead times of the work orders completed since the last sample (the newest end time entries)
+            completed = len(self.work_order_end_times)
+            new_ids = islice(reversed(self.work_order_end_times), completed - (samples['completed'][-1] if samples['completed'] else 0))
+            lead_time = sum(self.work_order_end_times[wo] - self.work_order_start_times[wo] for wo in new_ids)
+
+            samples['time'].append(self.env.now)
+            samples['wip'].append(len(self.work_order_state))
+            samples['completed'].append(completed)
+            samples['lead_time'].append((samples['lead_time'][-1] if samples['lead_time'] else 0.0) + lead_time)
+            samples['busy'].append(sum(machine.is_busy for machine in self.Machines))
+
+            if target and self.release_horizon is not None and self.env.now < self.release_horizon and self.precision_reached(target):
+                print(f"\nKPI precision target ({target:.1%} relative half-width) reached at t={self.env.now / 86400:,.2f} days; stopping release.\n")
+                self.precision_stop_time = self.env.now
+                self.release_horizon = self.env.now
+
+    def _warmup_series(self):
+        """
+        Return the sampled series used for warm-up detection (WIP and completions per interval).
+        """
+        samples = self.steady_state_samples
+        return {'wip': samples['wip'], 'throughput': np.diff(samples['completed'], prepend=0)}
+
+    def kpi_estimates(self, start=0, confidence=0.95):
+        """
+        Batch-means confidence intervals of the steady-state KPIs from the monitor samples.
+
+        Parameters
+        ----------
+        start : int, optional
+            Number of leading (warm-up) samples to skip.
+        confidence : float, optional
+            Two-sided confidence level (default 0.95).
+
+        Returns
+        -------
+        dict
+            'throughput_per_day', 'lead_time_days' and 'utilization', each the
+            result of `output_analysis.batch_means_interval` (None while there
+            are too few samples).
+        """
+        samples = self.steady_state_samples
+        interval = self.run_specs.get('warmup_sample_interval') or 3600
+        completed = np.diff(samples['completed'], prepend=0)[start:]
+        lead_time = np.diff(samples['lead_time'], prepend=0.0)[start:]
+        busy = np.asarray(samples['busy'][start:], dtype=np.float64)
+        return {
+            'throughput_per_day': oa.batch_means_interval(completed * (86400 / interval), confidence=confidence),
+            'lead_time_days': oa.batch_means_interval(lead_time / 86400, weights=completed, confidence=confidence),
+            'utilization': oa.batch_means_interval(busy / len(self.Machines), confidence=confidence),
+        }
+
+    def precision_reached(self, target):
+        """
+        Check whether every KPI's relative confidence-interval half-width is at most `target`.
+
+        Samples before the MSER-5 warm-up end are excluded; the check fails
+        while steady state has not been detected.
+
+        Parameters
+        ----------
+        target : float
+            Relative half-width target (e.g. 0.05).
+
+        Returns
+        -------
+        bool
+        """
+        truncation = oa.warmup_truncation(self._warmup_series())
+        if truncation is None:
+            return False
+        estimates = self.kpi_estimates(truncation, self.run_specs.get('precision_confidence') or 0.95)
+        return all(estimate is not None and estimate['relative_half_width'] <= target for estimate in estimates.values())
+
+    def output_summary(self):
+        """
+        Summarize warm-up detection and steady-state KPI estimates (recorded in the run manifest).
+
+        Returns
+        -------
+        dict or None
+            Warm-up end, precision target and stop time, number of samples and
+            the KPI intervals of `kpi_estimates`; None if the monitor did not run.
+        """
+        samples = self.steady_state_samples
+        if not samples['time']:
+            return None
+        truncation = oa.warmup_truncation(self._warmup_series())
+        confidence = self.run_specs.get('precision_confidence') or 0.95
+        return {
+            'warmup_end_time': self.warmup_end_time,
+            'warmup_samples': truncation,
+            'samples': len(samples['time']),
+            'precision_target': self.run_specs.get('precision_target'),
+            'precision_stop_time': self.precision_stop_time,
+            'confidence': confidence,
+            'kpis': self.kpi_estimates(truncation or 0, confidence),
+        }
+
+    def detect_warmup(self):
+        """
+        Locate the end of the warm-up in the sampled WIP and throughput series
+        with MSER-5 and store it in `self.warmup_end_time`.
+
+        Returns
+        -------
+        float or None
+            End of the warm-up in seconds, or None if steady state was not detected.
+        """
+        self.warmup_end_time = oa.detect_warmup_end(self.steady_state_samples['time'], self._warmup_series())
+        if self.warmup_end_time is None:
+            warnings.warn("Steady state not detected (MSER-5); no events are flagged as warm-up. Consider a longer horizon.",
+                          category=RuntimeWarning)
+        else:
+            print(f"Warm-up detected (MSER-5): events before t={self.warmup_end_time / 86400:,.2f} days are flagged warmup.\n")
+        return self.warmup_end_time
+
     # ---------------------------------------------------------------------
     # Results collection
     # ---------------------------------------------------------------------
+    def _collect_event_log(self, log_name):
+        """
+        Combine one event log across all Machines into a single table.
+
+        With an event sink attached, the rows still buffered in each Machine are
+        flushed first and the table stays on disk as the sink's part files.
+
+        Parameters
+        ----------
+        log_name : str
+            Machine attribute holding the log ('production_log', 'downtime_log' or 'quality_log').
+
+        Returns
+        -------
+        pandas.DataFrame or EventSink.ChunkedTable
+            DataFrame for in-memory logs, or a view of the sink's parts.
+        """
+        logs = [getattr(machine, log_name) for machine in self.Machines]
+        if self.event_sink is None:
+            return pd.concat([log.to_frame() for log in logs], ignore_index=True)
+
+        for log in logs:
+            log.flush()
+        table = self.event_sink.read(logs[0].table_name)
+        # Nothing was ever written: fall back to the (empty) typed buffer layout
+        return table if table.paths else logs[0].to_frame()
+
+    def _finish_event_table(self, table, time_column, warmup_end, sort_columns=None):
+        """
+        Sort an event table and add its `warmup` flag and `scenario_id` columns.
+
+        Tables streamed to the event sink are left in part order; the columns
+        are added to each part as it is read (see `EventSink.ChunkedTable`).
+
+        Parameters
+        ----------
+        table : pandas.DataFrame or EventSink.ChunkedTable
+        time_column : str
+            Column compared against `warmup_end`.
+        warmup_end : float
+        sort_columns : list of str, optional
+            Sort order of an in-memory table.
+
+        Returns
+        -------
+        pandas.DataFrame or EventSink.ChunkedTable
+        """
+        if isinstance(table, ChunkedTable):
+            return table.annotate(time_column, warmup_end, self.scenario_id)
+        if sort_columns:
+            table = table.sort_values(sort_columns, ascending=True).reset_index(drop=True)
+        table['warmup'] = table[time_column] < warmup_end
+        table['scenario_id'] = self.scenario_id
+        return table
+
     def collect_results(self):
         """
         Gather logs from Machines and create final pandas DataFrames.
 
+        Every fact table gets a boolean `warmup` column, True for rows that
+        start before the detected warm-up end (all False when
+        `run_specs['warmup_detection']` is off or steady state was not reached).
+
+        With an event sink attached, the three event tables are returned as
+        `EventSink.ChunkedTable` views of the sink's part files (in part order)
+        instead of DataFrames, so they are never held in memory as a whole.
+
         Returns
         -------
         tuple
@@ -603,44 +1230,28 @@ class Plant(object):
         wo_int_arr = self.config["work_order_interarrival"]
         int_mean = wo_int_arr["shape"] * wo_int_arr["scale"]
 
+        if self.run_specs.get('warmup_detection'):
+            self.detect_warmup()
+        # Rows starting before this time belong to the warm-up (0 flags nothing)
+        warmup_end = self.warmup_end_time or 0.0
+
         dim_scenario = pd.DataFrame({
                 'scenario_id': self.scenario_id,
                 'scenario_name': self.scenario_name,
                 'interarrival_mean_sec': int_mean,
                 'wip_limit': self.run_specs["wip_limit"],
                 'wip_poll_interval': self.run_specs["wip_poll_interval"],
-                'sim_horizon_days': self.run_specs["sim_horizon_days"]
+                'sim_horizon_days': self.run_specs["sim_horizon_days"],
+                'warmup_end_time': self.warmup_end_time
              }, index=[0])
         
         
-        # Merge machine logs
-        agg_production_logs = []
-        for machine in self.Machines:
-            for item in machine.production_log:
-                agg_production_logs.append(item)
-
-        fact_production_event = pd.DataFrame(agg_production_logs)
-        fact_production_event = fact_production_event.sort_values('process_start', ascending=True)
-        fact_production_event = fact_production_event.reset_index(drop=True)
-        fact_production_event['scenario_id'] = self.scenario_id
-
-        agg_downtime_logs = []
-        for machine in self.Machines:
-            for item in machine.downtime_log:
-                agg_downtime_logs.append(item)
-
-        fact_downtime_event = pd.DataFrame(agg_downtime_logs)
-        fact_downtime_event['scenario_id'] = self.scenario_id
-
-        agg_quality_logs = []
-        for machine in self.Machines:
-            for item in machine.quality_log:
-                agg_quality_logs.append(item)
-
-        fact_quality_event = pd.DataFrame(agg_quality_logs)
-        fact_quality_event = fact_quality_event.sort_values('event_time', ascending=True)
-        fact_quality_event = fact_quality_event.reset_index(drop=True)
-        fact_quality_event['scenario_id'] = self.scenario_id
+        # Merge machine logs (zero-copy column views per machine, one concat per table)
+        fact_production_event = self._finish_event_table(self._collect_event_log('production_log'), 'process_start',
+                                                         warmup_end, ['process_start', 'event_id'])
+        fact_downtime_event = self._finish_event_table(self._collect_event_log('downtime_log'), 'failure_start', warmup_end)
+        fact_quality_event = self._finish_event_table(self._collect_event_log('quality_log'), 'event_time',
+                                                      warmup_end, ['event_time', 'quality_id'])
 
 
         dim_machine = self.final_tables[0]
@@ -666,6 +1277,7 @@ class Plant(object):
 
         work_order_times = work_order_starts.merge(work_order_ends[['work_order_id', 'work_order_end_time']], on='work_order_id', how='left')
         fact_work_order = fact_work_order.merge(work_order_times[['work_order_id', 'work_order_start_time', 'work_order_end_time']], on='work_order_id', how='left')
+        fact_work_order['warmup'] = fact_work_order['work_order_start_time'] < warmup_end
         fact_work_order['scenario_id'] = self.scenario_id
 
         # Remove non-required columns and perform sanity checks before returning
@@ -675,12 +1287,13 @@ class Plant(object):
         assert fact_work_order["work_order_end_time"].notna().all(), (
             "Some work orders never completed"
         )
-        assert fact_production_event["process_start"].le(
-            fact_production_event["process_end"]
-        ).all(), "Invalid process timing detected"
-        assert fact_production_event["machine_id"].notna().all(), (
-            "Production event missing machine assignment"
-        )
+        for production_events in table_frames(fact_production_event):
+            assert production_events["process_start"].le(
+                production_events["process_end"]
+            ).all(), "Invalid process timing detected"
+            assert production_events["machine_id"].notna().all(), (
+                "Production event missing machine assignment"
+            )
         return dim_machine, dim_product, dim_process, dim_process_route, fact_work_order, fact_production_event, fact_downtime_event, fact_quality_event, dim_scenario
 
 
@@ -0,0 +1,65 @@
+### RouteStep Class Definition for Production Plant Simulation ###
+"""
+RouteStep class for Production Plant Simulation.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+Compact, immutable-by-convention record for a single step of a product's
+process route.
+
+Route steps are built once per product from the dimension tables (see
+`helper_functions.build_route_templates`) and shared by every work order of
+that product. Work-order specific values (id, target yield, quantities) are
+passed alongside the steps rather than copied into them, so releasing a work
+order allocates no per-step objects.
+
+Notes / Conventions
+-------------------
+- `__slots__` keeps each instance small and attribute access fast.
+- Instances are shared between work orders and must not be mutated during a run.
+"""
+
+## RouteStep Class Definition ##
+class RouteStep(object):
+    """
+    One ordered step of a process route.
+
+    Attributes
+    ----------
+    step_number : int
+        Position of the step within the route (1-based).
+    process_id : int
+        Identifier of the process the step belongs to.
+    process_route_id : int
+        Identifier of the route step row in `dim_process_route`.
+    machine_type : str
+        Machine type required to execute the step.
+    """
+    __slots__ = ('step_number', 'process_id', 'process_route_id', 'machine_type')
+
+    ### Initialization Method ###
+    def __init__(self, step_number, process_id, process_route_id, machine_type):
+        """
+        Initialize a RouteStep.
+
+        Parameters
+        ----------
+        step_number : int
+        process_id : int
+        process_route_id : int
+        machine_type : str
+        """
+        self.step_number = step_number
+        self.process_id = process_id
+        self.process_route_id = process_route_id
+        self.machine_type = machine_type
+
+    def __repr__(self):
+        return (
+            f"RouteStep(step_number={self.step_number}, process_id={self.process_id}, "
+            f"process_route_id={self.process_route_id}, machine_type={self.machine_type!r})"
+        )
@@ -0,0 +1,216 @@
+### WorkOrderStore Class Definition for Production Plant Simulation ###
+"""
+WorkOrderStore class for Production Plant Simulation.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+Append-only columnar container for the work order staging table.
+
+The time-driven release process adds a small batch of work orders on every
+interarrival. Rebuilding the staging DataFrame with `pd.concat` on each batch
+copies the whole table every time, which is quadratic over a long horizon.
+`WorkOrderStore` keeps one preallocated NumPy array per column, grows them by
+doubling when full (amortized O(1) per appended row) and maintains a
+work_order_id -> row position index incrementally, so membership checks and
+per-order lookups (e.g. `planned_quantity` at release time) are O(1).
+
+Notes / Conventions
+-------------------
+- Column names and dtypes match the output of
+  `data_generators.create_work_order_batch`.
+- `to_frame()` wraps the filled part of each column array without copying.
+  The returned DataFrame is a view and should be treated as read-only; use
+  `.copy()` before mutating it.
+- Row positions double as the DataFrame index labels, matching the index
+  layout produced by `data_generators.create_work_orders`.
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import numpy as np
+import pandas as pd
+
+####################################################################
+
+## WorkOrderStore Class Definition ##
+class WorkOrderStore(object):
+    """
+    Growable column store for staged work orders.
+
+    Attributes
+    ----------
+    row_index : dict
+        Mapping work_order_id -> row position for every appended work order.
+    """
+    # Canonical column layout (name -> NumPy dtype)
+    COLUMNS = {
+        'work_order_id': object,
+        'product_id': np.int64,
+        'planned_quantity': np.int64,
+        'target_yield_rate': np.float64,
+        'batch_size': np.int64,
+        'start_date': 'datetime64[ns]',
+        'due_date': 'datetime64[ns]',
+        'priority': np.int64,
+    }
+
+    ### Initialization Method ###
+    def __init__(self, capacity=1024):
+        """
+        Initialize an empty store.
+
+        Parameters
+        ----------
+        capacity : int, optional
+            Number of rows preallocated per column (default 1024).
+        """
+        # Preallocated column arrays and fill level
+        self._capacity = max(1, int(capacity))
+        self._size = 0
+        self._columns = {name: np.empty(self._capacity, dtype=dtype) for name, dtype in self.COLUMNS.items()}
+        # Incrementally maintained work_order_id -> row position index
+        self.row_index = {}
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, work_order_id):
+        return work_order_id in self.row_index
+
+    @property
+    def ids(self):
+        """
+        Set-like view of the work order IDs appended so far (used to keep new IDs unique).
+        """
+        return self.row_index.keys()
+
+    ### Capacity Management Method ###
+    def _reserve(self, rows_needed):
+        """
+        Grow every column (by doubling) until `rows_needed` rows fit.
+
+        Parameters
+        ----------
+        rows_needed : int
+            Total number of rows the store must be able to hold.
+        """
+        if rows_needed <= self._capacity:
+            return
+        new_capacity = self._capacity
+        while new_capacity < rows_needed:
+            new_capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.empty(new_capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+        self._capacity = new_capacity
+
+    ### Append Method ###
+    def append(self, new_rows):
+        """
+        Append a batch of work orders.
+
+        Parameters
+        ----------
+        new_rows : pandas.DataFrame
+            Rows with (at least) the columns listed in `COLUMNS`.
+
+        Returns
+        -------
+        tuple of int
+            (start, stop) row positions occupied by the new batch.
+
+        Raises
+        ------
+        ValueError
+            If a work order ID in the batch is already present in the store.
+        """
+        start = self._size
+        stop = start + len(new_rows)
+        new_ids = new_rows['work_order_id'].tolist()
+        if not self.row_index.keys().isdisjoint(new_ids):
+            raise ValueError("Duplicate work_order_id appended to work order store")
+
+        # Copy the batch into the column arrays and index the new IDs
+        self._reserve(stop)
+        for name, column in self._columns.items():
+            column[start:stop] = new_rows[name].to_numpy(dtype=column.dtype)
+        self.row_index.update(zip(new_ids, range(start, stop)))
+        self._size = stop
+        return start, stop
+
+    ### Lookup Method ###
+    def lookup(self, work_order_id, column):
+        """
+        Return a single column value for one work order in O(1).
+
+        Parameters
+        ----------
+        work_order_id : str
+            Work order identifier.
+        column : str
+            Column name from `COLUMNS` (e.g. 'planned_quantity').
+
+        Returns
+        -------
+        scalar
+            The stored value for that work order.
+
+        Raises
+        ------
+        KeyError
+            If the work order ID is not present in the store.
+        """
+        return self._columns[column][self.row_index[work_order_id]]
+
+    ### Column View Method ###
+    def column(self, name, start=0, stop=None):
+        """
+        Return a zero-copy view of one column over a row range.
+
+        Parameters
+        ----------
+        name : str
+            Column name from `COLUMNS`.
+        start : int, optional
+            First row position (default 0).
+        stop : int, optional
+            Row position to stop before (default: end of store).
+
+        Returns
+        -------
+        numpy.ndarray
+            Read-only view of rows `[start, stop)` of the column.
+        """
+        stop = self._size if stop is None else min(stop, self._size)
+        return self._columns[name][min(start, stop):stop]
+
+    ### DataFrame View Method ###
+    def to_frame(self, start=0, stop=None):
+        """
+        Return a zero-copy DataFrame over a row range of the store.
+
+        Parameters
+        ----------
+        start : int, optional
+            First row position (default 0).
+        stop : int, optional
+            Row position to stop before (default: end of store).
+
+        Returns
+        -------
+        pandas.DataFrame
+            Read-only view of rows `[start, stop)` indexed by row position.
+        """
+        stop = self._size if stop is None else min(stop, self._size)
+        start = min(start, stop)
+        return pd.DataFrame(
+            {name: column[start:stop] for name, column in self._columns.items()},
+            index=pd.RangeIndex(start, stop),
+            copy=False,
+        )
@@ -0,0 +1,530 @@
+# Benchmark harness for the Production Plant Simulation
+"""
+Micro-benchmarks for the Production Plant Simulation.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+Measure the hot paths of the simulation and its data pipeline in isolation
+so performance changes can be checked against numbers instead of intuition.
+Each benchmark prints a small table to the console and returns the raw
+measurements as a list of dicts for further inspection.
+
+Notes / Conventions
+-------------------
+- Benchmarks use seeded RNG streams so repeated runs measure the same work.
+- Timings are wall-clock seconds from `time.perf_counter()`; the best of
+  `repeats` runs is reported to reduce scheduler noise.
+- Run from the `simulation/` folder, e.g.:
+      python benchmarks.py work_orders
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import argparse
+import contextlib
+import io
+import shutil
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import data_generators as dg
+import export_to_folder as etf
+from WorkOrderStore import WorkOrderStore
+from BufferedSampler import BufferedSampler
+from EventBuffer import EventBuffer
+from Machine import PRODUCTION_EVENT_SCHEMA, EVENT_STATUSES
+
+####################################################################
+
+def _seeded_rngs(seed: int = 2025) -> dict:
+    """
+    Build the standard set of RNG streams from a single seed.
+
+    Parameters
+    ----------
+    seed : int, optional
+        Master seed used to derive the individual streams.
+
+    Returns
+    -------
+    dict
+        RNG streams keyed 'arrival', 'processing', 'failure', 'quality', 'structure'.
+    """
+    master_rng = np.random.default_rng(seed)
+    return {
+        'arrival': np.random.default_rng(master_rng.integers(1e9)),
+        'processing': np.random.default_rng(master_rng.integers(1e9)),
+        'failure': np.random.default_rng(master_rng.integers(1e9)),
+        'quality': np.random.default_rng(master_rng.integers(1e9)),
+        'structure': np.random.default_rng(master_rng.integers(1e9))
+    }
+
+def _best_of(func, repeats: int) -> float:
+    """
+    Return the fastest wall time (seconds) of `repeats` calls to `func`.
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def benchmark_work_order_generation(sizes=(1_000, 10_000, 100_000, 1_000_000), repeats: int = 3) -> list:
+    """
+    Time `data_generators.create_work_orders` across a range of volumes.
+
+    Parameters
+    ----------
+    sizes : iterable of int, optional
+        Work order counts to generate (default 1k to 1M).
+    repeats : int, optional
+        Number of timed repetitions per size (best run is reported).
+
+    Returns
+    -------
+    list of dict
+        One record per size with total seconds and microseconds per order.
+    """
+    rngs = _seeded_rngs()
+    dim_machine = dg.create_machines(100, rngs)
+    dim_product, _, _ = dg.create_products_with_processes(dim_machine, 50, 3, 6, [0.25, 0.25, 0.25, 0.25], rngs)
+
+    results = []
+    print(f"{'work_orders':>12} {'seconds':>10} {'us/order':>10}")
+    for size in sizes:
+        elapsed = _best_of(lambda: dg.create_work_orders(dim_product, num_work_orders=size, rngs=rngs), repeats)
+        results.append({'work_orders': size, 'seconds': elapsed, 'us_per_order': elapsed / size * 1e6})
+        print(f"{size:>12,} {elapsed:>10.4f} {elapsed / size * 1e6:>10.3f}")
+    return results
+
+def benchmark_planned_quantity_lookup(sizes=(1_000, 10_000, 100_000, 1_000_000), lookups: int = 2_000) -> list:
+    """
+    Compare per-release `planned_quantity` lookup cost as the staging table grows.
+
+    Two strategies are timed for each table size:
+      - 'scan': the boolean-mask `.loc` lookup over a staging DataFrame
+      - 'index': `WorkOrderStore.lookup` through the maintained ID index
+
+    Parameters
+    ----------
+    sizes : iterable of int, optional
+        Staging table sizes (number of work orders).
+    lookups : int, optional
+        Number of random lookups timed per size.
+
+    Returns
+    -------
+    list of dict
+        One record per size with microseconds per lookup for each strategy.
+    """
+    rngs = _seeded_rngs()
+    dim_machine = dg.create_machines(100, rngs)
+    dim_product, _, _ = dg.create_products_with_processes(dim_machine, 50, 3, 6, [0.25, 0.25, 0.25, 0.25], rngs)
+
+    results = []
+    print(f"{'work_orders':>12} {'scan us':>12} {'index us':>10}")
+    for size in sizes:
+        store = WorkOrderStore()
+        store.append(dg.create_work_order_batch(dim_product, num_work_orders=size, rngs=rngs))
+        staging = store.to_frame()
+        sample_ids = rngs['arrival'].choice(staging['work_order_id'].to_numpy(), size=lookups)
+
+        # The scan is linear in table size, so time fewer lookups on large tables
+        scan_ids = sample_ids[:max(10, lookups * 1_000 // size)]
+        start = time.perf_counter()
+        for work_order_id in scan_ids:
+            staging.loc[staging['work_order_id'] == work_order_id, ['planned_quantity']]['planned_quantity'].values[0]
+        scan_us = (time.perf_counter() - start) / len(scan_ids) * 1e6
+
+        start = time.perf_counter()
+        for work_order_id in sample_ids:
+            store.lookup(work_order_id, 'planned_quantity')
+        index_us = (time.perf_counter() - start) / len(sample_ids) * 1e6
+
+        results.append({'work_orders': size, 'scan_us': scan_us, 'index_us': index_us})
+        print(f"{size:>12,} {scan_us:>12.2f} {index_us:>10.3f}")
+    return results
+
+def benchmark_event_log_memory(num_events: int = 500_000) -> list:
+    """
+    Compare memory held by production event logs: list of dicts vs `EventBuffer`.
+
+    Both variants log the same synthetic production events (same field order
+    as `Machine.log_production_event`); traced allocations are reported in
+    bytes per event.
+
+    Parameters
+    ----------
+    num_events : int, optional
+        Number of production events to log.
+
+    Returns
+    -------
+    list of dict
+        One record per log layout with total MiB and bytes per event.
+    """
+    rng = np.random.default_rng(2025)
+    work_order_ids = [f"WO-25{num}" for num in rng.integers(1, 1_000_000_000, size=1_000).tolist()]
+    starts = np.cumsum(rng.exponential(60.0, size=num_events)).tolist()
+    durations = rng.integers(600, 5400, size=num_events).tolist()
+    statuses = rng.choice(EVENT_STATUSES, size=num_events, p=[0.9, 0.09, 0.01]).tolist()
+    fields = list(PRODUCTION_EVENT_SCHEMA)
+
+    def rows():
+        for i in range(num_events):
+            yield (i + 1, work_order_ids[i % 1_000], 123456789, 223456789, 323456789, i % 9 + 1, i + 1,
+                   starts[i], starts[i] + durations[i], 3000, float(durations[i]), statuses[i])
+
+    def log_dicts():
+        log = []
+        for row in rows():
+            log.append(dict(zip(fields, row)))
+        return log
+
+    def log_buffer():
+        log = EventBuffer(PRODUCTION_EVENT_SCHEMA, {'event_status': EVENT_STATUSES})
+        for row in rows():
+            log.append(*row)
+        return log
+
+    results = []
+    print(f"{'layout':>12} {'MiB':>10} {'bytes/event':>12} {'seconds':>10}")
+    for name, builder in [('dict_list', log_dicts), ('EventBuffer', log_buffer)]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        log = builder()
+        elapsed = time.perf_counter() - start
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del log
+        results.append({'layout': name, 'mib': current / 2**20, 'bytes_per_event': current / num_events, 'seconds': elapsed})
+        print(f"{name:>12} {current / 2**20:>10.1f} {current / num_events:>12.1f} {elapsed:>10.2f}")
+    return results
+
+def _synthetic_production_events(num_events: int, seed: int = 2025) -> pd.DataFrame:
+    """
+    Build a production event table with the dtypes `Plant.collect_results` returns.
+    """
+    rng = np.random.default_rng(seed)
+    work_order_ids = np.array([f"WO-25{num}" for num in rng.integers(1, 1_000_000_000, size=5_000).tolist()], dtype=object)
+    starts = np.cumsum(rng.exponential(60.0, size=num_events))
+    durations = rng.integers(600, 5400, size=num_events)
+    return pd.DataFrame({
+        'event_id': np.arange(1, num_events + 1, dtype=np.int64),
+        'work_order_id': work_order_ids[rng.integers(0, len(work_order_ids), size=num_events)],
+        'machine_id': rng.integers(1, 1_000_000_000, size=100).astype(np.int32)[rng.integers(0, 100, size=num_events)],
+        'process_id': rng.integers(1, 1_000_000_000, size=num_events).astype(np.int32),
+        'process_route_id': rng.integers(1, 1_000_000_000, size=num_events).astype(np.int32),
+        'step_number': rng.integers(1, 10, size=num_events).astype(np.int16),
+        'batch_id': np.arange(1, num_events + 1, dtype=np.int64),
+        'process_start': starts,
+        'process_end': starts + durations,
+        'ideal_cycle_time': durations.astype(np.int32),
+        'actual_cycle_time': durations * rng.uniform(0.85, 1.2, size=num_events),
+        'event_status': pd.Categorical.from_codes(rng.choice(3, size=num_events, p=[0.9, 0.09, 0.01]), categories=EVENT_STATUSES),
+        'scenario_id': 'BENCH',
+    })
+
+def benchmark_export_formats(num_events: int = 1_000_000) -> list:
+    """
+    Compare write time, read time and file size of the export formats.
+
+    A synthetic `fact_production_event` table is written with
+    `export_to_folder.export_table` in each format/codec combination and read
+    back with `export_to_folder.read_table`. Parquet and Arrow cases need pyarrow.
+
+    Parameters
+    ----------
+    num_events : int, optional
+        Number of rows in the synthetic fact table (default 1M).
+
+    Returns
+    -------
+    list of dict
+        One record per format/codec with write seconds, read seconds and MiB on disk.
+    """
+    table = _synthetic_production_events(num_events)
+    cases = [
+        ('csv', None, False),
+        ('csv', 'gzip', True),
+        ('parquet', 'snappy', False),
+        ('parquet', 'zstd', False),
+        ('feather', 'lz4', False),
+        ('feather', 'zstd', False),
+    ]
+
+    results = []
+    out_dir = Path(tempfile.mkdtemp(prefix='export_bench_'))
+    print(f"{'format':>8} {'codec':>7} {'write s':>9} {'read s':>8} {'MiB':>8}")
+    try:
+        for file_format, codec, compress in cases:
+            case_dir = out_dir / f"{file_format}_{codec}"
+            start = time.perf_counter()
+            try:
+                # export_table reports progress on stdout; keep the results table readable
+                with contextlib.redirect_stdout(io.StringIO()):
+                    file_path = etf.export_table('fact_production_event', table, case_dir, 'fact', compress=compress,
+                                                 file_format=file_format, compression=codec)
+            except ImportError as exc:
+                print(f"{file_format:>8} {str(codec):>7} skipped: {exc}")
+                continue
+            write_s = time.perf_counter() - start
+            start = time.perf_counter()
+            etf.read_table(file_path)
+            read_s = time.perf_counter() - start
+            mib = file_path.stat().st_size / 2**20
+            results.append({'format': file_format, 'codec': codec, 'write_s': write_s, 'read_s': read_s, 'mib': mib})
+            print(f"{file_format:>8} {str(codec):>7} {write_s:>9.2f} {read_s:>8.2f} {mib:>8.1f}")
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+    return results
+
+def benchmark_parallel_export(num_events: int = 1_000_000, worker_counts=(1, 2, 4, 8), part_rows: int = 250_000,
+                              file_formats=('csv', 'parquet')) -> list:
+    """
+    Time `export_to_folder.export_tables` with different thread pool sizes.
+
+    The canonical tables are written with a synthetic `fact_production_event`
+    of `num_events` rows split into `part_rows` parts; the other tables are
+    empty placeholders. CSV is written gzipped. Only the pyarrow formats are
+    expected to speed up with more workers, since pandas holds the GIL while
+    formatting CSV rows.
+
+    Parameters
+    ----------
+    num_events : int, optional
+        Rows in the synthetic production event table (default 1M).
+    worker_counts : iterable of int, optional
+        `max_workers` values to time.
+    part_rows : int, optional
+        Rows per part file for fact tables.
+    file_formats : iterable of str, optional
+        Export formats to time (default CSV and Parquet).
+
+    Returns
+    -------
+    list of dict
+        One record per (format, worker count) with wall seconds and speed-up
+        over the first worker count of that format.
+    """
+    tables = {table: pd.DataFrame() for table in etf.CANONICAL_TABLES}
+    tables['fact_production_event'] = _synthetic_production_events(num_events)
+
+    results = []
+    out_dir = Path(tempfile.mkdtemp(prefix='export_bench_'))
+    base_dir = etf.BASE_DIR
+    print(f"{'format':>8} {'workers':>8} {'seconds':>9} {'speed-up':>9}")
+    try:
+        etf.BASE_DIR = out_dir
+        for file_format in file_formats:
+            baseline = None
+            for workers in worker_counts:
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    etf.export_tables(tables, 'BENCH', f'{file_format}_workers_{workers}', compress_data=True,
+                                      folder_pointer='bench', file_format=file_format, max_workers=workers, part_rows=part_rows)
+                elapsed = time.perf_counter() - start
+                baseline = baseline or elapsed
+                results.append({'format': file_format, 'workers': workers, 'seconds': elapsed, 'speed_up': baseline / elapsed})
+                print(f"{file_format:>8} {workers:>8} {elapsed:>9.2f} {baseline / elapsed:>9.2f}")
+    finally:
+        etf.BASE_DIR = base_dir
+        shutil.rmtree(out_dir, ignore_errors=True)
+    return results
+
+def benchmark_postgres_load(num_events: int = 200_000, schema: str = 'testing') -> list:
+    """
+    Compare PostgreSQL load throughput: `to_sql` multi-row INSERT vs COPY.
+
+    A synthetic production event table is loaded into a scratch table
+    `<schema>.benchmark_production_event` with each method of
+    `load_to_postgres.load_dataframe_to_postgres`; the scratch table is dropped
+    afterwards. Needs the `PG_*` environment variables of a reachable database.
+
+    Parameters
+    ----------
+    num_events : int, optional
+        Rows loaded per method (default 200k).
+    schema : str, optional
+        Existing schema for the scratch table (default 'testing').
+
+    Returns
+    -------
+    list of dict
+        One record per method with seconds and rows per second (empty if the
+        database is unreachable).
+    """
+    import load_to_postgres as ltp
+    from sqlalchemy import text
+
+    table_name = 'benchmark_production_event'
+    table = _synthetic_production_events(num_events)
+    try:
+        with ltp.get_engine().connect() as connection:
+            connection.execute(text('SELECT 1'))
+    except Exception as exc:
+        print(f"PostgreSQL not reachable, skipping: {exc!r}")
+        return []
+
+    results = []
+    print(f"{'method':>8} {'seconds':>9} {'rows/s':>12}")
+    try:
+        for method in ['insert', 'copy']:
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                ltp.load_dataframe_to_postgres(table, table_name, schema, exists_action='replace', method=method)
+            elapsed = time.perf_counter() - start
+            results.append({'method': method, 'seconds': elapsed, 'rows_per_s': num_events / elapsed})
+            print(f"{method:>8} {elapsed:>9.2f} {num_events / elapsed:>12,.0f}")
+    finally:
+        with ltp.get_engine().begin() as connection:
+            connection.execute(text(f'DROP TABLE IF EXISTS "{schema}"."{table_name}"'))
+    return results
+
+def benchmark_buffered_sampling(draws: int = 200_000, days: float = 30, block_sizes=(None, 4096), repeats: int = 3) -> list:
+    """
+    Compare scalar NumPy draws with `BufferedSampler`, per draw and in a full run.
+
+    Parameters
+    ----------
+    draws : int, optional
+        Scalar draws timed per distribution.
+    days : float, optional
+        Horizon of the simulated run (scenario C preset, seeded).
+    block_sizes : iterable, optional
+        `run_specs.rng_block_size` values to simulate (None is unbuffered).
+    repeats : int, optional
+        Number of timed repetitions of the per-draw loops (best run is reported).
+
+    Returns
+    -------
+    list of dict
+        One record per distribution (ns per draw, scalar and buffered) and
+        one per block size (SimPy events, seconds, events per second).
+
+    Notes
+    -----
+    Buffered draws take roughly half the time of scalar ones, but the run
+    throughput does not change measurably (e.g. 28,300 vs 28,200 events/s
+    over 5 days); SimPy event handling, not sampling, bounds a run.
+    """
+    import simpy
+    import run_simulation as rs
+    from Plant import Plant
+
+    calls = {
+        'normal': lambda rng: rng.normal(1.0, 0.1),
+        'lognormal': lambda rng: rng.lognormal(7.5, 0.6),
+        'gamma': lambda rng: rng.gamma(3.0, 400.0),
+        'exponential': lambda rng: rng.exponential(60000.0),
+        'integers': lambda rng: rng.integers(14400, 288000),
+    }
+    results = []
+    print(f"{'distribution':>14} {'scalar ns':>10} {'buffered ns':>12}")
+    for name, call in calls.items():
+        timings = {}
+        for label, rng in [('scalar', np.random.default_rng(2025)), ('buffered', BufferedSampler(np.random.default_rng(2025)))]:
+            timings[label] = _best_of(lambda: [call(rng) for _ in range(draws)], repeats) / draws * 1e9
+        results.append({'distribution': name, 'scalar_ns': timings['scalar'], 'buffered_ns': timings['buffered']})
+        print(f"{name:>14} {timings['scalar']:>10.0f} {timings['buffered']:>12.0f}")
+
+    config = rs.load_config(rs.CONFIG_DIR / 'scenario_C.toml')
+    config['run_specs']['sim_horizon_days'] = days
+    print(f"\n{'block_size':>10} {'events':>10} {'seconds':>9} {'events/s':>10}")
+    for block_size in block_sizes:
+        config['run_specs']['rng_block_size'] = block_size
+        rs.seed_module_rngs(2025)
+        env = simpy.Environment()
+        plant = Plant(env, 'benchmark', 'benchmark', config, rs.build_rngs(2025))
+        with contextlib.redirect_stdout(io.StringIO()):
+            env.process(plant.run())
+            start = time.perf_counter()
+            env.run(until=plant.done)
+            elapsed = time.perf_counter() - start
+        # Event IDs are issued sequentially, so the next ID is the number of scheduled events
+        events = next(env._eid)
+        results.append({'block_size': block_size, 'events': events, 'seconds': elapsed, 'events_per_second': events / elapsed})
+        print(f"{str(block_size):>10} {events:>10,} {elapsed:>9.2f} {events / elapsed:>10,.0f}")
+    return results
+
+def benchmark_step_scheduling(days: float = 30) -> list:
+    """
+    Count SimPy events per processing step for each failure clock, with and without the step fast path.
+
+    Parameters
+    ----------
+    days : float, optional
+        Horizon of the simulated runs (scenario C preset, seeded).
+
+    Returns
+    -------
+    list of dict
+        One record per (failure_clock, fast_path) setting: SimPy events,
+        production steps, events per step and seconds.
+    """
+    import simpy
+    import run_simulation as rs
+    from Plant import Plant
+
+    config = rs.load_config(rs.CONFIG_DIR / 'scenario_C.toml')
+    config['run_specs']['sim_horizon_days'] = days
+    results = []
+    print(f"{'failure_clock':>13} {'fast_path':>9} {'events':>10} {'steps':>8} {'events/step':>11} {'seconds':>8}")
+    for failure_clock in ('calendar', 'operating'):
+        for fast_path in (False, True):
+            config['run_specs'].update(failure_clock=failure_clock, fast_path=fast_path)
+            rs.seed_module_rngs(2025)
+            env = simpy.Environment()
+            plant = Plant(env, 'benchmark', 'benchmark', config, rs.build_rngs(2025))
+            with contextlib.redirect_stdout(io.StringIO()):
+                env.process(plant.run())
+                start = time.perf_counter()
+                env.run(until=plant.done)
+                elapsed = time.perf_counter() - start
+            # Event IDs are issued sequentially, so the next ID is the number of scheduled events
+            events = next(env._eid)
+            steps = sum(len(machine.production_log) for machine in plant.Machines)
+            results.append({'failure_clock': failure_clock, 'fast_path': fast_path, 'events': events,
+                            'steps': steps, 'events_per_step': events / steps, 'seconds': elapsed})
+            print(f"{failure_clock:>13} {str(fast_path):>9} {events:>10,} {steps:>8,} {events / steps:>11.2f} {elapsed:>8.2f}")
+    return results
+
+BENCHMARKS = {
+    'work_orders': benchmark_work_order_generation,
+    'lookup': benchmark_planned_quantity_lookup,
+    'event_memory': benchmark_event_log_memory,
+    'export_formats': benchmark_export_formats,
+    'parallel_export': benchmark_parallel_export,
+    'postgres_load': benchmark_postgres_load,
+    'buffered_sampling': benchmark_buffered_sampling,
+    'step_scheduling': benchmark_step_scheduling,
+}
+
+def main():
+    """
+    Command line entry point: run one or more named benchmarks.
+    """
+    parser = argparse.ArgumentParser(description="Run simulation micro-benchmarks.")
+    parser.add_argument('names', nargs='*', help=f"Benchmarks to run (default: all). Options: {', '.join(sorted(BENCHMARKS))}.")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    for name in args.names or sorted(BENCHMARKS):
+        print(f"\n== {name} ==")
+        BENCHMARKS[name]()
+
+if __name__ == '__main__':
+    main()
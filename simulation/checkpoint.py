@@ -0,0 +1,589 @@
+### Checkpoint Functions for Production Plant Simulation ###
+"""
+Checkpoint and resume of a running simulation.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+Long time-driven runs can take hours; a crash near the end used to mean
+starting over. This module snapshots the complete simulation state at fixed
+simulated-time intervals and rebuilds a plant from the latest snapshot, so a
+resumed run produces exactly the same output as an uninterrupted seeded run.
+
+State Model
+-----------
+SimPy processes are Python generators and cannot be pickled, so a checkpoint
+stores an explicit description of every suspended process instead:
+
+- Machines: flags and quantities, the pending failure timeout (or, with
+  operating-time failures, the operating time left to the next failure), the logged
+  rows not yet flushed (`EventBuffer.snapshot`) and, for a step in progress,
+  `Machine.step_state` (cycle time, remaining time, interrupt counter, and
+  whether it waits on a processing segment or a repair). Fast-path steps
+  (`Machine.hold_step`) are restored as fast-path steps of their work order.
+- Work orders: `Plant.work_order_state` (step index, current quantity,
+  machine) plus each machine type's granted and queued resource requests.
+- Release process: `Plant.release_phase` ('interarrival', 'wip' or 'drain'),
+  the unreleased part of the current batch, the release horizon (time mode)
+  and the position in the release order (volume mode).
+- Warm-up detection samples (`Plant.steady_state_samples`) and the pending
+  sampling timeout.
+- Plant tables, the work order staging store, work order start/end times,
+  every RNG bit-generator state (the injected streams and the module-level
+  `local_rng` generators), the Machine ID counters and the number of chunk
+  files each event table has in the event sink.
+- Common random numbers: the root seed and the state of every machine's and
+  in-flight work order's substreams.
+- Buffered sampling: the unserved variates of every `BufferedSampler`.
+
+Key Behavior / Conventions
+--------------------------
+- Checkpoints are taken from the outer driver between `env.run(until=T)`
+  calls, when every event before T has been processed and none at T has.
+- Each pending timeout is stored with its absolute time, priority and event
+  ID. On resume the timeouts are pushed onto the new environment's queue at
+  the same absolute times in the original ID order, so events that share a
+  timestamp fire in the original order. Orphaned timeouts (segments cut short
+  by a failure) have no callbacks and are dropped.
+- Restored processes start directly at their suspension point with the
+  restored event (`resume` arguments of `Machine.process_order`,
+  `Plant.run_work_order` and the release processes).
+- The checkpoint is one pickle file, written to a temporary name and renamed
+  into place, so a crash while writing keeps the previous checkpoint.
+
+Warm Start
+----------
+The same state doubles as a steady-state snapshot: `warm_start_plant`
+restores a snapshot taken after the warm-up of a time-driven run (WIP in
+process, machine states, queue contents) but starts a new observation
+period from it. The event logs and completed work orders of the warm-up are
+dropped, the RNG streams are replaced by the new run's streams and release
+continues for `sim_horizon_days` past the snapshot time. Simulation times
+keep counting from the warm-up run's start. Timeouts already pending in the
+snapshot (failure timers, cycle segments, repairs) keep their sampled
+durations, so replications share those first events. The new run must use
+the snapshot's plant structure and failure clock (`STRUCTURE_SETTINGS`).
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import copy
+import heapq
+import math
+import os
+import pickle
+from itertools import count
+from pathlib import Path
+
+import numpy as np
+import simpy
+from simpy.core import StopSimulation
+
+import Machine
+import data_generators as dg
+import helper_functions as hf
+from Plant import Plant
+
+####################################################################
+
+# Bump when the state model changes in a way old checkpoints cannot be restored from
+CHECKPOINT_VERSION = 1
+
+# Checkpoint file name inside a run folder
+CHECKPOINT_FILE = 'checkpoint.pkl'
+
+# Machine attributes holding the per-machine event logs
+LOG_NAMES = ['production_log', 'downtime_log', 'quality_log']
+
+# Module-level ID counters of `Machine`
+ID_COUNTERS = ['_event_id_counter', '_batch_id_counter', '_downtime_id_counter', '_quality_id_counter']
+
+# Modules whose fallback `local_rng` generators are part of the state
+MODULE_RNGS = {'Machine': Machine, 'helper_functions': hf, 'data_generators': dg}
+
+# Config settings a warm start must share with its snapshot (they determine the plant
+# structure and which failure events are pending)
+STRUCTURE_SETTINGS = ['num_machines', 'num_products', 'step_bounds', 'product_family_weights', 'failure_clock']
+
+# Scalar Machine attributes saved as-is
+MACHINE_ATTRIBUTES = ['is_operational', 'is_busy', 'current_work_order', 'start_quantity', 'end_quantity', 'operating_ttf', 'next_failure_time']
+
+####################################################################
+## Function Definitions ##
+####################################################################
+
+def _peek_counter(name):
+    """
+    Return the next value of a Machine ID counter without consuming it.
+    """
+    value = next(getattr(Machine, name))
+    setattr(Machine, name, count(value))
+    return value
+
+def capture_state(plant, metadata=None) -> dict:
+    """
+    Describe the complete state of a paused simulation.
+
+    Must be called between `env.run(until=...)` calls (see `run_with_checkpoints`).
+
+    Parameters
+    ----------
+    plant : Plant
+        Plant whose environment is paused.
+    metadata : dict, optional
+        Extra run information stored with the state (e.g. run_id, folder, seed).
+
+    Returns
+    -------
+    dict
+        Picklable state (see module docstring).
+
+    Raises
+    ------
+    RuntimeError
+        If a process waits on an event the state model does not cover.
+    """
+    env = plant.env
+    queued = {id(event): (time, priority, eid) for time, priority, eid, event in env._queue}
+    captured = set()
+
+    def pending(event):
+        entry = queued.get(id(event))
+        if entry is None:
+            raise RuntimeError(f"Cannot checkpoint: {event!r} is not a scheduled event")
+        captured.add(id(event))
+        return entry
+
+    # Machines: flags, pending failure, step in progress, unflushed logs
+    machine_index = {id(machine): i for i, machine in enumerate(plant.Machines)}
+    machines = []
+    for machine in plant.Machines:
+        step = None
+        if machine.current_process is not None:
+            step = dict(machine.step_state)
+            step['event'] = pending(machine.current_process.target)
+        saved = {name: getattr(machine, name) for name in MACHINE_ATTRIBUTES}
+        saved['failure_event'] = pending(machine.failure_process.target) if machine.failure_process is not None else None
+        saved['step'] = step
+        saved['logs'] = {name: getattr(machine, name).snapshot() for name in LOG_NAMES}
+        saved['substreams'] = {name: rng.bit_generator.state for name, rng in machine.entity_rngs.items()}
+        machines.append(saved)
+
+    # Work orders in flight and the resource requests they hold or wait on
+    owners = {}
+    work_orders = {}
+    for work_order_id, state in plant.work_order_state.items():
+        owners[id(state['request'])] = work_order_id
+        owners[id(state['process'])] = work_order_id
+        target = state['process'].target
+        if state['machine'] is None and target is not state['request']:
+            raise RuntimeError(f"Cannot checkpoint: work order {work_order_id} waits on {target!r}")
+        work_orders[work_order_id] = {
+            'step_index': state['step_index'],
+            'current_quantity': state['current_quantity'],
+            'machine': None if state['machine'] is None else machine_index[id(state['machine'])],
+        }
+    resources = {}
+    for machine_type, wrapper in plant.machine_types.items():
+        requests = {'users': wrapper.resource.users, 'queue': wrapper.resource.queue}
+        for kind, items in requests.items():
+            if any(id(request) not in owners for request in items):
+                raise RuntimeError(f"Cannot checkpoint: unknown request in the {kind} of {machine_type}")
+        resources[machine_type] = {kind: [owners[id(request)] for request in items] for kind, items in requests.items()}
+    active = [owners[id(process)] for process in plant.active_work_orders if not process.triggered]
+
+    # Release process
+    release = {
+        'phase': plant.release_phase,
+        'backlog': list(plant.release_backlog),
+        'ids': list(plant.release_ids),
+        'position': plant.release_position,
+        'horizon': plant.release_horizon,
+        'event': None if plant.release_phase == 'drain' else pending(plant.release_process.target),
+    }
+
+    # Warm-up detection samples and the pending sampling timeout
+    monitor_process = plant.monitor_process
+    monitor = {
+        'samples': {name: list(values) for name, values in plant.steady_state_samples.items()},
+        'event': pending(monitor_process.target) if monitor_process is not None and monitor_process.is_alive else None,
+        'precision_stop_time': plant.precision_stop_time,
+    }
+
+    # Anything else still scheduled must be an orphaned event nobody waits on
+    for time, priority, eid, event in env._queue:
+        if id(event) not in captured and event.callbacks:
+            raise RuntimeError(f"Cannot checkpoint: unrecognized pending event {event!r} at t={time}")
+
+    sink = plant.event_sink
+    return {
+        'version': CHECKPOINT_VERSION,
+        'now': env.now,
+        'metadata': dict(metadata or {}),
+        'scenario_id': plant.scenario_id,
+        'scenario_name': plant.scenario_name,
+        'config': plant.config,
+        'rngs': {name: rng.bit_generator.state for name, rng in plant.rngs.items()},
+        'module_rngs': {name: module.local_rng.bit_generator.state for name, module in MODULE_RNGS.items()},
+        'crn': {
+            'seed': plant.crn_seed,
+            'work_orders': {work_order_id: {name: rng.bit_generator.state for name, rng in rngs.items()}
+                            for work_order_id, rngs in plant.work_order_rngs.items()},
+        },
+        'samplers': {name: sampler.snapshot() for name, sampler in plant.samplers.items()},
+        'id_counters': {name: _peek_counter(name) for name in ID_COUNTERS},
+        'sink_parts': None if sink is None else {table: sink.part_count(table) for table in {getattr(plant.Machines[0], name).table_name for name in LOG_NAMES}},
+        'tables': {
+            'dim_machine': plant.dim_machine,
+            'dim_product': plant.dim_product,
+            'dim_process': plant.dim_process,
+            'dim_process_route': plant.dim_process_route,
+        },
+        'work_order_staging': plant.work_order_staging,
+        'work_order_start_times': plant.work_order_start_times,
+        'work_order_end_times': plant.work_order_end_times,
+        'warm_start_completed': set(plant.warm_start_completed),
+        'machines': machines,
+        'work_orders': work_orders,
+        'resources': resources,
+        'active_work_orders': active,
+        'release': release,
+        'monitor': monitor,
+    }
+
+def save_checkpoint(plant, path, metadata=None) -> Path:
+    """
+    Capture the plant state and write it atomically to `path`.
+
+    Parameters
+    ----------
+    plant : Plant
+    path : str or pathlib.Path
+    metadata : dict, optional
+        See `capture_state`.
+
+    Returns
+    -------
+    pathlib.Path
+    """
+    state = capture_state(plant, metadata)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return path
+
+def load_checkpoint(path) -> dict:
+    """
+    Read a checkpoint written by `save_checkpoint`.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Checkpoint file, or a run folder containing `CHECKPOINT_FILE`.
+
+    Returns
+    -------
+    dict
+
+    Raises
+    ------
+    FileNotFoundError
+        If no checkpoint exists at `path`.
+    ValueError
+        If the checkpoint was written by an incompatible version.
+    """
+    path = Path(path)
+    if path.is_dir():
+        path = path / CHECKPOINT_FILE
+    with open(path, 'rb') as f:
+        state = pickle.load(f)
+    if state.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"Checkpoint {path} has version {state.get('version')}, expected {CHECKPOINT_VERSION}")
+    return state
+
+def _restore_generator(state):
+    """
+    Build a NumPy Generator from a saved bit-generator state.
+    """
+    rng = np.random.Generator(getattr(np.random, state['bit_generator'])())
+    rng.bit_generator.state = state
+    return rng
+
+def restore_plant(state, event_sink=None) -> Plant:
+    """
+    Rebuild a paused plant, its environment and all processes from a checkpoint.
+
+    The module-level RNGs and ID counters are reset to the checkpoint as a
+    side effect. Continue the run with `run_with_checkpoints` or
+    `plant.env.run(until=plant.done)`.
+
+    Parameters
+    ----------
+    state : dict
+        Result of `load_checkpoint`.
+    event_sink : EventSink, optional
+        Sink over the same folder as the interrupted run; parts written after
+        the checkpoint are deleted.
+
+    Returns
+    -------
+    Plant
+        Plant attached to a new `simpy.Environment` starting at the checkpoint time.
+    """
+    env = simpy.Environment(initial_time=state['now'])
+    rngs = {name: _restore_generator(rng_state) for name, rng_state in state['rngs'].items()}
+    config = state['config']
+    plant = Plant(env, state['scenario_id'], state['scenario_name'], config, rngs, event_sink=event_sink)
+
+    # Module-level generators (reset in place, see run_simulation.seed_module_rngs) and ID counters
+    for name, module in MODULE_RNGS.items():
+        module.local_rng.bit_generator.state = state['module_rngs'][name]
+    for name, value in state['id_counters'].items():
+        setattr(Machine, name, count(value))
+
+    # Common-random-numbers root seed (before the machines derive their substreams from it)
+    crn = state.get('crn') or {'seed': None, 'work_orders': {}}
+    if plant.crn and crn['seed'] is not None:
+        plant.crn_seed = crn['seed']
+        plant.work_order_rngs = {work_order_id: {name: _restore_generator(rng_state) for name, rng_state in rngs.items()}
+                                 for work_order_id, rngs in crn['work_orders'].items()}
+
+    # Structure, machines and tables
+    tables = state['tables']
+    plant.dim_machine = plant.build_machines(tables['dim_machine'], start_failures=False)
+    plant.build_machine_type_resources()
+    plant.dim_product = tables['dim_product']
+    plant.dim_process = tables['dim_process']
+    plant.dim_process_route = tables['dim_process_route']
+    plant.route_templates = hf.build_route_templates(plant.dim_process, plant.dim_process_route)
+    plant.work_order_staging = state['work_order_staging']
+    plant.work_order_start_times = state['work_order_start_times']
+    plant.work_order_end_times = state['work_order_end_times']
+    plant.warm_start_completed = set(state['warm_start_completed'])
+
+    release = state['release']
+    plant.release_phase = release['phase']
+    plant.release_backlog = list(release['backlog'])
+    plant.release_ids = list(release['ids'])
+    plant.release_position = release['position']
+
+    for machine, saved in zip(plant.Machines, state['machines']):
+        for name in MACHINE_ATTRIBUTES:
+            setattr(machine, name, saved[name])
+        for name, snapshot in saved['logs'].items():
+            getattr(machine, name).restore(snapshot)
+        if plant.crn and crn['seed'] is not None:
+            for name, rng in machine.entity_rngs.items():
+                rng.bit_generator.state = saved['substreams'][name]
+    for name, snapshot in state.get('samplers', {}).items():
+        if name in plant.samplers:
+            plant.samplers[name].restore(snapshot)
+    if event_sink is not None and state['sink_parts']:
+        for table, parts in state['sink_parts'].items():
+            event_sink.truncate(table, parts)
+
+    # Resource requests: granted ones first (capacity allows them), then the FIFO queue
+    requests = {}
+    for machine_type, saved in state['resources'].items():
+        resource = plant.machine_types[machine_type].resource
+        for work_order_id in saved['users'] + saved['queue']:
+            requests[work_order_id] = resource.request()
+        if len(resource.users) != len(saved['users']):
+            raise RuntimeError(f"Restored resource {machine_type} does not match the checkpoint")
+
+    # Pending timeouts at their original absolute times, in original event order
+    schedule = [(saved['failure_event'], ('failure', i)) for i, saved in enumerate(state['machines']) if saved['failure_event']]
+    schedule += [(saved['step']['event'], ('step', i)) for i, saved in enumerate(state['machines']) if saved['step']]
+    if release['event'] is not None:
+        schedule.append((release['event'], ('release',)))
+    monitor = state['monitor']
+    if monitor['event'] is not None:
+        schedule.append((monitor['event'], ('monitor',)))
+    events = {}
+    for (time, priority, _), key in sorted(schedule, key=lambda item: item[0]):
+        event = simpy.Event(env)
+        event._ok = True
+        event._value = None
+        heapq.heappush(env._queue, (time, priority, next(env._eid), event))
+        events[key] = event
+
+    # Processes, each starting at its suspension point
+    for i, machine in enumerate(plant.Machines):
+        if ('failure', i) in events:
+            machine.start_failure_process(config['time_to_failure'], events[('failure', i)])
+
+    step_processes = {}
+    step_events = {}
+    for i, (machine, saved) in enumerate(zip(plant.Machines, state['machines'])):
+        if saved['step'] and saved['step'].get('fast'):
+            # Fast-path step: its work order process waits on the timeout itself
+            machine.step_state = {name: value for name, value in saved['step'].items() if name != 'event'}
+            step_events[i] = events[('step', i)]
+        elif saved['step']:
+            step = dict(saved['step'], event=events[('step', i)])
+            step_processes[i] = env.process(machine.process_order(
+                env, step['work_order_id'], step['step_number'], step['num_steps'], step['process_id'],
+                step['process_route_id'], step['target_yield'], machine.start_quantity,
+                config['process_noise'], config['repair_behavior'], config['quality'], resume=step,
+                rngs=plant.work_order_substreams(step['work_order_id'])))
+            machine.current_process = step_processes[i]
+
+    for work_order_id in state['active_work_orders']:
+        saved = state['work_orders'][work_order_id]
+        machine_id = saved['machine']
+        process = plant.release_work_order(work_order_id, resume={
+            'step_index': saved['step_index'],
+            'current_quantity': saved['current_quantity'],
+            'request': requests[work_order_id],
+            'machine': None if machine_id is None else plant.Machines[machine_id],
+            'step_process': step_processes.get(machine_id),
+            'step_event': step_events.get(machine_id),
+        })
+        if machine_id in step_events:
+            plant.Machines[machine_id].current_process = process
+
+    plant.steady_state_samples = {name: list(values) for name, values in monitor['samples'].items()}
+    plant.precision_stop_time = monitor['precision_stop_time']
+    if monitor['event'] is not None:
+        interval = config['run_specs'].get('warmup_sample_interval') or 3600
+        env.process(plant.steady_state_monitor(interval, resume=events[('monitor',)]))
+
+    release_event = events.get(('release',))
+    if config['run_specs']['run_mode'] == 'time':
+        sim_horizon = release['horizon'] or config['run_specs']['sim_horizon_days'] * 24 * 3600
+        env.process(plant.work_order_release_process(sim_horizon, resume=release_event))
+    else:
+        env.process(plant.run_volume_driven(resume=release_event))
+
+    print(f"Simulation restored at t={state['now']:,.0f}s ({len(state['active_work_orders'])} work orders in flight).\n")
+    return plant
+
+def warm_start_plant(state, scenario_id, scenario_name, rngs, config=None, event_sink=None) -> Plant:
+    """
+    Start a new time-driven run from a steady-state snapshot.
+
+    The plant is restored as in `restore_plant`, then the warm-up's event
+    logs and completed work orders are discarded, the plant's RNG streams
+    are reset in place to `rngs` and release continues for
+    `sim_horizon_days` after the snapshot time. The module-level generators
+    keep their current state, so seed them first
+    (`run_simulation.seed_module_rngs`) for a reproducible replication.
+
+    Parameters
+    ----------
+    state : dict
+        Snapshot from `load_checkpoint`, taken before the release horizon of a
+        time-driven run.
+    scenario_id : str
+        Scenario identifier of the new run.
+    scenario_name : str
+        Scenario description of the new run.
+    rngs : dict
+        RNG streams of the new run (see `run_simulation.build_rngs`).
+    config : dict, optional
+        Configuration of the new run (default: the snapshot's). Release and
+        stochastic settings may differ from the snapshot; `STRUCTURE_SETTINGS`
+        may not.
+    event_sink : EventSink, optional
+        Sink of the new run.
+
+    Returns
+    -------
+    Plant
+
+    Raises
+    ------
+    ValueError
+        If the snapshot is not from a time-driven run, was taken after the
+        release horizon, or does not match the structure or failure clock of `config`.
+    """
+    if state['config']['run_specs']['run_mode'] != 'time' or state['release']['phase'] == 'drain':
+        raise ValueError("Warm start needs a snapshot taken during the release period of a time-driven run")
+    config = copy.deepcopy(state['config'] if config is None else config)
+    if config['run_specs']['run_mode'] != 'time':
+        raise ValueError("Warm start is only supported for time-driven runs")
+    snapshot_settings = {**state['config'], **state['config']['run_specs']}
+    settings = {**config, **config['run_specs']}
+    mismatched = [key for key in STRUCTURE_SETTINGS if settings[key] != snapshot_settings[key]]
+    if mismatched:
+        raise ValueError(f"Config does not match the snapshot's plant structure or failure clock: {', '.join(mismatched)}")
+
+    # Restore under the new run's identity, with no sink history and a horizon relative to the snapshot
+    horizon = state['now'] + config['run_specs']['sim_horizon_days'] * 24 * 3600
+    warm_state = dict(state, scenario_id=scenario_id, scenario_name=scenario_name, config=config,
+                      sink_parts=None, release=dict(state['release'], horizon=horizon))
+    module_states = {name: module.local_rng.bit_generator.state for name, module in MODULE_RNGS.items()}
+    plant = restore_plant(warm_state, event_sink=event_sink)
+
+    # New random streams (in place, so machines holding references see them too)
+    for name, module in MODULE_RNGS.items():
+        module.local_rng.bit_generator.state = module_states[name]
+    for name, rng in plant.rngs.items():
+        rng.bit_generator.state = rngs[name].bit_generator.state
+    for sampler in plant.samplers.values():
+        sampler.reset()
+    if plant.crn:
+        plant.crn_seed = int(plant.rngs['processing'].integers(2**63))
+        for i, machine in enumerate(plant.Machines):
+            for name, rng in machine.entity_rngs.items():
+                rng.bit_generator.state = plant.entity_rng(name, i).bit_generator.state
+        for work_order_id, substreams in plant.work_order_rngs.items():
+            row = plant.work_order_staging.row_index[work_order_id]
+            for name, rng in substreams.items():
+                rng.bit_generator.state = plant.entity_rng(name, row).bit_generator.state
+
+    # Start the observation period with empty logs and only the work orders still in flight
+    for machine in plant.Machines:
+        for name in LOG_NAMES:
+            getattr(machine, name).clear()
+    plant.warm_start_completed = set(plant.warm_start_completed) | set(plant.work_order_end_times)
+    plant.work_order_start_times = {work_order_id: start for work_order_id, start in plant.work_order_start_times.items()
+                                    if work_order_id not in plant.warm_start_completed}
+    plant.work_order_end_times = {}
+    plant.steady_state_samples = {name: [] for name in plant.steady_state_samples}
+    plant.precision_stop_time = None
+    monitored = config['run_specs'].get('warmup_detection') or config['run_specs'].get('precision_target')
+    if monitored and state['monitor']['event'] is None:
+        plant.env.process(plant.steady_state_monitor(config['run_specs'].get('warmup_sample_interval') or 3600))
+
+    print(f"Warm start from t={state['now'] / 86400:,.2f} days; observing until t={horizon / 86400:,.2f} days.\n")
+    return plant
+
+def run_with_checkpoints(plant, interval, path, metadata=None):
+    """
+    Run a plant until `plant.done`, writing a checkpoint every `interval` simulated seconds.
+
+    Checkpoint times lie on a fixed grid (multiples of `interval`), so a
+    resumed run checkpoints at the same times as the original.
+
+    Parameters
+    ----------
+    plant : Plant
+        Plant with its processes started (fresh or from `restore_plant`).
+    interval : float
+        Simulated seconds between checkpoints.
+    path : str or pathlib.Path
+        Checkpoint file, overwritten at every checkpoint.
+    metadata : dict, optional
+        See `capture_state`.
+    """
+    if interval <= 0:
+        raise ValueError(f"Checkpoint interval must be positive, not {interval}")
+    env = plant.env
+    plant.done.callbacks.append(StopSimulation.callback)
+    next_checkpoint = (math.floor(env.now / interval) + 1) * interval
+    while True:
+        env.run(until=next_checkpoint)
+        # `done` triggers inside the run and stops it before the next checkpoint time
+        if plant.done.triggered:
+            break
+        save_checkpoint(plant, path, metadata)
+        print(f"Checkpoint written at t={env.now / 86400:,.2f} days: {path}\n")
+        next_checkpoint += interval
@@ -403,131 +403,109 @@ def create_products_with_processes(
 # -----------------------------------------------------------------------------
 # fact_work_order generation
 # -----------------------------------------------------------------------------
-def create_work_orders(
+def create_work_order_batch(
     dim_product: pd.DataFrame,
-    fact_work_order: Optional[pd.DataFrame] = None,
-    num_work_orders: int=1,
+    num_work_orders: int = 1,
     rngs: Optional[dict] = None,
-) -> tuple[pd.DataFrame, pd.DataFrame]:
+    existing_ids: Optional[set] = None,
+    start_index: int = 0,
+) -> pd.DataFrame:
     """
-    Create and/or append synthetic work orders.
+    Generate a block of synthetic work orders with vectorized sampling.
 
     Description
     ----------
-    Generates `num_work_orders` new work orders for products in `dim_product`.
-    If `fact_work_order` is provided, new rows are appended while preserving
-    the existing index structure; if not provided, a new work order DataFrame
-    is created.
+    Every column is drawn as a NumPy array in a single call per attribute
+    (IDs, start dates, lead times, quantities, batch sizes, priorities and
+    product ids), so the cost grows linearly with `num_work_orders` and no
+    per-row Python loop or date-range rebuild is involved.
 
     Behavior notes
     --------------
-    - Work order IDs are generated with the prefix "WO-25" and are guaranteed
-      unique with respect to the provided `fact_work_order`.
-    - Start/due dates are sampled in 2025 and due dates include a small lead
-      time (3-21 days) ensuring due > start.
-    - `planned_quantity` and `batch_size` are sampled to create realistic
-      batching behavior; `batch_size` uses a lower bound of 10 and an
-      upper bound of half the planned quantity (or 11 to avoid zero).
-    - The function returns a tuple: (updated_fact_work_order, new_work_orders)
+    - Work order IDs use the "WO-25" prefix. IDs colliding with
+      `existing_ids` or with other IDs in the same block are redrawn until
+      the block is unique.
+    - Start dates are sampled uniformly in 2025, leaving room for the
+      maximum slack; due dates add a 3-20 day lead time.
+    - `batch_size` is drawn in `[10, max(11, planned_quantity // 2))`.
+    - `target_yield_rate` is looked up from `dim_product` by position.
 
     Parameters
     ----------
     dim_product : pandas.DataFrame
         Product table (used for sampling `product_id` and pulling target yields).
-    fact_work_order : pandas.DataFrame, optional
-        Existing work order table to append to; if None a new DataFrame is created.
     num_work_orders : int, optional
         Number of new work orders to generate (default 1).
     rngs : dict, optional
         Optional RNG dict; expected key: 'structure'.
+    existing_ids : set, optional
+        Work order IDs (any set-like container) that are already in use and
+        must not be reissued.
+    start_index : int, optional
+        First index label assigned to the generated rows (default 0).
 
     Returns
     -------
-    tuple(pandas.DataFrame, pandas.DataFrame)
-        (full_work_order_table, new_work_orders_table)
+    pandas.DataFrame
+        New work order rows indexed from `start_index`.
     """
     # Select RNG
     if not rngs:
         rng = local_rng
     else:
         rng = rngs['structure']
-    
-    # Initialize existing table if not provided
-    if fact_work_order is None:
-        fact_work_order = pd.DataFrame(columns=['work_order_id','product_id','planned_quantity','batch_size','start_date','due_date','priority'])
-    
-    exisiting_ids = set(fact_work_order['work_order_id'].values)
-    generated_ids = set()
+
+    if existing_ids is None:
+        existing_ids = set()
 
     # Set of priority options (0-3) for sampling
     priority_options = [0, 1, 2, 3]
 
-    # Sample product IDs and pull corresponding target yield rates for work order generation
+    # Product IDs and target yields used for sampling and lookup
     product_id_S = dim_product['product_id'].values
     product_yield_S = dim_product['target_yield_rate'].values
-    yield_rate_key = dict(zip(product_id_S, product_yield_S))
 
     # Date sampling window and safe end date (room for lead time)
     st_date, ed_date = np.datetime64('2025-01-01'), np.datetime64('2025-12-31')
     max_slack_allowed = 30
     safe_end_date = ed_date - np.timedelta64(max_slack_allowed, 'D')
+    num_days = int((safe_end_date - st_date) / np.timedelta64(1, 'D')) + 1
+
+    # Draw IDs for the whole block, then redraw only the positions that collide
+    # (uniqueness is checked on the integers; the string form is a bijection)
+    id_numbers = rng.integers(low=1, high=1000000000, size=num_work_orders)
+    while True:
+        work_order_id = np.array(['WO-25' + str(num) for num in id_numbers.tolist()], dtype=object)
+        _, first_idx = np.unique(id_numbers, return_index=True)
+        collides = np.ones(num_work_orders, dtype=bool)
+        collides[first_idx] = False
+        if existing_ids:
+            collides |= np.fromiter((wo_id in existing_ids for wo_id in work_order_id), dtype=bool, count=num_work_orders)
+        if not collides.any():
+            break
+        id_numbers[collides] = rng.integers(low=1, high=1000000000, size=int(collides.sum()))
+
+    # Sample start/due dates and validate ordering
+    start_offsets = rng.integers(low=0, high=num_days, size=num_work_orders)
+    start_date = (st_date + start_offsets.astype('timedelta64[D]')).astype('datetime64[ns]')
+    lead_times = rng.integers(3, 21, size=num_work_orders)
+    due_date = start_date + lead_times.astype('timedelta64[D]')
+    if (due_date <= start_date).any():
+        bad = int(np.argmax(due_date <= start_date))
+        raise ValueError(
+            f"Invalid due date generated: start={start_date[bad]}, due={due_date[bad]}"
+        )
 
-    # Buffers for generated rows
-    work_order_id = []
-    start_date = []
-    due_date = []
-    planned_quantity = []
-    batch_size = []
-    priority = []
-    product_id = []
-    idx = []
-
-    # Loop to generate specified number of work orders with unique IDs and realistic attributes
-    for i in range(0, num_work_orders):
-        # Ensure unique work_order_id
-        while True:
-            wo_id = 'WO-25' + str(rng.integers(low=1, high=1000000000))
-            if wo_id in exisiting_ids or wo_id in generated_ids:
-                # If pre-exisiting, generates a new work order id and checks again
-                continue
-            generated_ids.add(wo_id)
-            work_order_id.append(wo_id)
-            
-            # Indexing logic to ensure new rows are appended correctly to existing table structure
-            if i == 0:
-                # If first run, appends to end of table (which will be index 0 if original table was empty)
-                idx.append(len(fact_work_order))
-                idx_temp = idx[0] + 1
-                break
-            else:
-                # Create list of required indices for final table input
-                idx.append(idx_temp)
-                idx_temp += 1
-                break
-
-        # Sample realistic start/due dates and validate ordering
-        start_date.append(rng.choice(pd.date_range(st_date, safe_end_date, freq='D').to_numpy()))
-        lead_times = rng.integers(3,21)
-        due_date.append(start_date[i] + np.timedelta64(lead_times, 'D'))
-        if due_date[-1] <= start_date[-1]:
-            raise ValueError(
-                f"Invalid due date generated: start={start_date[-1]}, due={due_date[-1]}"
-            )
-
-        # Quantity and batching
-        planned_quantity.append(rng.integers(low=100, high=2000))
-        batch_size.append(rng.integers(low=10,high=max(11, planned_quantity[i] // 2)))
-        priority.append(rng.choice(priority_options))
-        product_id.append(rng.choice(product_id_S))
-        
-        # Map product IDs to their target yields for returned rows
-        target_yield_rate = []
-        for ID in product_id:
-            target_yield_rate.append(yield_rate_key[ID])
-        target_yield_rate = np.asarray(target_yield_rate)
+    # Quantity and batching
+    planned_quantity = rng.integers(low=100, high=2000, size=num_work_orders)
+    batch_size = rng.integers(low=10, high=np.maximum(11, planned_quantity // 2))
+    priority = rng.choice(priority_options, size=num_work_orders)
+    product_pos = rng.integers(low=0, high=len(product_id_S), size=num_work_orders)
+    product_id = product_id_S[product_pos]
+    target_yield_rate = product_yield_S[product_pos]
 
-    # New rows DataFrame (df1) and appended result (df)
-    df1 = pd.DataFrame(
+    # Output
+    return pd.DataFrame(
         {
             'work_order_id': work_order_id,
             'product_id': product_id,
@@ -537,9 +515,68 @@ def create_work_orders(
             'start_date': start_date,
             'due_date': due_date,
             'priority': priority,
-            }, index = idx
+            }, index = np.arange(start_index, start_index + num_work_orders)
         )
 
+def create_work_orders(
+    dim_product: pd.DataFrame,
+    fact_work_order: Optional[pd.DataFrame] = None,
+    num_work_orders: int=1,
+    rngs: Optional[dict] = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Create and/or append synthetic work orders.
+
+    Description
+    ----------
+    Generates `num_work_orders` new work orders for products in `dim_product`.
+    If `fact_work_order` is provided, new rows are appended while preserving
+    the existing index structure; if not provided, a new work order DataFrame
+    is created.
+
+    Behavior notes
+    --------------
+    - Row generation is delegated to `create_work_order_batch`, which samples
+      every column in one vectorized draw.
+    - Work order IDs are generated with the prefix "WO-25" and are guaranteed
+      unique with respect to the provided `fact_work_order`.
+    - Start/due dates are sampled in 2025 and due dates include a small lead
+      time (3-20 days) ensuring due > start.
+    - `planned_quantity` and `batch_size` are sampled to create realistic
+      batching behavior; `batch_size` uses a lower bound of 10 and an
+      upper bound of half the planned quantity (or 11 to avoid zero).
+    - The function returns a tuple: (updated_fact_work_order, new_work_orders)
+
+    Parameters
+    ----------
+    dim_product : pandas.DataFrame
+        Product table (used for sampling `product_id` and pulling target yields).
+    fact_work_order : pandas.DataFrame, optional
+        Existing work order table to append to; if None a new DataFrame is created.
+    num_work_orders : int, optional
+        Number of new work orders to generate (default 1).
+    rngs : dict, optional
+        Optional RNG dict; expected key: 'structure'.
+
+    Returns
+    -------
+    tuple(pandas.DataFrame, pandas.DataFrame)
+        (full_work_order_table, new_work_orders_table)
+    """
+    # Initialize existing table if not provided
+    if fact_work_order is None:
+        fact_work_order = pd.DataFrame(columns=['work_order_id','product_id','planned_quantity','batch_size','start_date','due_date','priority'])
+
+    # Generate the new block, indexed to follow the existing table
+    exisiting_ids = set(fact_work_order['work_order_id'].values)
+    df1 = create_work_order_batch(
+        dim_product,
+        num_work_orders=num_work_orders,
+        rngs=rngs,
+        existing_ids=exisiting_ids,
+        start_index=len(fact_work_order),
+    )
+
     # Check whether the original work order table used for input was empty
     if fact_work_order.empty:
         df = df1
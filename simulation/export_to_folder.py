@@ -10,30 +10,44 @@ Purpose
 -------
 Provide functions to persist simulation result DataFrames to a structured
 directory on disk and to produce a manifest describing the run. The module
-supports optional gzip compression for CSV outputs and writes a manifest.json
-that lists table filenames and row counts for downstream ingestion or auditing.
+supports optional gzip compression for CSV outputs, Parquet and Arrow IPC
+(feather) outputs, and writes a manifest.json that lists table filenames,
+formats, sizes, schemas and row counts for downstream ingestion or auditing.
 
 Key Behavior / Conventions
 --------------------------
+- `run_directory()`:
+    * Returns the run folder path shared by `export_tables()` and the streaming event sink.
+
 - `export_tables()`:
     * Creates a run-specific directory under `BASE_DIR / data / <folder_pointer> / <scenario_id> / <safe_run_id>`.
     * Iterates a canonical table list and delegates per-table writes to `export_table`.
+    * `max_workers > 1` writes tables concurrently on a bounded thread pool; `part_rows`
+      splits large fact tables into `<table>/part-<n>` files so they compress in parallel.
+      Only the pyarrow formats scale with threads: CSV formatting in pandas holds the GIL.
+      With a pool, workers write silently and progress is printed by the calling thread.
+    * Event tables streamed to the event sink (`EventSink.ChunkedTable`) are written as one
+      `<table>/part-<n>` file per sink chunk, reading each chunk only while it is written.
     * Accepts `compress_data` to toggle writing `.csv` vs `.csv.gz` files.
+    * Accepts `file_format='parquet'` or `file_format='feather'` (Arrow IPC, `.arrow`) with a per-table
+      `compression` codec and `row_group_size` for fact tables; these need `pyarrow`.
 
 - `export_table()`:
     * Ensures destination directory exists before writing.
     * Writes fact tables in chunked mode (`chunksize=100_000`) to reduce memory usage.
     * Uses `pandas.DataFrame.to_csv()` with `compression='gzip'` when `compress=True`.
+    * Parquet/Arrow tables are written through pyarrow and keep column dtypes (categoricals included).
     * Catches and re-raises exceptions while printing diagnostics (target path + repr of exception).
 
 - `write_manifest()`:
     * Builds a JSON manifest containing run metadata, a config summary, and per-table row counts and file names.
-    * Inspects the run directory to prefer `.csv.gz` entries when present, otherwise falls back to `.csv`.
+    * Inspects the run directory for part folders, then `.parquet`, `.arrow`, `.csv.gz` and `.csv` files,
+      and records format, bytes, schema and the list of part files.
     * Writes `manifest.json` into the same run folder.
 
 Notes / Conventions
 -------------------
-- File naming: the manifest records the actual filename written for each table (preferring `.csv.gz` when present).
+- File naming: the manifest records the actual filename written for each table (see `write_manifest()` for the preference order).
 - Time units: unrelated to file I/O, but other modules use seconds; filenames and manifest fields do not imply any unit conversion.
 - Directory creation: functions call `Path.mkdir(parents=True, exist_ok=True)` before writing to avoid PermissionError when possible; ensure the process has OS write permission to `BASE_DIR/data/...`.
 - Compression and chunking: chunked writes reduce peak memory but will still write a single compressed file per table when compression is enabled.
@@ -55,24 +69,85 @@ then `write_manifest(export_dir=BASE_DIR / 'data', run_id=run_id, scenario_id=sc
 ####################################################################
 
 import json
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from math import e
 import re
 from datetime import datetime, timezone
 from pathlib import Path
 import pandas
 
+from EventSink import ChunkedTable
+
 BASE_DIR = Path(__file__).resolve().parent
 
+# Supported export formats -> file extension ('csv' becomes '.csv.gz' with gzip)
+FILE_FORMATS = {
+    'csv': '.csv',
+    'parquet': '.parquet',
+    'feather': '.arrow',
+}
+# Default codec per columnar format and table type
+DEFAULT_CODECS = {
+    'parquet': {'dim': 'snappy', 'fact': 'zstd'},
+    'feather': {'dim': 'lz4', 'fact': 'zstd'},
+}
+# Rows per Parquet row group / Arrow record batch for fact tables
+FACT_ROW_GROUP_SIZE = 250_000
+# Canonical export order of the simulation tables
+CANONICAL_TABLES = [
+    "dim_scenario",
+    "dim_machine",
+    "dim_product",
+    "dim_process",
+    "dim_process_route",
+    "fact_work_order",
+    "fact_production_event",
+    "fact_downtime_event",
+    "fact_quality_event"
+]
+# Candidate file names per table (manifest preference order) and their format labels
+TABLE_FILE_CANDIDATES = [
+    ('{table}.parquet', 'parquet'),
+    ('{table}.arrow', 'feather'),
+    ('{table}.csv.gz', 'csv.gz'),
+    ('{table}.csv', 'csv'),
+]
+
 ####################################################################
 
-def export_tables(tables: dict, scenario_id: str, run_id: str, compress_data: bool=False, folder_pointer='unspecificed_runs'):
+def run_directory(scenario_id: str, run_id: str, folder_pointer='unspecificed_runs') -> Path:
+    """
+    Return the run-specific directory used by `export_tables` (not created).
+
+    Parameters
+    ----------
+    scenario_id : str
+        Logical scenario identifier used as a subfolder.
+    run_id : str
+        Run identifier (will be sanitized for filesystem use).
+    folder_pointer : str, optional
+        Top-level folder under `BASE_DIR/data` where runs are stored.
+
+    Returns
+    -------
+    pathlib.Path
+        `BASE_DIR / 'data' / <folder_pointer> / <scenario_id> / <safe_run_id>`.
+    """
+    safe_run_id = re.sub(r'[<>:"/\\|?*]', '-', run_id).strip().rstrip('.')
+    return BASE_DIR / 'data' / folder_pointer / scenario_id / safe_run_id
+
+def export_tables(tables: dict, scenario_id: str, run_id: str, compress_data: bool=False, folder_pointer='unspecificed_runs',
+                  file_format='csv', compression=None, row_group_size=FACT_ROW_GROUP_SIZE, max_workers=1, part_rows=None):
     """
     Export the canonical set of simulation tables to a run-specific directory.
 
     Parameters
     ----------
     tables : dict
-        Mapping of table name (str) -> pandas.DataFrame.
+        Mapping of table name (str) -> pandas.DataFrame, or `EventSink.ChunkedTable`
+        for event tables streamed during the run (written one part per chunk).
         Expected keys: "dim_scenario", "dim_machine", "dim_product", "dim_process",
         "dim_process_route", "fact_work_order", "fact_production_event",
         "fact_downtime_event", "fact_quality_event".
@@ -86,34 +161,201 @@ def export_tables(tables: dict, scenario_id: str, run_id: str, compress_data: bo
         If True, write files as gzipped CSV (`.csv.gz`). Default False.
     folder_pointer : str, optional
         Top-level folder under `BASE_DIR/data` where runs are stored.
+    file_format : str, optional
+        'csv' (default), 'parquet' or 'feather' (Arrow IPC).
+    compression : str or dict, optional
+        Codec for every table or mapping table name -> codec (see `export_table`).
+    row_group_size : int, optional
+        Rows per Parquet row group / Arrow record batch for fact tables.
+    max_workers : int, optional
+        Number of worker threads writing files concurrently (default 1 writes
+        tables one after another). Only Parquet and Arrow IPC scale with more
+        workers: pyarrow encodes and compresses without the GIL, while pandas
+        formats CSV rows (gzipped or not) while holding it, so CSV exports
+        gain little beyond one worker. Workers write silently; the calling
+        thread prints one progress line per finished file.
+    part_rows : int, optional
+        Split fact tables with more rows than this into part files of at most
+        `part_rows` rows, written to `<run dir>/<table>/part-<n><ext>` so the
+        parts can be compressed in parallel. Default None writes one file per table.
+
+    Returns
+    -------
+    dict
+        Mapping table name -> list of written file paths (one per part).
+
+    Raises
+    ------
+    ValueError
+        For an unknown `file_format` or a codec CSV does not support (checked
+        before any file is removed or written).
     """
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f"Export format must be one of {sorted(FILE_FORMATS)}, not {file_format!r}.")
+    # Reject an unsupported codec before anything is removed or written
+    for table in CANONICAL_TABLES:
+        _resolve_codec(table, table.split('_')[0], file_format, compress_data, compression)
+
     # Build the run directory and ensure it exists
-    MAIN_DIR = BASE_DIR / 'data' / folder_pointer
-    safe_run_id = re.sub(r'[<>:"/\\|?*]', '-', run_id).strip().rstrip('.')
-    base_path = MAIN_DIR / scenario_id / safe_run_id
+    base_path = run_directory(scenario_id, run_id, folder_pointer)
     base_path.mkdir(parents=True, exist_ok=True)
 
-    # Iterate the canonical table list and export each one
-    for table in [
-        "dim_scenario",
-        "dim_machine",
-        "dim_product",
-        "dim_process",
-        "dim_process_route",
-        "fact_work_order",
-        "fact_production_event",
-        "fact_downtime_event",
-        "fact_quality_event"
-    ]:
-        export_table(table, tables[table], base_path, table_type=table.split('_')[0], compress=compress_data)
-        print(f"Data export for {table} to archive was successful.\n")
+    # Plan one write job per table, or per part for large fact tables
+    jobs = []
+    for table in CANONICAL_TABLES:
+        df = tables[table]
+        table_type = table.split('_')[0]
+        table_codec = compression.get(table) if isinstance(compression, dict) else compression
+        # Drop this table's files from an earlier export into the same run folder
+        _remove_table_files(base_path, table)
+        if isinstance(df, ChunkedTable):
+            # Streamed event table: one part per event sink chunk, each read only when it is written
+            part_dir = base_path / table
+            part_dir.mkdir(parents=True, exist_ok=True)
+            for part in range(len(df.paths)):
+                jobs.append((table, f"part-{part:05d}", partial(df.read_part, part), part_dir, table_type, table_codec))
+        elif part_rows and table_type == 'fact' and len(df) > part_rows:
+            part_dir = base_path / table
+            part_dir.mkdir(parents=True, exist_ok=True)
+            for part, start in enumerate(range(0, len(df), part_rows)):
+                jobs.append((table, f"part-{part:05d}", df.iloc[start:start + part_rows], part_dir, table_type, table_codec))
+        else:
+            jobs.append((table, table, df, base_path, table_type, table_codec))
+
+    def run_job(job, verbose=True):
+        _, file_stem, df, path, table_type, table_codec = job
+        if callable(df):
+            df = df()
+        return export_table(file_stem, df, path, table_type=table_type, compress=compress_data,
+                            file_format=file_format, compression=table_codec, row_group_size=row_group_size, verbose=verbose)
+
+    # Write sequentially or on a bounded thread pool
+    if max_workers is not None and max_workers <= 1:
+        file_paths = [run_job(job) for job in jobs]
+    else:
+        # Workers write silently; progress is reported from this (coordinating) thread only
+        file_paths = [None] * len(jobs)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(run_job, job, False): index for index, job in enumerate(jobs)}
+            for done, future in enumerate(as_completed(futures), start=1):
+                index = futures[future]
+                table, file_stem = jobs[index][:2]
+                try:
+                    file_paths[index] = future.result()
+                except Exception as exc:
+                    print(f"Failed to export {table} ({file_stem}). Target folder: {jobs[index][3]}")
+                    print("Exception:", repr(exc))
+                    raise
+                print(f"Exported {file_paths[index].relative_to(base_path)} ({done}/{len(jobs)}).")
+
+    written = {table: [] for table in CANONICAL_TABLES}
+    for job, file_path in zip(jobs, file_paths):
+        written[job[0]].append(file_path)
+    for table in CANONICAL_TABLES:
+        print(f"Data export for {table} to archive was successful ({len(written[table])} file(s)).\n")
     
     # Final confirmation with the absolute path used
     print(f"Data was exported to folder: {base_path}\n")
+    return written
 
-def export_table(table_name, df, path, table_type, compress=False):
+def _remove_table_files(run_dir, table_name):
     """
-    Export a single DataFrame to CSV (optionally gzip-compressed).
+    Remove every exported file of one table from a run directory.
+
+    Deletes the table's part folder and its single files in all formats, so a
+    re-export (e.g. with another `file_format` or `part_rows`) cannot leave older
+    files that `_locate_table_files` would pick up instead of the new ones.
+
+    Parameters
+    ----------
+    run_dir : pathlib.Path
+    table_name : str
+    """
+    part_dir = run_dir / table_name
+    if part_dir.is_dir():
+        shutil.rmtree(part_dir)
+    for pattern, _ in TABLE_FILE_CANDIDATES:
+        (run_dir / pattern.format(table=table_name)).unlink(missing_ok=True)
+
+def _require_pyarrow():
+    """
+    Import pyarrow for the Parquet / Arrow IPC export formats.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed (it is only needed for non-CSV formats).
+    """
+    try:
+        import pyarrow
+        import pyarrow.feather
+        import pyarrow.parquet
+    except ImportError as exc:
+        raise ImportError("Parquet/Arrow export requires pyarrow (pip install pyarrow).") from exc
+    return pyarrow
+
+def _resolve_codec(table_name, table_type, file_format, compress, compression):
+    """
+    Pick the compression codec for one table.
+
+    Parameters
+    ----------
+    table_name : str
+    table_type : str
+        'fact' or 'dim'.
+    file_format : str
+        Key of `FILE_FORMATS`.
+    compress : bool
+        CSV only: True selects gzip.
+    compression : str, dict or None
+        Codec for every table, or mapping table name -> codec. Tables not in
+        the mapping (or None) fall back to `DEFAULT_CODECS`. CSV only
+        supports 'gzip'.
+
+    Returns
+    -------
+    str or None
+        Codec name (None means uncompressed).
+
+    Raises
+    ------
+    ValueError
+        If a codec other than 'gzip' is requested for CSV.
+    """
+    if isinstance(compression, dict):
+        compression = compression.get(table_name)
+    if file_format == 'csv':
+        if compression not in (None, 'gzip'):
+            raise ValueError(f"CSV export only supports 'gzip' compression, not {compression!r} (table {table_name}).")
+        return 'gzip' if (compress or compression == 'gzip') else None
+    if compression is None:
+        return DEFAULT_CODECS[file_format][table_type]
+    return None if compression == 'none' else compression
+
+def table_file_name(table_name, file_format='csv', codec=None):
+    """
+    Return the file name `export_table` uses for a table.
+
+    Parameters
+    ----------
+    table_name : str
+    file_format : str, optional
+        Key of `FILE_FORMATS` (default 'csv').
+    codec : str, optional
+        Compression codec; only changes the name for CSV ('gzip' -> `.csv.gz`).
+
+    Returns
+    -------
+    str
+    """
+    if file_format == 'csv' and codec == 'gzip':
+        return f"{table_name}.csv.gz"
+    return f"{table_name}{FILE_FORMATS[file_format]}"
+
+def export_table(table_name, df, path, table_type, compress=False, file_format='csv', compression=None, row_group_size=FACT_ROW_GROUP_SIZE,
+                 verbose=True):
+    """
+    Export a single DataFrame to CSV (optionally gzip-compressed), Parquet or Arrow IPC.
 
     Parameters
     ----------
@@ -126,42 +368,131 @@ def export_table(table_name, df, path, table_type, compress=False):
     table_type : str
         'fact' or 'dim' (used to decide whether to chunk large tables).
     compress : bool, optional
-        If True write gzipped CSV (`.csv.gz`), otherwise plain `.csv`.
+        CSV only: if True write gzipped CSV (`.csv.gz`), otherwise plain `.csv`.
+    file_format : str, optional
+        'csv' (default), 'parquet' or 'feather' (Arrow IPC file, `.arrow`).
+    compression : str or dict, optional
+        Codec for Parquet/Arrow (e.g. 'zstd', 'snappy', 'lz4', 'none'), or a
+        mapping table name -> codec. Defaults to `DEFAULT_CODECS`. For CSV
+        only 'gzip' is accepted (same as `compress=True`).
+    row_group_size : int, optional
+        Rows per Parquet row group / Arrow record batch for fact tables
+        (default `FACT_ROW_GROUP_SIZE`). Dimension tables are written as a
+        single group.
+    verbose : bool, optional
+        Print progress and failure diagnostics (default True). `export_tables`
+        turns it off for its worker threads and reports progress itself.
+
+    Returns
+    -------
+    pathlib.Path
+        Path of the written file.
     """
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f"Export format must be one of {sorted(FILE_FORMATS)}, not {file_format!r}.")
+
     # Print brief progress to the console
-    print(f"Exporting {len(df):,} records from {table_name}...")
+    log = print if verbose else (lambda *args: None)
+    log(f"Exporting {len(df):,} records from {table_name}...")
     # Ensure target directory exists (safe no-op if already present)
     path.mkdir(parents=True, exist_ok=True)
     
     # Determine filename and full path
-    filename = f"{table_name}.csv.gz" if compress else f"{table_name}.csv"
-    file_path = path / filename
+    codec = _resolve_codec(table_name, table_type, file_format, compress, compression)
+    file_path = path / table_file_name(table_name, file_format, codec)
 
-    # Export with appropriate settings based on table type and compression, with error handling
+    # Export with appropriate settings based on format, table type and compression, with error handling
     try:
+        if file_format in ('parquet', 'feather'):
+            pyarrow = _require_pyarrow()
+            # Columnar formats keep dtypes (categoricals are stored dictionary-encoded)
+            arrow_table = pyarrow.Table.from_pandas(df, preserve_index=False)
+            group_size = row_group_size if table_type == 'fact' else None
+            if file_format == 'parquet':
+                pyarrow.parquet.write_table(arrow_table, file_path, compression=codec or 'none', row_group_size=group_size)
+            else:
+                pyarrow.feather.write_feather(arrow_table, file_path, compression=codec or 'uncompressed', chunksize=group_size)
+            log(f"Exported {table_name} as {file_format} ({codec or 'uncompressed'}).")
         # For fact tables use chunked writes to reduce memory pressure
-        if table_type == 'fact':
+        elif table_type == 'fact':
             chunk_size = 100_000
-            if compress:
+            if codec:
                 # pandas handles streaming + compression
                 df.to_csv(file_path, index=False, compression='gzip', chunksize=chunk_size)
-                print(f"Exported {table_name} in chunks of {chunk_size} with compression.")
+                log(f"Exported {table_name} in chunks of {chunk_size} with compression.")
             else:
                 df.to_csv(file_path, index=False, chunksize=chunk_size)
-                print(f"Exported {table_name} in chunks of {chunk_size} without compression.")
+                log(f"Exported {table_name} in chunks of {chunk_size} without compression.")
         else:
             # Dimension tables are typically smaller (write in one shot)
-            if compress:
+            if codec:
                 df.to_csv(file_path, index=False, compression='gzip')
-                print(f"Exported {table_name} with compression.")
+                log(f"Exported {table_name} with compression.")
             else:
                 df.to_csv(file_path, index=False)
-                print(f"Exported {table_name} without compression.")
+                log(f"Exported {table_name} without compression.")
     except Exception as exc:
         # Provide diagnostic information and re-raise so calling code can handle and log
-        print(f"Failed to export {table_name}. Target path: {file_path}")
-        print("Exception:", repr(exc))
+        log(f"Failed to export {table_name}. Target path: {file_path}")
+        log("Exception:", repr(exc))
         raise
+    return file_path
+
+def read_table(file_path):
+    """
+    Read a table written by `export_table`, choosing the reader from the file extension.
+
+    Parameters
+    ----------
+    file_path : str or pathlib.Path
+        Path to a `.csv`, `.csv.gz`, `.parquet` or `.arrow` file, or to a
+        folder of `part-<n>` files written by `export_tables(part_rows=...)`.
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    file_path = Path(file_path)
+    if file_path.is_dir():
+        parts = sorted(file_path.glob('part-*'))
+        return pandas.concat([read_table(part) for part in parts], ignore_index=True)
+    if file_path.suffix == '.parquet':
+        return pandas.read_parquet(file_path)
+    if file_path.suffix == '.arrow':
+        return pandas.read_feather(file_path)
+    return pandas.read_csv(file_path)
+
+def _locate_table_files(run_dir, table_name):
+    """
+    Find the exported file(s) for one table inside a run directory.
+
+    Part folders (`<table>/part-<n><ext>`) take precedence over single files,
+    which are searched in `TABLE_FILE_CANDIDATES` order.
+
+    Parameters
+    ----------
+    run_dir : pathlib.Path
+    table_name : str
+
+    Returns
+    -------
+    tuple
+        (file name relative to `run_dir`, format label or None, list of relative
+        part file names). Missing tables yield `file_not_found_<table>`, None, [].
+    """
+    part_dir = run_dir / table_name
+    if part_dir.is_dir():
+        parts = sorted(part.name for part in part_dir.glob('part-*'))
+        if parts:
+            part_format = next((label for pattern, label in TABLE_FILE_CANDIDATES
+                                if parts[0].endswith(pattern.format(table=''))), None)
+            return f"{table_name}/", part_format, [f"{table_name}/{part}" for part in parts]
+
+    for pattern, label in TABLE_FILE_CANDIDATES:
+        candidate = pattern.format(table=table_name)
+        if (run_dir / candidate).exists():
+            return candidate, label, [candidate]
+    return f"file_not_found_{table_name}", None, []
 
 def write_manifest(
     export_dir,
@@ -171,7 +502,8 @@ def write_manifest(
     run_specs,
     config,
     tables,
-    random_seed="not_specified"
+    random_seed="not_specified",
+    output_analysis=None
 ):
     """
     Create and write a manifest.json describing the run and exported files.
@@ -180,10 +512,14 @@ def write_manifest(
       - run identifiers and creation timestamp
       - a small summary of the run_specs and config
       - per-table row counts and the actual filename present on disk
+      - optionally, warm-up and steady-state KPI estimates (`output_analysis`)
 
-    The function inspects the expected run directory and prefers `.csv.gz`
-    entries when present for each table; if neither `.csv.gz` nor `.csv` are
-    found an explicit `file_not_found_<table>` placeholder is recorded.
+    The function inspects the expected run directory and prefers a
+    `<table>/part-<n>` folder, then `.parquet`, `.arrow`, `.csv.gz` and `.csv`
+    entries for each table (see `_locate_table_files`); if none is found an
+    explicit `file_not_found_<table>` placeholder is recorded. Each table is
+    recorded with its format, total size in bytes, the list of part files and
+    the column -> dtype schema of the exported DataFrame.
 
     Parameters
     ----------
@@ -200,9 +536,13 @@ def write_manifest(
     config : dict
         Full configuration dictionary used for the run (used to populate summary).
     tables : dict
-        Mapping of table name -> DataFrame used to populate row counts in the manifest.
-    random_seed : str|int, optional
+        Mapping of table name -> DataFrame (or `EventSink.ChunkedTable`) used to
+        populate row counts and schemas in the manifest.
+    random_seed : str|int|dict, optional
         Random seed value used for the run (default: "not_specified").
+    output_analysis : dict, optional
+        Warm-up and steady-state KPI estimates (`Plant.output_summary`),
+        recorded under "output_analysis" when given.
 
     Returns
     -------
@@ -226,7 +566,7 @@ def write_manifest(
             "wip_poll_interval": run_specs.get('wip_poll_interval')
         },
 
-        random_seed: random_seed,
+        "random_seed": random_seed,
 
         "config_summary": {
             "cycle_time_distribution": config['cycle_times']['type'],
@@ -238,27 +578,26 @@ def write_manifest(
 
         "tables": {}
     }
+    if output_analysis is not None:
+        manifest["output_analysis"] = output_analysis
 
     # Sanitize run id and build manifest directory path (matches export_tables)
     safe_run_id = re.sub(r'[<>:"/\\|?*]', '-', run_id).strip().rstrip('.')
     manifest_dir = export_dir / scenario_id / safe_run_id 
 
-    # For each table choose the filename that actually exists on disk
+    # For each table choose the file (or part files) that actually exist on disk
     for table_name, df in tables.items():
-        csv_gz = manifest_dir / f"{table_name}.csv.gz"
-        csv_plain = manifest_dir / f"{table_name}.csv"
-        if csv_gz.exists():
-            file_name = f"{table_name}.csv.gz"
-        elif csv_plain.exists():
-            file_name = f"{table_name}.csv"
-        else:
-            # Record that the expected file was not found
-            file_name = f"file_not_found_{table_name}"
+        file_name, file_format, parts = _locate_table_files(manifest_dir, table_name)
+        file_bytes = sum((manifest_dir / part).stat().st_size for part in parts) if parts else None
 
-        # Populate manifest entry with rows and file name (relative file name)
+        # Populate manifest entry with rows, file name (relative), format, size and schema
         manifest["tables"][table_name] = {
             "rows": int(len(df)),
-            "file": file_name
+            "file": file_name,
+            "format": file_format,
+            "bytes": file_bytes,
+            "parts": parts,
+            "schema": {str(column): str(dtype) for column, dtype in df.dtypes.items()}
         }
     
     # Ensure directory exists and write manifest.json
@@ -30,6 +30,7 @@ Notes / Conventions
 import numpy as np
 import pandas as pd
 from typing import List, Optional, Generator
+from RouteStep import RouteStep
 
 # Local RNG for non-seeded randomness
 local_rng = np.random.default_rng()
@@ -42,7 +43,7 @@ local_rng = np.random.default_rng()
 # Interarrival time generation function
 # -----------------------------------------------------------------------------
 def generate_interarrival(gamma_params: dict={'shape': 3.0, 'scale': 600.0}, 
-                          rng: Optional[function] = local_rng
+                          rng: Optional[np.random.Generator] = local_rng
 ) -> float:
     """
     Sample a single interarrival time from a Gamma distribution.
@@ -73,7 +74,7 @@ def generate_interarrival(gamma_params: dict={'shape': 3.0, 'scale': 600.0},
 def generate_batch_group_size(lam: int=5, 
                               min_val: int=1, 
                               max_val: int=12, 
-                              rng: Optional[function] = local_rng
+                              rng: Optional[np.random.Generator] = local_rng
 ) -> int:
     """
     Generate a batch group size using a Poisson draw then clamp to bounds.
@@ -138,11 +139,55 @@ def prioritize_dispatches(fact_work_order: pd.DataFrame,
     # Return the sorted DataFrame
     return work_orders_sorted
 # -----------------------------------------------------------------------------
+# Route template function
+# -----------------------------------------------------------------------------
+def build_route_templates(dim_process: pd.DataFrame, 
+                          dim_process_route: pd.DataFrame
+) -> dict:
+    """
+    Index the process routes by product for repeated work-order dispatching.
+
+    The product -> route mapping is fixed once the dimension tables exist, so
+    the join between `dim_process_route` and `dim_process` is performed a single
+    time here instead of once per released batch. Each route is stored as a
+    tuple of `RouteStep` records that is shared by every work order of the product.
+
+    Parameters
+    ----------
+    dim_process : pandas.DataFrame
+        Process dimension containing at minimum: `process_id`, `product_id`.
+    dim_process_route : pandas.DataFrame
+        Process route mapping containing at minimum: `process_id`, `step_number`,
+        `process_route_id`, `machine_type`.
+
+    Returns
+    -------
+    dict
+        Mapping product_id -> tuple of `RouteStep`, ordered by `step_number`.
+    """
+    # Attach product context to every route step (one-off merge)
+    process_merged = dim_process_route.merge(dim_process[['process_id', 'product_id']], on='process_id', how='inner')
+    # Order steps within each product and build the shared step records
+    process_merged = process_merged.sort_values(by=['product_id', 'step_number'], kind='stable')
+    route_templates = {}
+    for product_id, steps in process_merged.groupby('product_id', sort=False):
+        route_templates[product_id] = tuple(
+            RouteStep(step_number, process_id, process_route_id, machine_type)
+            for step_number, process_id, process_route_id, machine_type in zip(
+                steps['step_number'].tolist(),
+                steps['process_id'].tolist(),
+                steps['process_route_id'].tolist(),
+                steps['machine_type'].tolist(),
+            )
+        )
+    # Return the template index
+    return route_templates
+# -----------------------------------------------------------------------------
 # Work order set generation function
 # -----------------------------------------------------------------------------
 def get_work_order_sets(df_ready_work_orders: pd.DataFrame, 
                         poisson_params: dict = {'lambda': 5, 'min_val': 1, 'max_val': 12}, 
-                        rng: Optional[function] = local_rng
+                        rng: Optional[np.random.Generator] = local_rng
 ) -> Generator[List[pd.DataFrame], None, None]:
     """
     Yield groups of ready work orders in batches determined by a Poisson-based size.
@@ -191,10 +236,55 @@ def get_work_order_sets(df_ready_work_orders: pd.DataFrame,
         yield [group for _, group in work_order_groups.groupby('work_order_id', sort=False)]
         # Increment index
         i += current_set_size
+# # #
+def get_work_order_id_sets(work_order_ids: List[str], 
+                           poisson_params: dict = {'lambda': 5, 'min_val': 1, 'max_val': 12}, 
+                           rng: Optional[np.random.Generator] = local_rng
+) -> Generator[List[str], None, None]:
+    """
+    Yield consecutive groups of work order IDs in Poisson-sized batches.
+
+    Equivalent to `get_work_order_sets` (same batch sizes for the same RNG
+    state) but operates on an ordered sequence of IDs, so no DataFrame
+    filtering or grouping is needed per batch.
+
+    Parameters
+    ----------
+    work_order_ids : list[str]
+        Work order IDs in dispatch order.
+    poisson_params : dict
+        Poisson parameter dictionary with keys:
+        - 'lambda': lambda parameter for Poisson sampling
+        - 'min_val': minimum batch size
+        - 'max_val': maximum batch size
+    rng : numpy.random.Generator
+        RNG used for Poisson sampling.
+
+    Yields
+    ------
+    list[str]
+        The work order IDs in the current batch.
+    """
+    # Extract Poisson parameters
+    lam = poisson_params['lambda']
+    min_val = poisson_params['min_val']
+    max_val = poisson_params['max_val']
+
+    # Initialize index
+    i = 0
+
+    # Loop through IDs in batches
+    while i < len(work_order_ids):
+        # Determine current batch size and slice IDs
+        current_set_size = generate_batch_group_size(lam, min_val, max_val, rng) 
+        yield list(work_order_ids[i : i + current_set_size])
+        # Increment index
+        i += current_set_size
 # -----------------------------------------------------------------------------
 # Repair time generation function
 # -----------------------------------------------------------------------------
-def vary_repair_time(repair_behavior: dict = {'mean_val': 30, 'var_val': 0.6, 'min_bound': 300, 'max_bound': 28800}
+def vary_repair_time(repair_behavior: dict = {'mean_val': 30, 'var_val': 0.6, 'min_bound': 300, 'max_bound': 28800},
+                     rng: Optional[np.random.Generator] = local_rng
 ) -> float:
     """
     Sample a repair time from a log-normal distribution and clip to bounds.
@@ -214,6 +304,8 @@ def vary_repair_time(repair_behavior: dict = {'mean_val': 30, 'var_val': 0.6, 'm
         - 'var_val' : float (sigma for lognormal)
         - 'min_bound' : numeric (seconds)
         - 'max_bound' : numeric (seconds)
+    rng : numpy.random.Generator
+        Random generator to use (default: module-level `local_rng`).
 
     Returns
     -------
@@ -227,7 +319,8 @@ def vary_repair_time(repair_behavior: dict = {'mean_val': 30, 'var_val': 0.6, 'm
     max_bound = repair_behavior['max_bound']
 
     # Sample from log-normal distribution and clip to bounds
-    repair_time = np.clip(local_rng.lognormal(mean=np.log(mean_val * 60), sigma=var_val), min_bound, max_bound)
+    # (min/max rather than np.clip: same result without NumPy's scalar overhead on this per-failure path)
+    repair_time = min(max(rng.lognormal(mean=np.log(mean_val * 60), sigma=var_val), min_bound), max_bound)
     # Round to nearest integer and return
     return round(repair_time, 0)
 # -----------------------------------------------------------------------------
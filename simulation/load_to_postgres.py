@@ -17,22 +17,40 @@ Key details / conventions
 -------------------------
 - Database connection parameters are read from environment variables:
   `PG_USER`, `PG_PASSWORD`, `PG_HOST`, `PG_PORT`, `PG_DATABASE`.
+  `PG_PASSWORD` may be empty (trust / peer authentication) but must be set.
   These are typically set via the project's `.env` file and loaded with
   `python-dotenv`.
-- The connection engine uses the `psycopg2` dialect via SQLAlchemy.
+- The connection engine uses the `psycopg2` dialect via SQLAlchemy. It is
+  created lazily by `get_engine()` on first use (importing this module does
+  not read `.env` or touch the database) and then reused for every load in
+  the process, so repeated scenario loads share one connection pool.
+- Pool settings default to `DEFAULT_ENGINE_OPTIONS` and can be overridden
+  with `PG_POOL_SIZE`, `PG_MAX_OVERFLOW` and `PG_POOL_RECYCLE` environment
+  variables or keyword arguments to the first `get_engine()` call.
+  `pool_pre_ping` discards connections dropped by the server between loads.
 - `load_dataframe_to_postgres` uses `DataFrame.to_sql()` with:
     - `if_exists` behavior controlled by the `exists_action` parameter.
     - `method='multi'` and `chunksize=1000` to perform batched multi-row
       INSERTs where possible.
+  or, with `method="copy"`, streams rows through `COPY ... FROM STDIN`
+  (see `copy_dataframe_to_postgres`).
+- `copy_dataframe_to_postgres` serializes the DataFrame to CSV in memory
+  `chunk_rows` rows at a time and hands each chunk to PostgreSQL's COPY,
+  avoiding per-row parameter binding; memory stays bounded by the chunk.
 - `load_run_to_postgres` provides a convenience routine to load the
   canonical set of simulation tables into a chosen schema (default:
   `"analytics"`).
+- `load_run_atomically` loads the same tables as one unit: each table is
+  COPYed into an unlogged per-run table in the `load_staging` schema on parallel connections,
+  then all of them are inserted into the target schema in one transaction
+  whose length grows with the number of rows in the run.
 
 Notes
 -----
-- These helpers do not perform transactional grouping across multiple
-  tables; if atomic multi-table behavior is required wrap calls in an
-  explicit transaction using SQLAlchemy connection/transaction primitives.
+- `load_dataframe_to_postgres` / `load_run_to_postgres` do not perform
+  transactional grouping across multiple tables; a failure mid-run leaves
+  the tables loaded so far in place. Use `load_run_atomically` when a run
+  must be loaded all-or-nothing.
 - Ensure the configured DB user has permission to create/append to the
   target tables and to write to the target schema.
 """
@@ -41,28 +59,182 @@ Notes
 ## Required Setup ##
 ####################################################################
 
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+import io
 import os
+import threading
+import uuid
+
+from EventSink import table_frames
 ####################################################################
 
-# Load environment variables from .env file (if present) to configure database connection
-load_dotenv()
+# Rows serialized per COPY chunk (bounds the in-memory CSV buffer)
+COPY_CHUNK_ROWS = 100_000
+# Schema holding the per-run staging tables of `load_run_atomically` (kept apart from the `staging` warehouse schema)
+LOAD_STAGING_SCHEMA = "load_staging"
+# Canonical tables in foreign-key order (parents before children)
+LOAD_ORDER = [
+    "dim_scenario",
+    "dim_machine",
+    "dim_product",
+    "dim_process",
+    "dim_process_route",
+    "fact_work_order",
+    "fact_production_event",
+    "fact_downtime_event",
+    "fact_quality_event"
+]
+# Connection pool settings used when the engine is created
+DEFAULT_ENGINE_OPTIONS = {
+    "pool_size": 5,          # connections kept open between loads
+    "max_overflow": 10,      # extra connections allowed under load (e.g. parallel staging)
+    "pool_pre_ping": True,   # test connections before use, replacing stale ones
+    "pool_recycle": 1800,    # seconds before a pooled connection is reopened
+}
 
-# Build SQLAlchemy engine from environment variables.
-# Expected env vars: PG_USER, PG_PASSWORD, PG_HOST, PG_PORT, PG_DATABASE
-engine = create_engine(
-    f"postgresql+psycopg2://{os.getenv('PG_USER')}:{os.getenv('PG_PASSWORD')}@{os.getenv('PG_HOST')}:{os.getenv('PG_PORT')}/{os.getenv('PG_DATABASE')}"
-)
+# Shared engine, created on first use by get_engine()
+_engine = None
+_engine_lock = threading.Lock()
 
-def load_dataframe_to_postgres(df, table_name, schema_name, exists_action="append"):
+def get_engine(**engine_options):
+    """
+    Return the shared SQLAlchemy engine, creating it on first call.
+
+    The first call loads `.env` (if present), reads the `PG_*` connection
+    variables and builds the engine with `DEFAULT_ENGINE_OPTIONS`, updated by
+    the `PG_POOL_SIZE` / `PG_MAX_OVERFLOW` / `PG_POOL_RECYCLE` environment
+    variables and then by `engine_options`. Later calls return the same
+    engine; options passed then are ignored (call `dispose_engine()` first to
+    rebuild with new settings).
+
+    Parameters
+    ----------
+    **engine_options
+        Keyword arguments forwarded to `sqlalchemy.create_engine`
+        (e.g. `pool_size=20`).
+
+    Returns
+    -------
+    sqlalchemy.engine.Engine
+
+    Raises
+    ------
+    RuntimeError
+        If any of the `PG_*` connection variables is not set. `PG_PASSWORD`
+        may be set to an empty string for servers using trust or peer
+        authentication; the other variables must be non-empty.
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            # Load environment variables from .env file (if present) to configure database connection
+            load_dotenv()
+            missing = [var for var in ("PG_USER", "PG_HOST", "PG_PORT", "PG_DATABASE") if not os.getenv(var)]
+            # An empty password is allowed (trust / peer authentication); only an unset one is missing
+            if os.getenv("PG_PASSWORD") is None:
+                missing.insert(1, "PG_PASSWORD")
+            if missing:
+                raise RuntimeError(f"Missing PostgreSQL connection settings: {', '.join(missing)} (set them in the environment or .env).")
+
+            options = dict(DEFAULT_ENGINE_OPTIONS)
+            for option, env_var in [("pool_size", "PG_POOL_SIZE"), ("max_overflow", "PG_MAX_OVERFLOW"), ("pool_recycle", "PG_POOL_RECYCLE")]:
+                if os.getenv(env_var):
+                    options[option] = int(os.getenv(env_var))
+            options.update(engine_options)
+
+            # Build SQLAlchemy engine from environment variables.
+            # Expected env vars: PG_USER, PG_PASSWORD, PG_HOST, PG_PORT, PG_DATABASE
+            _engine = create_engine(
+                f"postgresql+psycopg2://{os.getenv('PG_USER')}:{os.getenv('PG_PASSWORD')}@{os.getenv('PG_HOST')}:{os.getenv('PG_PORT')}/{os.getenv('PG_DATABASE')}",
+                **options
+            )
+        return _engine
+
+def dispose_engine():
+    """
+    Close all pooled connections and forget the shared engine.
+
+    The next `get_engine()` call builds a new engine (picking up changed
+    environment variables or options).
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose()
+            _engine = None
+
+def _quote_identifier(name):
+    """
+    Quote a schema/table/column name for use in raw SQL.
+    """
+    return '"' + str(name).replace('"', '""') + '"'
+
+def copy_dataframe_to_postgres(df, table_name, schema_name, chunk_rows=COPY_CHUNK_ROWS, connection=None):
+    """
+    Append a DataFrame to an existing PostgreSQL table with `COPY FROM STDIN`.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or EventSink.ChunkedTable
+        Table to persist; its column names must match the target columns.
+        A `ChunkedTable` is read and sent one part at a time.
+    table_name : str
+        Target table name (must already exist).
+    schema_name : str
+        Target schema name.
+    chunk_rows : int, optional
+        Rows serialized into the in-memory CSV buffer per COPY call
+        (default `COPY_CHUNK_ROWS`).
+    connection : DBAPI connection, optional
+        Open psycopg2 connection to use. The caller owns the transaction and
+        must commit. When omitted a pooled connection is taken from `get_engine()`
+        and committed after the last chunk (all chunks in one transaction).
+
+    Returns
+    -------
+    int
+        Number of rows copied.
+    """
+    columns = ', '.join(_quote_identifier(column) for column in df.columns)
+    copy_sql = (
+        f"COPY {_quote_identifier(schema_name)}.{_quote_identifier(table_name)} ({columns}) "
+        f"FROM STDIN WITH (FORMAT csv)"
+    )
+
+    owns_connection = connection is None
+    if owns_connection:
+        connection = get_engine().raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            # Serialize and send one bounded chunk at a time
+            for frame in table_frames(df):
+                for start in range(0, len(frame), chunk_rows):
+                    buffer = io.StringIO()
+                    frame.iloc[start:start + chunk_rows].to_csv(buffer, index=False, header=False)
+                    buffer.seek(0)
+                    cursor.copy_expert(copy_sql, buffer)
+        if owns_connection:
+            connection.commit()
+    except Exception:
+        if owns_connection:
+            connection.rollback()
+        raise
+    finally:
+        if owns_connection:
+            connection.close()
+    return len(df)
+
+def load_dataframe_to_postgres(df, table_name, schema_name, exists_action="append", method="insert", chunk_rows=COPY_CHUNK_ROWS):
     """
     Load a pandas DataFrame to a PostgreSQL table.
 
     Parameters
     ----------
-    df : pandas.DataFrame
-        DataFrame to persist to the database.
+    df : pandas.DataFrame or EventSink.ChunkedTable
+        Table to persist to the database (a `ChunkedTable` is loaded one part
+        at a time).
     table_name : str
         Target table name in the database.
     schema_name : str
@@ -71,39 +243,59 @@ def load_dataframe_to_postgres(df, table_name, schema_name, exists_action="appen
         Behavior when the target table exists. Passed to `if_exists` in
         `DataFrame.to_sql`. Common values: "append" (default), "replace",
         "fail".
+    method : str, optional
+        "insert" (default) for batched multi-row INSERTs via `to_sql`, or
+        "copy" to stream rows with `copy_dataframe_to_postgres`.
+    chunk_rows : int, optional
+        Rows per COPY chunk when `method="copy"`.
 
     Behavior
     --------
     Uses `pandas.DataFrame.to_sql()` with:
-      - SQLAlchemy engine created at module import time
+      - the shared SQLAlchemy engine from `get_engine()`
       - `index=False` to avoid writing the DataFrame index as a column
       - `method='multi'` and `chunksize=1000` to improve insert throughput
+    With `method="copy"`, `to_sql` is only called with the empty frame so
+    that `exists_action` (and table creation when missing) behaves the same,
+    then the rows are sent with COPY.
     """
+    if method not in ("insert", "copy"):
+        raise ValueError(f"Load method must be 'insert' or 'copy', not {method!r}.")
+
     print(f"Loading {table_name} to PostgreSQL, table contains {len(df)} records\n")
 
-    df.to_sql(
-        table_name, 
-        engine,
-        schema = schema_name,
-        if_exists=exists_action, 
-        index=False,
-        method='multi',
-        chunksize=1000
-    )
+    if method == "copy":
+        # Apply exists_action / create the table, then stream the rows
+        df.head(0).to_sql(table_name, get_engine(), schema=schema_name, if_exists=exists_action, index=False)
+        copy_dataframe_to_postgres(df, table_name, schema_name, chunk_rows=chunk_rows)
+        return
+
+    for part, frame in enumerate(table_frames(df)):
+        frame.to_sql(
+            table_name, 
+            get_engine(),
+            schema = schema_name,
+            if_exists=exists_action if part == 0 else "append", 
+            index=False,
+            method='multi',
+            chunksize=1000
+        )
 
-def load_run_to_postgres(tables, schema_selection="testing"):
+def load_run_to_postgres(tables, schema_selection="testing", method="insert"):
     """
     Convenience helper to load a standard set of simulation tables.
 
     Parameters
     ----------
     tables : dict
-        Mapping of table name (str) -> pandas.DataFrame. Expected keys:
+        Mapping of table name (str) -> pandas.DataFrame or `EventSink.ChunkedTable`. Expected keys:
         "dim_scenario", "dim_machine", "dim_product", "dim_process", "dim_process_route",
         "fact_work_order", "fact_production_event", "fact_downtime_event",
         "fact_quality_event".
     schema_selection : str, optional
         Target schema name in the database (default: "testing").
+    method : str, optional
+        "insert" (default) or "copy"; see `load_dataframe_to_postgres`.
 
     Notes
     -----
@@ -113,18 +305,114 @@ def load_run_to_postgres(tables, schema_selection="testing"):
       tables), call `load_dataframe_to_postgres` individually with the
       desired `exists_action`.
     """
-    for table in [
-        "dim_scenario",
-        "dim_machine",
-        "dim_product",
-        "dim_process",
-        "dim_process_route",
-        "fact_work_order",
-        "fact_production_event",
-        "fact_downtime_event",
-        "fact_quality_event"
-    ]:
-        load_dataframe_to_postgres(tables[table], table, schema_name=schema_selection)
+    for table in LOAD_ORDER:
+        load_dataframe_to_postgres(tables[table], table, schema_name=schema_selection, method=method)
+
+def _stage_table(df, table_name, schema_name, staging_schema, stage_name, chunk_rows):
+    """
+    Create one unlogged staging table shaped like the target and COPY `df` into it.
+
+    Runs on its own pooled connection so several tables can be staged at once.
+    """
+    connection = get_engine().raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE UNLOGGED TABLE {_quote_identifier(staging_schema)}.{_quote_identifier(stage_name)} "
+                f"(LIKE {_quote_identifier(schema_name)}.{_quote_identifier(table_name)})"
+            )
+        copy_dataframe_to_postgres(df, stage_name, staging_schema, chunk_rows=chunk_rows, connection=connection)
+        connection.commit()
+        print(f"Staged {len(df):,} records of {table_name} into {staging_schema}.{stage_name}\n")
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+def load_run_atomically(tables, schema_selection="testing", staging_schema=LOAD_STAGING_SCHEMA, max_workers=4, chunk_rows=COPY_CHUNK_ROWS):
+    """
+    Load the canonical set of simulation tables as a single all-or-nothing unit.
+
+    The load runs in two phases:
+      1. Stage: every table is copied (COPY FROM STDIN) into its own per-run
+         UNLOGGED table in `staging_schema` (created if missing), on up to `max_workers` parallel
+         connections. Nothing is visible in the target schema yet.
+      2. Publish: one transaction inserts every staged table into its target
+         table (`INSERT ... SELECT`) in foreign-key order. Either all tables
+         of the run appear in `schema_selection` or none do. The transaction
+         copies every staged row server-side, so its length (and the time
+         its locks and WAL are held) grows with the size of the run.
+    Staging tables are dropped afterwards, whether the load succeeded or not.
+
+    Parameters
+    ----------
+    tables : dict
+        Mapping of table name (str) -> pandas.DataFrame or `EventSink.ChunkedTable`
+        (keys as in `LOAD_ORDER`).
+    schema_selection : str, optional
+        Target schema; its tables must already exist (see database/00_schema_setup.sql).
+    staging_schema : str, optional
+        Schema for the temporary staging tables (default: `LOAD_STAGING_SCHEMA`).
+        Must not be a schema holding warehouse tables such as `staging`.
+    max_workers : int, optional
+        Parallel connections used while staging (default 4). Keep at or
+        below the engine's pool size plus overflow.
+    chunk_rows : int, optional
+        Rows per COPY chunk.
+
+    Notes
+    -----
+    - Target tables hold many scenarios, so the publish step appends via
+      `INSERT ... SELECT` rather than swapping whole tables by rename.
+    - Unlogged tables skip WAL writes during staging; they are not crash-safe,
+      which is acceptable because they only live for the duration of the load.
+    """
+    run_tag = uuid.uuid4().hex[:12]
+    stage_names = {table: f"{table}_{run_tag}" for table in LOAD_ORDER}
 
+    connection = get_engine().raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {_quote_identifier(staging_schema)}")
+        connection.commit()
+    finally:
+        connection.close()
 
+    try:
+        # Phase 1: stage all tables on parallel connections
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_stage_table, tables[table], table, schema_selection, staging_schema, stage_names[table], chunk_rows)
+                for table in LOAD_ORDER
+            ]
+            for future in futures:
+                future.result()
 
+        # Phase 2: publish every staged table in one transaction
+        connection = get_engine().raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                for table in LOAD_ORDER:
+                    columns = ', '.join(_quote_identifier(column) for column in tables[table].columns)
+                    cursor.execute(
+                        f"INSERT INTO {_quote_identifier(schema_selection)}.{_quote_identifier(table)} ({columns}) "
+                        f"SELECT {columns} FROM {_quote_identifier(staging_schema)}.{_quote_identifier(stage_names[table])}"
+                    )
+            connection.commit()
+            print(f"Published {len(LOAD_ORDER)} tables to schema {schema_selection} in one transaction\n")
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+    finally:
+        # Drop staging tables, including those of a failed load
+        connection = get_engine().raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                for table in LOAD_ORDER:
+                    cursor.execute(f"DROP TABLE IF EXISTS {_quote_identifier(staging_schema)}.{_quote_identifier(stage_names[table])}")
+            connection.commit()
+        finally:
+            connection.close()
@@ -0,0 +1,376 @@
+### Output Analysis Functions for Production Plant Simulation ###
+"""
+Steady-state output analysis for the Production Plant Simulation.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+Every run starts from an empty plant, so the first part of the horizon is
+an initial transient (WIP building up, machines idle) that biases averages
+over the whole run. The Plant samples WIP and throughput at a fixed interval
+while it runs (`Plant.steady_state_monitor`); this module locates the end of
+the warm-up in those series with the MSER-5 rule so the fact tables can flag
+warm-up events (`warmup` column) instead of averaging over them, and builds
+batch-means confidence intervals for the steady-state KPIs, which the
+precision-based stop mode uses to end release once they are tight enough.
+
+Notes / Conventions
+-------------------
+- MSER-5 (White, 1997; Spratt, 1998): the series is reduced to means of
+  non-overlapping batches of 5 observations. For every candidate truncation
+  point d the marginal standard error statistic
+  MSER(d) = sum_{j>d} (Z_j - mean(Z_{d+1..k}))^2 / (k - d)^2 is computed and
+  the d minimizing it is the warm-up length (in batches).
+- The minimum is only searched over the first half of the batches. If it
+  falls on the end of that range the statistic is still decreasing, the run
+  is too short to reach steady state and no warm-up end is reported (None).
+- With several series (WIP, throughput) the latest warm-up end is used.
+- Confidence intervals use a fixed number of batches (`NUM_BATCHES`): the
+  batch size grows with the run, the batch means are treated as
+  approximately independent and normal, and the half-width is
+  t_{b-1} * s / sqrt(b). Ratio KPIs (e.g. mean lead time = total lead time /
+  completions) use per-batch ratios around the overall ratio.
+- Student-t quantiles invert the exact finite-series CDF for integer
+  degrees of freedom (Abramowitz & Stegun 26.7.3-4) by bisection, so SciPy
+  is not required and the few-pair intervals of `antithetic_summary` are
+  not too narrow.
+- Antithetic pairs (`antithetic_summary`): each pair mean is one
+  observation; its variance is compared with the variance the mean of two
+  independent runs would have (the run-to-run variance / 2).
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import math
+
+import numpy as np
+
+from EventSink import table_frames
+
+####################################################################
+
+# Observations per batch for MSER-5
+MSER_BATCH_SIZE = 5
+
+# Fewest batches MSER is computed on (shorter series report no warm-up end)
+MIN_MSER_BATCHES = 10
+
+# Batches per confidence interval, and the fewest observations per batch
+NUM_BATCHES = 20
+MIN_BATCH_SIZE = 5
+
+####################################################################
+## Function Definitions ##
+####################################################################
+
+def batch_means(values, batch_size: int) -> np.ndarray:
+    """
+    Return the means of consecutive non-overlapping batches.
+
+    Parameters
+    ----------
+    values : array-like
+        Observations in time order.
+    batch_size : int
+        Observations per batch; a trailing partial batch is ignored.
+
+    Returns
+    -------
+    numpy.ndarray
+        One mean per complete batch.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    num_batches = len(values) // batch_size
+    return values[:num_batches * batch_size].reshape(num_batches, batch_size).mean(axis=1)
+
+def mser_statistic(values) -> np.ndarray:
+    """
+    Compute the MSER statistic for every truncation point of a series.
+
+    Parameters
+    ----------
+    values : array-like
+        Observations (or batch means) in time order.
+
+    Returns
+    -------
+    numpy.ndarray
+        Element d is MSER(d), the statistic after dropping the first d values.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    # Suffix sums give the mean and sum of squares of every tail in O(n)
+    remaining = np.arange(len(values), 0, -1, dtype=np.float64)
+    tail_sum = np.cumsum(values[::-1])[::-1]
+    tail_sum_sq = np.cumsum(values[::-1] ** 2)[::-1]
+    squared_error = np.maximum(tail_sum_sq - tail_sum ** 2 / remaining, 0.0)
+    return squared_error / remaining ** 2
+
+def mser_truncation(values, batch_size: int=MSER_BATCH_SIZE):
+    """
+    Return the warm-up length of a series by the MSER-`batch_size` rule.
+
+    Parameters
+    ----------
+    values : array-like
+        Observations in time order.
+    batch_size : int, optional
+        Observations per batch (default 5, i.e. MSER-5).
+
+    Returns
+    -------
+    int or None
+        Number of leading observations to discard, or None if the series is
+        too short or still trending (minimum on the boundary of the searched half).
+    """
+    means = batch_means(values, batch_size)
+    if len(means) < MIN_MSER_BATCHES:
+        return None
+    # MSER(d) degenerates towards 0 as the tail shrinks, so only the first half is searched
+    half = len(means) // 2
+    best = int(np.argmin(mser_statistic(means)[:half + 1]))
+    # A minimum on the boundary means the statistic is still falling
+    if best == half:
+        return None
+    return best * batch_size
+
+def detect_warmup_end(sample_times, series: dict, batch_size: int=MSER_BATCH_SIZE):
+    """
+    Locate the end of the warm-up period in sampled output series.
+
+    Parameters
+    ----------
+    sample_times : array-like
+        Simulation time (seconds) at the end of each sampling interval.
+    series : dict
+        Mapping series name -> observations aligned with `sample_times`
+        (e.g. {'wip': [...], 'throughput': [...]}).
+    batch_size : int, optional
+        MSER batch size (default 5).
+
+    Returns
+    -------
+    float or None
+        Time of the last warm-up observation (0.0 when no warm-up is needed),
+        or None if steady state was not detected in every series.
+    """
+    truncation = warmup_truncation(series, batch_size)
+    if truncation is None:
+        return None
+    return float(sample_times[truncation - 1]) if truncation > 0 else 0.0
+
+def warmup_truncation(series: dict, batch_size: int=MSER_BATCH_SIZE):
+    """
+    Return the number of leading observations to discard from every series.
+
+    Parameters
+    ----------
+    series : dict
+        Mapping series name -> observations of equal length.
+    batch_size : int, optional
+        MSER batch size (default 5).
+
+    Returns
+    -------
+    int or None
+        Largest MSER truncation over the series, or None if any series has
+        not reached steady state.
+    """
+    truncations = [mser_truncation(values, batch_size) for values in series.values()]
+    if not truncations or any(truncation is None for truncation in truncations):
+        return None
+    return max(truncations)
+
+def _t_central_probability(t: float, df: int) -> float:
+    """
+    Return P(|T| < t) for a Student-t variable with integer `df` (Abramowitz & Stegun 26.7.3-4).
+    """
+    theta = math.atan(t / math.sqrt(df))
+    cos_squared = math.cos(theta) ** 2
+    term = total = 1.0
+    if df % 2:
+        for k in range(1, (df - 1) // 2):
+            term *= 2 * k / (2 * k + 1) * cos_squared
+            total += term
+        if df == 1:
+            return 2 * theta / math.pi
+        return 2 / math.pi * (theta + math.sin(theta) * math.cos(theta) * total)
+    for k in range(1, df // 2):
+        term *= (2 * k - 1) / (2 * k) * cos_squared
+        total += term
+    return math.sin(theta) * total
+
+def t_quantile(probability: float, df: int) -> float:
+    """
+    Student-t quantile for integer degrees of freedom.
+
+    Inverts the exact CDF (`_t_central_probability`) by bisection, so small
+    `df` (a few antithetic pairs) get the exact value, e.g. 12.706 for df=1.
+
+    Parameters
+    ----------
+    probability : float
+        Lower-tail probability, e.g. 0.975.
+    df : int
+        Degrees of freedom (at least 1).
+
+    Returns
+    -------
+    float
+    """
+    if df < 1:
+        raise ValueError(f"df must be at least 1, not {df}")
+    if not 0 < probability < 1:
+        raise ValueError(f"probability must be between 0 and 1, not {probability}")
+    if probability < 0.5:
+        return -t_quantile(1 - probability, df)
+    target = 2 * probability - 1
+    low, high = 0.0, 1.0
+    while _t_central_probability(high, df) < target:
+        low, high = high, 2 * high
+    for _ in range(100):
+        middle = (low + high) / 2
+        if _t_central_probability(middle, df) < target:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
+
+def batch_means_interval(values, weights=None, num_batches: int=NUM_BATCHES, confidence: float=0.95):
+    """
+    Batch-means confidence interval for the steady-state mean of a series.
+
+    Parameters
+    ----------
+    values : array-like
+        Observations in time order (warm-up already removed). For a ratio
+        KPI, the numerator per observation (e.g. lead time summed over the
+        work orders completed in a sampling interval).
+    weights : array-like, optional
+        Denominator per observation for a ratio KPI (e.g. completions per
+        interval). None estimates the plain mean of `values`.
+    num_batches : int, optional
+        Number of batches (default `NUM_BATCHES`).
+    confidence : float, optional
+        Two-sided confidence level (default 0.95).
+
+    Returns
+    -------
+    dict or None
+        'mean', 'half_width', 'relative_half_width' (half-width / |mean|,
+        inf for a zero mean), 'batches' and 'batch_size'; None if there are
+        fewer than `num_batches * MIN_BATCH_SIZE` observations or a batch has
+        zero total weight.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    batch_size = len(values) // num_batches
+    if batch_size < MIN_BATCH_SIZE:
+        return None
+
+    # Drop the oldest observations that do not fill a batch
+    used = batch_size * num_batches
+    numerators = values[-used:].reshape(num_batches, batch_size).sum(axis=1)
+    if weights is None:
+        denominators = np.full(num_batches, float(batch_size))
+    else:
+        denominators = np.asarray(weights, dtype=np.float64)[-used:].reshape(num_batches, batch_size).sum(axis=1)
+        if np.any(denominators <= 0):
+            return None
+
+    mean = numerators.sum() / denominators.sum()
+    means = numerators / denominators
+    half_width = t_quantile(0.5 + confidence / 2, num_batches - 1) * means.std(ddof=1) / np.sqrt(num_batches)
+    return {
+        'mean': float(mean),
+        'half_width': float(half_width),
+        'relative_half_width': float(half_width / abs(mean)) if mean != 0 else float('inf'),
+        'batches': num_batches,
+        'batch_size': batch_size,
+    }
+
+def run_kpis(tables: dict) -> dict:
+    """
+    Summarize one run's fact tables into scalar KPIs (warm-up rows excluded).
+
+    Parameters
+    ----------
+    tables : dict
+        Table name -> DataFrame, as returned by `run_simulation.run_pipeline`.
+        Event tables may be `EventSink.ChunkedTable` views; they are summed
+        one part at a time.
+
+    Returns
+    -------
+    dict
+        'completed_work_orders', 'mean_lead_time_hours', 'scrap_rate' and
+        'downtime_hours' (None where the run has no rows to average).
+    """
+    def observed(df):
+        return df[~df['warmup']] if 'warmup' in df.columns else df
+
+    work_orders = observed(tables['fact_work_order'])
+    completed = work_orders[work_orders['work_order_end_time'].notna()]
+    lead_times = completed['work_order_end_time'] - completed['work_order_start_time']
+
+    initial_units = scrapped_units = downtime_seconds = 0
+    for quality in table_frames(tables['fact_quality_event']):
+        quality = observed(quality)
+        initial_units += quality['initial_quantity'].sum()
+        scrapped_units += quality['units_scrapped'].sum()
+    for downtime in table_frames(tables['fact_downtime_event']):
+        downtime = observed(downtime)
+        downtime_seconds += (downtime['failure_end'] - downtime['failure_start']).sum()
+    return {
+        'completed_work_orders': int(len(completed)),
+        'mean_lead_time_hours': float(lead_times.mean() / 3600) if len(completed) else None,
+        'scrap_rate': float(scrapped_units / initial_units) if initial_units else None,
+        'downtime_hours': float(downtime_seconds / 3600),
+    }
+
+def antithetic_summary(pairs, confidence: float=0.95) -> dict:
+    """
+    Combine the KPIs of antithetic run pairs into pair-mean estimates.
+
+    Parameters
+    ----------
+    pairs : list of (dict, dict)
+        (base, mirror) KPI dictionaries (see `run_kpis`), one tuple per pair.
+    confidence : float, optional
+        Two-sided confidence level of the half-width (default 0.95).
+
+    Returns
+    -------
+    dict
+        'pairs', 'confidence' and per KPI: 'mean' (mean of the pair means),
+        'pair_variance' (variance of a pair mean), 'independent_variance'
+        (variance of the mean of two independent runs, estimated from all
+        runs), 'variance_reduction' (1 - pair / independent), 'correlation'
+        (base vs mirror) and 'half_width'. Statistics needing two or more
+        pairs are None for a single pair.
+    """
+    kpis = {}
+    for name in pairs[0][0]:
+        values = [(base[name], mirror[name]) for base, mirror in pairs
+                  if base[name] is not None and mirror[name] is not None]
+        if not values:
+            kpis[name] = None
+            continue
+        base, mirror = np.asarray(values, dtype=np.float64).T
+        pair_means = (base + mirror) / 2
+        summary = {'mean': float(pair_means.mean()), 'pair_variance': None, 'independent_variance': None,
+                   'variance_reduction': None, 'correlation': None, 'half_width': None}
+        if len(values) > 1:
+            pair_variance = pair_means.var(ddof=1)
+            independent_variance = np.concatenate([base, mirror]).var(ddof=1) / 2
+            summary['pair_variance'] = float(pair_variance)
+            summary['independent_variance'] = float(independent_variance)
+            if independent_variance > 0:
+                summary['variance_reduction'] = float(1 - pair_variance / independent_variance)
+            if base.std() > 0 and mirror.std() > 0:
+                summary['correlation'] = float(np.corrcoef(base, mirror)[0, 1])
+            summary['half_width'] = float(t_quantile(0.5 + confidence / 2, len(values) - 1) * np.sqrt(pair_variance / len(values)))
+        kpis[name] = summary
+    return {'pairs': len(pairs), 'confidence': confidence, 'kpis': kpis}
@@ -0,0 +1,321 @@
+# Replication runner for the Manufacturing Plant Simulation
+"""
+Run independent replications of one scenario in parallel.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+A single `run_simulation` invocation executes one SimPy run on one core.
+Comparing scenarios needs several independent replications of each, so this
+module runs N replications of a config on a process pool. Each replication
+goes through the same `run_simulation.run_pipeline` as a single run and
+writes its tables and manifest to its own run folder; a combined
+replication manifest lists every run.
+
+Key Behavior / Organization
+---------------------------
+- Seeds: one `numpy.random.SeedSequence` is built from the master seed and
+  `spawn()`ed into one child per replication, giving statistically
+  independent streams that are reproducible from the master seed alone.
+- Scenario IDs: replication `n` (1-based) is tagged `<scenario_id>R<n>`,
+  following the `...R1` suffix convention of the scenario IDs, so
+  replications stay distinct rows in `dim_scenario`.
+- Isolation: every replication runs in a fresh spawned worker process
+  (`multiprocessing.Pool` with `maxtasksperchild=1`, available on every
+  supported Python version), so the module-level ID counters and fallback
+  RNGs in `Machine`, `helper_functions` and `data_generators` start clean.
+- Warm start: with `warm_start` every replication starts from the same
+  steady-state snapshot (`run_simulation.save_warm_snapshot`) with its own
+  child seed, so no simulated time is spent on the warm-up per replication.
+- Paired comparisons: child seeds depend only on the master seed, so with
+  `run_specs.crn` (`--crn`) replication `n` of two scenarios run with the
+  same master seed uses the same per-machine and per-work-order substreams.
+- Antithetic pairs: with `antithetic` every replication runs twice on its
+  child seed, `<scenario_id>R<n>` with U and `<scenario_id>R<n>M` with
+  mirrored 1 - U draws (`run_simulation.run_antithetic_pair`). The combined
+  manifest reports the KPI mean over the pair means with its variance next
+  to the variance two independent runs would give
+  (`output_analysis.antithetic_summary`). The plant structure and the work
+  order attributes (product, planned quantity) come from the unmirrored
+  `structure` stream, which would make the two runs of a pair move
+  together; in antithetic mode all pairs therefore take it from the master
+  seed (`run_simulation.seed_structure_rngs`), so every pair simulates the
+  same plant and the estimate is conditional on that plant. How much
+  variance the pairs remove depends on the KPI (`variance_reduction` can
+  be negative, e.g. for the scrap rate, whose quality draws are not mirrored).
+- Output: `data/<output_folder>/<scenario_id>R<n>/<run_id>/...` per
+  replication plus `data/<output_folder>/replications_<scenario_id>_<timestamp>.json`.
+
+Notes / Conventions
+-------------------
+- Worker processes only return a small summary (folders, row counts, wall
+  time); tables are never pickled back to the parent.
+- A replication that raises is recorded as failed (with its error) and the
+  others keep running; the combined manifest is always written.
+- Worker console output is suppressed unless `verbose=True`.
+- Usage:
+      python run_replications.py --config configs/scenario_C.toml \
+          --replications 8 --seed 2025 --workers 4
+      python run_simulation.py --config configs/scenario_C.toml --seed 7 \
+          --save-snapshot snapshots/scenario_C.pkl --warmup-days 20
+      python run_replications.py --config configs/scenario_C.toml \
+          --replications 8 --seed 2025 --warm-start snapshots/scenario_C.pkl
+      python run_replications.py --config configs/scenario_C.toml \
+          --replications 8 --seed 2025 --antithetic
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import argparse
+import contextlib
+import copy
+import io
+import json
+import multiprocessing
+import os
+import re
+import time
+import traceback
+from datetime import datetime, timezone
+
+import numpy as np
+import export_to_folder as etf
+import output_analysis as oa
+import run_simulation as rs
+
+####################################################################
+
+def _run_replication(task: dict) -> dict:
+    """
+    Worker entry point: run one replication and return its summary.
+
+    Failures are caught and reported in the summary so the batch continues.
+
+    Parameters
+    ----------
+    task : dict
+        Keyword arguments for `run_simulation.run_pipeline` plus
+        'replication' (1-based index) and 'verbose'.
+
+    Returns
+    -------
+    dict
+        Replication summary (see `run_replications`).
+    """
+    task = dict(task)
+    replication = task.pop('replication')
+    verbose = task.pop('verbose')
+
+    summary = {
+        'replication': replication,
+        'scenario_id': task['scenario_id'],
+        'seed': rs.describe_seed(task['seed']),
+        'antithetic': task['config']['run_specs'].get('antithetic'),
+    }
+    start = time.perf_counter()
+    try:
+        if verbose:
+            result = rs.run_pipeline(**task)
+        else:
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = rs.run_pipeline(**task)
+        summary['status'] = 'completed'
+        summary['run_id'] = result['run_id']
+        summary['run_dir'] = str(result['run_dir'].relative_to(etf.BASE_DIR / 'data' / task['folder']))
+        summary['rows'] = {table: int(len(df)) for table, df in result['tables'].items()}
+        summary['kpis'] = oa.run_kpis(result['tables'])
+    except Exception as exc:
+        summary['status'] = 'failed'
+        summary['error'] = repr(exc)
+        summary['traceback'] = traceback.format_exc()
+    summary['seconds'] = round(time.perf_counter() - start, 3)
+    return summary
+
+def run_replications(config, scenario_id, scenario_name, replications, master_seed=None, workers=None,
+                     folder='replications', schema=None, export_format='csv', compress=False,
+                     load_method='insert', warm_start=None, antithetic=False, verbose=False) -> dict:
+    """
+    Run independent replications of one scenario on a process pool.
+
+    Parameters
+    ----------
+    config : dict
+        Validated configuration (see `run_simulation.validate_config`).
+    scenario_id : str
+        Base scenario identifier; replication n is tagged `<scenario_id>R<n>`.
+    scenario_name : str
+        Scenario description shared by all replications.
+    replications : int
+        Number of replications to run.
+    master_seed : int, optional
+        Seed of the parent SeedSequence. None draws fresh entropy, which is
+        recorded in the combined manifest so the batch can be reproduced.
+    workers : int, optional
+        Worker processes (default: `os.cpu_count()`, capped at `replications`).
+    folder : str, optional
+        Export folder under `data/` (default 'replications').
+    schema : str, optional
+        PostgreSQL schema to load each replication into (default: no load).
+    export_format : str, optional
+        'csv', 'parquet' or 'feather'.
+    compress : bool, optional
+        Gzip CSV outputs.
+    load_method : str, optional
+        'insert', 'copy' or 'atomic'.
+    warm_start : str, optional
+        Warm-start snapshot every replication starts from (default: empty plant).
+    antithetic : bool, optional
+        Run every replication as an antithetic pair (2 * `replications` runs).
+    verbose : bool, optional
+        Show each worker's pipeline output (default False).
+
+    Returns
+    -------
+    dict
+        Combined manifest: master seed, worker count, total wall time, number
+        of failed runs and one summary per run (scenario_id, seed spawn key,
+        antithetic side, status and seconds; run_id, run_dir relative to the
+        export folder, table row counts and KPIs for completed runs; error and
+        traceback for failed ones), plus the pair-mean summary over the
+        completed pairs when `antithetic`. Also written to
+        `data/<folder>/replications_<scenario_id>_<timestamp>.json`, even if
+        the batch is interrupted, so the master seed is never lost.
+    """
+    if replications < 1:
+        raise ValueError(f"replications must be at least 1, not {replications}")
+    sides = list(rs.ANTITHETIC_SIDES.items()) if antithetic else [(None, '')]
+    workers = min(workers or os.cpu_count() or 1, replications * len(sides))
+
+    # One independent child seed per replication
+    master_sequence = np.random.SeedSequence(master_seed)
+    child_seeds = master_sequence.spawn(replications)
+    # Antithetic pairs share one plant, drawn from the master seed itself
+    structure_seed = master_sequence if antithetic else None
+    created_at = datetime.now(timezone.utc)
+
+    tasks = []
+    for replication, child_seed in enumerate(child_seeds, start=1):
+        for side, suffix in sides:
+            replication_id = f"{scenario_id}R{replication}{suffix}"
+            side_config = config
+            if side is not None:
+                # Both runs of an antithetic pair share the child seed
+                side_config = copy.deepcopy(config)
+                side_config['run_specs']['antithetic'] = side
+            tasks.append({
+                'replication': replication,
+                'verbose': verbose,
+                'config': side_config,
+                'scenario_id': replication_id,
+                'scenario_name': scenario_name,
+                'seed': child_seed,
+                'folder': folder,
+                'schema': schema,
+                'run_id': f"{replication_id}_{created_at.isoformat()}",
+                'export_format': export_format,
+                'compress': compress,
+                'load_method': load_method,
+                'warm_start': warm_start,
+                'structure_seed': structure_seed,
+            })
+
+    print(f"Running {replications} replications of {scenario_id} on {workers} worker process(es)...\n")
+    start = time.perf_counter()
+    summaries = []
+    try:
+        # A fresh process per replication resets module-level counters and RNGs
+        with multiprocessing.get_context('spawn').Pool(processes=workers, maxtasksperchild=1) as pool:
+            for summary in pool.imap_unordered(_run_replication, tasks):
+                summaries.append(summary)
+                print(f"Replication {summary['replication']}/{replications} ({summary['scenario_id']}) {summary['status']} "
+                      f"in {summary['seconds']:.1f}s{': ' + summary['error'] if 'error' in summary else ''}")
+    finally:
+        # Always record the batch, so a failed or interrupted one can be rerun from its master seed
+        elapsed = time.perf_counter() - start
+        summaries.sort(key=lambda summary: (summary['replication'], summary['scenario_id']))
+        failed = sum(summary['status'] == 'failed' for summary in summaries)
+
+        manifest = {
+            'scenario_id': scenario_id,
+            'scenario_name': scenario_name,
+            'created_at': created_at.isoformat().replace("+00:00", "Z"),
+            'master_seed': {'entropy': master_sequence.entropy},
+            'replications': replications,
+            'workers': workers,
+            'wall_seconds': round(elapsed, 3),
+            'failed_runs': failed,
+            'run_specs': config['run_specs'],
+            'warm_start': None if warm_start is None else str(warm_start),
+            'runs': summaries,
+        }
+        if antithetic:
+            # Pairs with a failed (or missing) side are left out of the pair means
+            pair_kpis = {}
+            for summary in summaries:
+                if summary['status'] == 'completed':
+                    pair_kpis.setdefault(summary['replication'], []).append(summary['kpis'])
+            pairs = [tuple(kpis) for kpis in pair_kpis.values() if len(kpis) == 2]
+            manifest['antithetic'] = oa.antithetic_summary(pairs) if pairs else None
+
+        # Write the combined manifest next to the per-replication folders
+        export_dir = etf.BASE_DIR / 'data' / folder
+        export_dir.mkdir(parents=True, exist_ok=True)
+        safe_stamp = re.sub(r'[<>:"/\\|?*]', '-', created_at.isoformat())
+        manifest_path = export_dir / f"replications_{scenario_id}_{safe_stamp}.json"
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+    print(f"\n{len(summaries) - failed} run(s) completed, {failed} failed in {elapsed:.1f}s. Combined manifest written to {manifest_path}\n")
+    return manifest
+
+def main(argv=None):
+    """
+    Command line entry point for `run_replications`.
+    """
+    parser = argparse.ArgumentParser(description="Run independent replications of a simulation scenario in parallel.")
+    parser.add_argument('--config', required=True, help="Config file (.json, .toml, .yaml/.yml); presets live in configs/.")
+    parser.add_argument('--replications', '-n', type=int, required=True, help="Number of replications.")
+    parser.add_argument('--seed', type=int, default=None, help="Master seed for SeedSequence.spawn (default: fresh entropy, recorded in the manifest).")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument('--scenario-id', default=None, help="Base scenario ID (default: config file name).")
+    parser.add_argument('--scenario-name', default=None, help="Scenario name (default: the scenario ID).")
+    parser.add_argument('--output-folder', default='replications', help="Export folder under data/ (default: replications).")
+    parser.add_argument('--schema', default=None, help="PostgreSQL schema to load each replication into (default: skip).")
+    parser.add_argument('--load-method', choices=['insert', 'copy', 'atomic'], default='insert', help="Database load method (default: insert).")
+    parser.add_argument('--format', choices=sorted(etf.FILE_FORMATS), default='csv', help="Export file format (default: csv).")
+    parser.add_argument('--compress', action='store_true', help="Gzip CSV exports.")
+    parser.add_argument('--crn', action='store_true', help="Common random numbers (sets run_specs.crn): replication i of two scenarios with the same --seed is paired.")
+    parser.add_argument('--antithetic', action='store_true', help="Run every replication as an antithetic pair and report the pair-mean variance.")
+    parser.add_argument('--warm-start', default=None, help="Start every replication from this warm-start snapshot (see run_simulation.py --save-snapshot).")
+    parser.add_argument('--verbose', action='store_true', help="Show the full pipeline output of every replication.")
+    args = parser.parse_args(argv)
+
+    config = rs.load_config(args.config)
+    if args.crn:
+        config['run_specs']['crn'] = True
+    scenario_id = args.scenario_id or os.path.splitext(os.path.basename(args.config))[0]
+    folder = re.sub(r'[<>:"/\\|?*]', '_', args.output_folder).strip().rstrip('.') or 'replications'
+
+    return run_replications(
+        config,
+        scenario_id,
+        args.scenario_name or scenario_id,
+        args.replications,
+        master_seed=args.seed,
+        workers=args.workers,
+        folder=folder,
+        schema=args.schema,
+        export_format=args.format,
+        compress=args.compress,
+        load_method=args.load_method,
+        warm_start=args.warm_start,
+        antithetic=args.antithetic,
+        verbose=args.verbose,
+    )
+
+if __name__ == '__main__':
+    main()
@@ -18,6 +18,11 @@ Key Behavior / Organization
 ---------------------------
 - Interactive prompts collect run_mode (time or volume), machine/product counts,
   optional random seed, and export folder.
+- Running with command line arguments (see `cli()`) skips the prompts: the
+  config is read from a JSON/TOML/YAML file (presets in configs/) and the
+  seed, output folder and schema are given as options.
+- The pipeline itself is split into reusable functions: `build_rngs()`,
+  `load_config()` / `validate_config()` and `run_pipeline()`.
 - RNGs are derived from a master RNG to produce independent streams for
   different aspects of the simulation (arrival, processing, failure, quality,
   structure).
@@ -25,8 +30,53 @@ Key Behavior / Organization
   codebase and is passed into the `Plant` constructor.
 - Results returned from the Plant are exported via `export_to_folder` and a
   manifest is written describing the produced files.
-- PostgreSQL load is available via `load_to_postgres` but is commented out by
-  default to avoid accidental writes during testing.
+- Optionally, machine event logs are streamed to `event_chunks/` inside the
+  run folder while the simulation runs (see `EventSink.ChunkedFileSink`), which
+  bounds memory and keeps completed chunks if the run is interrupted. The
+  exporter and loaders then read those chunks one at a time.
+- With `run_specs.checkpoint_interval_days` set, the simulation state is saved
+  to `checkpoint.pkl` in the run folder at that simulated-time interval (see
+  `checkpoint`); `resume_pipeline()` / `--resume` continues an interrupted run
+  from it with identical output. The checkpoint is removed after the export.
+- With `run_specs.warmup_detection` set, the Plant samples WIP and
+  throughput every `warmup_sample_interval` seconds and MSER-5 locates the
+  end of the warm-up (see `output_analysis`); fact rows before it are flagged
+  in a `warmup` column.
+- With `run_specs.precision_target` set (e.g. 0.05), release stops before
+  `sim_horizon_days` once the batch-means confidence intervals of throughput,
+  lead time and utilization have a relative half-width at or below the
+  target; the horizon becomes an upper bound. The KPI estimates are recorded
+  in the manifest.
+- With `run_specs.crn` set (`--crn`), every stochastic draw comes from
+  per-machine and per-work-order substreams (common random numbers, see
+  `Plant.entity_rng`), so scenarios run with the same seed are paired and
+  the variance of their KPI differences drops.
+- With `run_specs.rng_block_size` set (e.g. 4096), the hot-path streams
+  draw their variates in blocks of that size (see `BufferedSampler`);
+  seeded runs stay reproducible but differ from unbuffered runs. Off by
+  default: per-draw cost roughly halves, but SimPy event handling dominates
+  a run and `benchmarks.benchmark_buffered_sampling` shows no end-to-end
+  gain (about 30,000 events/s either way on scenario C).
+- With `run_specs.failure_clock` = 'operating' (`--failure-clock`), the
+  time to failure only runs down while a machine is processing (MTBF in
+  operating hours) and idle machines schedule no failure events; the
+  default 'calendar' fails machines on wall-clock time, busy or idle.
+- Steps that end before their machine's next failure run as a single
+  timeout in the work order process when `run_specs.fast_path` is true
+  (default false; see `Plant.run_work_order`). It schedules fewer events,
+  but ties between a step end and other events at the same timestamp can
+  resolve differently, so seeded results may change when it is switched on.
+- `run_antithetic_pair()` / `--antithetic` runs a seed twice, the second
+  time with mirrored (1 - U) interarrival, batch-size, cycle-noise,
+  failure-time and repair draws (see `AntitheticGenerator`), and writes the
+  pair mean of the run KPIs to an `antithetic_<scenario_id>_<timestamp>.json`
+  manifest.
+- `save_warm_snapshot()` / `--save-snapshot` runs only the warm-up of a
+  time-driven config and saves the plant state; runs started with
+  `warm_start=` / `--warm-start` begin from that steady state instead of an
+  empty plant (see `checkpoint.warm_start_plant`).
+- PostgreSQL load is available via `load_to_postgres`, which is imported only
+  when the load step runs so startup does not pay for the database driver.
 
 Notes / Conventions
 -------------------
@@ -46,17 +96,637 @@ Notes / Conventions
 
 from pathlib import Path
 
+import argparse
+import copy
+import json
+import sys
 import pandas
 import numpy as np
 import export_to_folder as etf
-import load_to_postgres as ltp
 from datetime import datetime, timezone
 import numpy as np
 import re
 import helper_functions as hf
+import output_analysis as oa
 
 ####################################################################
 
+# Names of the independent RNG streams, in the order they are drawn from the master RNG
+RNG_STREAMS = ['arrival', 'processing', 'failure', 'quality', 'structure']
+
+# Top-level sections every config must provide
+REQUIRED_CONFIG_KEYS = [
+    'cycle_times',
+    'process_noise',
+    'time_to_failure',
+    'repair_behavior',
+    'product_family_weights',
+    'step_bounds',
+    'work_order_interarrival',
+    'batch_sizes',
+    'quality',
+    'run_specs',
+]
+# run_specs keys that must be given, and defaults for the optional ones
+REQUIRED_RUN_SPECS = ['run_mode', 'num_machines', 'num_products']
+RUN_SPEC_DEFAULTS = {
+    'num_work_orders': None,
+    'wip_limit': 0,
+    'wip_poll_interval': 60,
+    'sim_horizon_days': None,
+    'event_chunk_size': None,
+    'checkpoint_interval_days': None,
+    'warmup_detection': False,
+    'warmup_sample_interval': 3600,
+    'precision_target': None,
+    'precision_confidence': 0.95,
+    'crn': False,
+    'antithetic': None,
+    'rng_block_size': None,
+    'failure_clock': 'calendar',
+    'fast_path': False,
+}
+# Failure clocks: 'calendar' fails machines on wall-clock time, 'operating' only while processing
+FAILURE_CLOCKS = ('calendar', 'operating')
+# Antithetic pair members: run_specs.antithetic value -> scenario ID suffix
+ANTITHETIC_SIDES = {'base': '', 'mirror': 'M'}
+
+# Preset config files shipped with the project (see configs/)
+CONFIG_DIR = Path(__file__).resolve().parent / 'configs'
+
+####################################################################
+
+def build_rngs(seed=None) -> dict:
+    """
+    Derive the independent RNG streams used by the Plant from one master seed.
+
+    Parameters
+    ----------
+    seed : int, numpy.random.SeedSequence or None, optional
+        Master seed. None draws fresh OS entropy (non-reproducible run).
+
+    Returns
+    -------
+    dict
+        RNG streams keyed 'arrival', 'processing', 'failure', 'quality', 'structure'.
+    """
+    master_rng = np.random.default_rng(seed)
+    return {name: np.random.default_rng(master_rng.integers(1e9)) for name in RNG_STREAMS}
+
+def seed_module_rngs(seed):
+    """
+    Reseed the module-level fallback generators of Machine, helper_functions and data_generators.
+
+    Process noise, failure timing, repair durations and product yields are
+    drawn from these `local_rng` generators rather than from the injected
+    streams, so they must be reseeded for a seeded run to be reproducible.
+    The generators are reseeded in place, which also covers functions that
+    bound `local_rng` as a default argument.
+
+    Parameters
+    ----------
+    seed : int or numpy.random.SeedSequence
+        Seed of the run; three child sequences are derived from it without
+        modifying the caller's SeedSequence.
+    """
+    import Machine
+    import data_generators as dg
+
+    for module, child in zip([Machine, hf, dg], _module_seeds(seed)):
+        module.local_rng.bit_generator.state = np.random.default_rng(child).bit_generator.state
+
+def _module_seeds(seed) -> list:
+    """
+    Derive the seeds of the Machine, helper_functions and data_generators `local_rng` generators.
+
+    Parameters
+    ----------
+    seed : int or numpy.random.SeedSequence
+        Seed of the run (the caller's SeedSequence is not modified).
+
+    Returns
+    -------
+    list of numpy.random.SeedSequence
+    """
+    base = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    base = np.random.SeedSequence(base.entropy, spawn_key=base.spawn_key, pool_size=base.pool_size)
+    return base.spawn(3)
+
+def seed_structure_rngs(rngs, seed):
+    """
+    Replace the structure stream and `data_generators.local_rng` with the ones a run seeded with `seed` gets.
+
+    These two generators draw the plant (machines, products, routes) and the
+    work order attributes, so runs given the same structure seed simulate
+    the same plant whatever the seed of their other streams.
+
+    Parameters
+    ----------
+    rngs : dict
+        Streams from `build_rngs` (modified in place).
+    seed : int or numpy.random.SeedSequence
+        Seed the structure is taken from.
+    """
+    import data_generators as dg
+
+    rngs['structure'] = build_rngs(seed)['structure']
+    dg.local_rng.bit_generator.state = np.random.default_rng(_module_seeds(seed)[2]).bit_generator.state
+
+def describe_seed(seed):
+    """
+    Return a JSON-serializable description of a run seed (for manifests).
+
+    Parameters
+    ----------
+    seed : int, numpy.random.SeedSequence or None
+
+    Returns
+    -------
+    int, dict or None
+        The integer seed, `{'entropy': ..., 'spawn_key': [...]}` for a
+        SeedSequence, or None for an unseeded run.
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return {'entropy': seed.entropy, 'spawn_key': list(seed.spawn_key)}
+    return seed
+
+def validate_config(config: dict) -> dict:
+    """
+    Check a config dictionary and fill in optional `run_specs` defaults.
+
+    Parameters
+    ----------
+    config : dict
+        Configuration in the shape used by `main()` (stochastic sections plus `run_specs`).
+
+    Returns
+    -------
+    dict
+        The same dictionary, with missing optional `run_specs` keys set to
+        `RUN_SPEC_DEFAULTS`.
+
+    Raises
+    ------
+    ValueError
+        If required sections or run_specs keys are missing, or the run mode
+        is not 'time' or 'volume'.
+    """
+    missing = [key for key in REQUIRED_CONFIG_KEYS if key not in config]
+    if missing:
+        raise ValueError(f"Config is missing required section(s): {', '.join(missing)}")
+
+    run_specs = config['run_specs']
+    missing = [key for key in REQUIRED_RUN_SPECS if run_specs.get(key) is None]
+    if missing:
+        raise ValueError(f"Config run_specs is missing required key(s): {', '.join(missing)}")
+    for key, default in RUN_SPEC_DEFAULTS.items():
+        run_specs.setdefault(key, default)
+
+    if run_specs['run_mode'] not in ('time', 'volume'):
+        raise ValueError(f"run_specs.run_mode must be 'time' or 'volume', not {run_specs['run_mode']!r}")
+    if run_specs['run_mode'] == 'time' and not run_specs['sim_horizon_days']:
+        raise ValueError("run_specs.sim_horizon_days is required for a time-driven run")
+    if run_specs['run_mode'] == 'volume' and not run_specs['num_work_orders']:
+        raise ValueError("run_specs.num_work_orders is required for a volume-driven run")
+    if run_specs['precision_target'] is not None:
+        if run_specs['run_mode'] != 'time':
+            raise ValueError("run_specs.precision_target (precision-based stop) requires a time-driven run")
+        if not 0 < run_specs['precision_target'] < 1:
+            raise ValueError(f"run_specs.precision_target must be between 0 and 1, not {run_specs['precision_target']}")
+    if run_specs['rng_block_size'] is not None and run_specs['rng_block_size'] < 1:
+        raise ValueError(f"run_specs.rng_block_size must be positive, not {run_specs['rng_block_size']}")
+    if run_specs['failure_clock'] not in FAILURE_CLOCKS:
+        raise ValueError(f"run_specs.failure_clock must be one of {list(FAILURE_CLOCKS)}, not {run_specs['failure_clock']!r}")
+    if run_specs['antithetic'] not in (None, *ANTITHETIC_SIDES):
+        raise ValueError(f"run_specs.antithetic must be one of {sorted(ANTITHETIC_SIDES)} or unset, not {run_specs['antithetic']!r} "
+                         "(use run_antithetic_pair / --antithetic to run a pair)")
+    return config
+
+def read_config_file(path) -> dict:
+    """
+    Read a JSON, TOML or YAML file into a dictionary (no validation).
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        File ending in `.json`, `.toml`, `.yaml` or `.yml`.
+
+    Returns
+    -------
+    dict
+
+    Raises
+    ------
+    ValueError
+        If the extension is not supported.
+    ImportError
+        If a YAML file is given and PyYAML is not installed.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == '.json':
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    if suffix == '.toml':
+        try:
+            import tomllib
+        except ModuleNotFoundError:  # Python < 3.11
+            import tomli as tomllib
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    if suffix in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError as exc:
+            raise ImportError("YAML config files require PyYAML (pip install pyyaml).") from exc
+        with open(path, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f)
+    raise ValueError(f"Unsupported config file type {suffix!r}; use .json, .toml, .yaml or .yml")
+
+def load_config(path) -> dict:
+    """
+    Read a run configuration from a JSON, TOML or YAML file.
+
+    The file holds the same structure as the `config` dictionary built in
+    `main()`, including the `run_specs` section (see configs/ for presets).
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Config file ending in `.json`, `.toml`, `.yaml` or `.yml`.
+
+    Returns
+    -------
+    dict
+        Validated configuration (see `validate_config`).
+
+    Raises
+    ------
+    ValueError
+        If the extension is not supported or the config is incomplete.
+    ImportError
+        If a YAML file is given and PyYAML is not installed.
+    """
+    return validate_config(read_config_file(path))
+
+def run_pipeline(config, scenario_id, scenario_name, seed=None, folder='unspecified_runs', schema=None, run_id=None,
+                 export_format='csv', compress=False, load_method='insert', export_workers=1, part_rows=None, rngs=None,
+                 structure_cache=None, resume_state=None, warm_start=None, structure_seed=None):
+    """
+    Run one simulation end to end: simulate, collect, export, write manifest and optionally load.
+
+    Parameters
+    ----------
+    config : dict
+        Validated configuration (see `validate_config`).
+    scenario_id : str
+        Scenario identifier (used in `dim_scenario` and as export subfolder).
+    scenario_name : str
+        Scenario description.
+    seed : int, numpy.random.SeedSequence or None, optional
+        Master seed for `build_rngs` (ignored when `rngs` is given).
+    folder : str, optional
+        Export folder under `data/` (default 'unspecified_runs').
+    schema : str or None, optional
+        PostgreSQL schema to load into; None skips the database load.
+    run_id : str, optional
+        Run identifier; defaults to `<scenario_id>_<UTC ISO timestamp>`.
+    export_format : str, optional
+        'csv' (default), 'parquet' or 'feather' (see `export_to_folder.export_tables`).
+    compress : bool, optional
+        Gzip CSV outputs.
+    load_method : str, optional
+        'insert', 'copy' or 'atomic' (`load_to_postgres.load_run_atomically`).
+    export_workers : int, optional
+        Thread pool size for the export (only Parquet/Arrow exports scale with
+        it; see `export_to_folder.export_tables`).
+    part_rows : int, optional
+        Split fact tables larger than this into part files.
+    rngs : dict, optional
+        Pre-built RNG streams (keys as in `RNG_STREAMS`).
+    structure_cache : str or pathlib.Path, optional
+        Folder for cached dimension tables (see `structure_cache`); only
+        effective for seeded runs, since unseeded RNG states never repeat.
+    resume_state : dict, optional
+        Checkpoint from `checkpoint.load_checkpoint`; the run continues from
+        it instead of starting a new plant (use `resume_pipeline`).
+    warm_start : str or pathlib.Path, optional
+        Snapshot from `save_warm_snapshot`; the run starts from its steady
+        state and observes `sim_horizon_days` from there.
+    structure_seed : int or numpy.random.SeedSequence, optional
+        Seed the plant structure and work order attributes are drawn from
+        instead of `seed` (see `seed_structure_rngs`); runs sharing it share
+        the plant. Default None draws them from `seed`.
+
+    Returns
+    -------
+    dict
+        'run_id', 'run_dir' (export folder of this run), 'manifest_dir', 'seed'
+        and 'tables' (table name -> DataFrame).
+    """
+    import simpy
+    import checkpoint as ck
+    from Plant import Plant
+    from EventSink import ChunkedFileSink
+
+    if run_id is None:
+        # run_id includes scenario and an ISO timestamp (UTC)
+        run_id = f"{scenario_id}_{datetime.now(timezone.utc).isoformat()}"
+    if rngs is None and resume_state is None:
+        # Create independent RNG streams seeded from the master RNG for reproducibility
+        rngs = build_rngs(seed)
+        if seed is not None:
+            seed_module_rngs(seed)
+        if structure_seed is not None:
+            seed_structure_rngs(rngs, structure_seed)
+    run_dir = etf.run_directory(scenario_id, run_id, folder)
+
+    # Optionally stream machine event logs to chunk files inside the run folder
+    event_sink = None
+    if config['run_specs'].get('event_chunk_size'):
+        event_dir = run_dir / 'event_chunks'
+        # A resumed run keeps the chunks written before its checkpoint (see `checkpoint.restore_plant`)
+        event_sink = ChunkedFileSink(event_dir, chunk_size=config['run_specs']['event_chunk_size'], keep_parts=resume_state is not None)
+        print(f'Event logs will be streamed to {event_dir} in chunks of {event_sink.chunk_size:,} events.\n')
+
+    if resume_state is not None:
+        # Rebuild the plant and its processes from the checkpoint
+        plant = ck.restore_plant(resume_state, event_sink=event_sink)
+        env = plant.env
+        print(f'Simulation restored from checkpoint at t={env.now / 86400:,.2f} days.\n')
+        print('----------------------------------------------------------------------------------------------------------------------\n\n')
+        print('Resuming simulation run:\n\n')
+    elif warm_start is not None:
+        # Start from the steady state of a saved warm-up run
+        plant = ck.warm_start_plant(ck.load_checkpoint(warm_start), scenario_id, scenario_name, rngs, config=config, event_sink=event_sink)
+        env = plant.env
+        print('----------------------------------------------------------------------------------------------------------------------\n\n')
+        print('Beginning warm-started simulation run:\n\n')
+    else:
+        # Instantiate SimPy environment and Plant model
+        env = simpy.Environment()
+        plant = Plant(env, scenario_id, scenario_name, config, rngs, event_sink=event_sink, structure_cache=structure_cache)
+
+        print('Simulation environment initialized.\n') 
+        print('----------------------------------------------------------------------------------------------------------------------\n\n')
+        print('Beginning simulation run:\n\n')
+        env.process(plant.run())
+
+    # Run the environment until the Plant sets `done`, checkpointing on the way if configured
+    checkpoint_path = run_dir / ck.CHECKPOINT_FILE
+    checkpoint_days = config['run_specs'].get('checkpoint_interval_days')
+    if checkpoint_days:
+        metadata = {'run_id': run_id, 'folder': folder, 'seed': seed}
+        ck.run_with_checkpoints(plant, checkpoint_days * 86400, checkpoint_path, metadata=metadata)
+    else:
+        env.run(until=plant.done)
+    print('Simulation run complete.\n Collecting results...')
+
+    results = plant.collect_results()
+
+    print(f'Results collected.\n')
+    print('----------------------------------------------------------------------------------------------------------------------\n\n')
+   
+    print('Results tranfer initiating...\n')
+
+    # Unpack results into the canonical tables expected by exporters/loaders
+    dim_machine = results[0]
+    dim_product = results[1]
+    dim_process = results[2]
+    dim_process_route = results[3]
+    fact_work_order = results[4]
+    fact_production_event = results[5]
+    fact_downtime_event = results[6]
+    fact_quality_event = results[7]
+    dim_scenario = results[8]
+
+    tables = {
+        "dim_scenario": dim_scenario,
+        "dim_machine": dim_machine,
+        "dim_product": dim_product,
+        "dim_process": dim_process,
+        "dim_process_route": dim_process_route,
+        "fact_work_order": fact_work_order,
+        "fact_production_event": fact_production_event,
+        "fact_downtime_event": fact_downtime_event,
+        "fact_quality_event": fact_quality_event
+    }
+
+    # Export DataFrames to disk
+    print('Exporting data to specified folder...\n')
+    etf.export_tables(tables, scenario_id=scenario_id, run_id=run_id, compress_data=compress, folder_pointer=folder,
+                      file_format=export_format, max_workers=export_workers, part_rows=part_rows)
+    
+    # Build export_dir base used by write_manifest (must match export_tables layout)
+    export_dir = etf.BASE_DIR / 'data' / folder
+    
+    # Write manifest that records filenames and row counts
+    print('Writing manifest file for data export...\n')
+    manifest_dir = etf.write_manifest(
+                        export_dir=export_dir,
+                        run_id=run_id,
+                        scenario_id=scenario_id,
+                        scenario_tag=scenario_name,
+                        run_specs=config['run_specs'],
+                        config=config,
+                        tables=tables,
+                        random_seed=describe_seed(seed),
+                        output_analysis=plant.output_summary()
+                    )
+    print(f"Manifest file written to {manifest_dir}\n")
+
+    # The export is complete, so the run no longer needs its checkpoint
+    if checkpoint_path.exists():
+        checkpoint_path.unlink()
+
+    if schema is not None:
+        print('Data export complete.\n Loading data to PostgreSQL...\n')
+
+        # Import the loader only when loading (keeps SQLAlchemy/psycopg2 out of startup)
+        import load_to_postgres as ltp
+        if load_method == 'atomic':
+            ltp.load_run_atomically(tables, schema_selection=schema)
+        else:
+            ltp.load_run_to_postgres(tables, schema_selection=schema, method=load_method)
+
+        print('Data load to PostgreSQL complete.\n')
+
+    return {
+        'run_id': run_id,
+        'run_dir': run_dir,
+        'manifest_dir': manifest_dir,
+        'seed': seed,
+        'tables': tables,
+    }
+
+def save_warm_snapshot(config, warmup_days, path, seed=None, scenario_id='warmup', structure_cache=None):
+    """
+    Run the warm-up of a time-driven config and save the plant state as a warm-start snapshot.
+
+    Only the warm-up period is simulated; nothing is exported. Start runs
+    from the snapshot with `run_pipeline(..., warm_start=path)` or
+    `run_replications.py --warm-start`.
+
+    Parameters
+    ----------
+    config : dict
+        Validated time-driven configuration.
+    warmup_days : float
+        Simulated days to run before taking the snapshot; must be shorter
+        than `sim_horizon_days`.
+    path : str or pathlib.Path
+        Snapshot file to write.
+    seed : int, numpy.random.SeedSequence or None, optional
+        Master seed of the warm-up run.
+    scenario_id : str, optional
+        Scenario identifier of the warm-up run (not exported).
+    structure_cache : str or pathlib.Path, optional
+        See `run_pipeline`.
+
+    Returns
+    -------
+    pathlib.Path
+        Path of the snapshot.
+
+    Raises
+    ------
+    ValueError
+        If the config is not time-driven or the warm-up does not end before the horizon.
+    """
+    import simpy
+    import checkpoint as ck
+    from Plant import Plant
+
+    run_specs = config['run_specs']
+    if run_specs['run_mode'] != 'time':
+        raise ValueError("Warm-start snapshots are only supported for time-driven runs")
+    if not 0 < warmup_days < run_specs['sim_horizon_days']:
+        raise ValueError(f"warmup_days must be positive and shorter than sim_horizon_days ({run_specs['sim_horizon_days']}), not {warmup_days}")
+
+    rngs = build_rngs(seed)
+    if seed is not None:
+        seed_module_rngs(seed)
+    env = simpy.Environment()
+    plant = Plant(env, scenario_id, scenario_id, config, rngs, structure_cache=structure_cache)
+    env.process(plant.run())
+
+    print(f'Running {warmup_days:g} day warm-up...\n')
+    env.run(until=warmup_days * 24 * 3600)
+
+    # Warm-up events are never observed, so keep them out of the snapshot
+    for machine in plant.Machines:
+        for name in ck.LOG_NAMES:
+            getattr(machine, name).clear()
+    path = ck.save_checkpoint(plant, path, metadata={'warmup_days': warmup_days, 'seed': describe_seed(seed)})
+    print(f"Warm-start snapshot ({len(plant.work_order_state)} work orders in flight) written to {path}\n")
+    return path
+
+def run_antithetic_pair(config, scenario_id, scenario_name, seed=None, folder='unspecified_runs', **kwargs) -> dict:
+    """
+    Run an antithetic pair of one scenario and record the pair mean of its KPIs.
+
+    Both runs use the same seed; the mirror run (scenario `<scenario_id>M`)
+    draws interarrivals, batch sizes, cycle noise, failure times and repair
+    times from 1 - U where the base run uses U (`run_specs.antithetic`, see `AntitheticGenerator`).
+    The pair manifest `data/<folder>/antithetic_<scenario_id>_<timestamp>.json`
+    lists both runs with their KPIs (`output_analysis.run_kpis`) and the
+    pair mean (`output_analysis.antithetic_summary`); the variance of the
+    pair mean needs several pairs (`run_replications.py --antithetic`).
+
+    Parameters
+    ----------
+    config : dict
+        Validated configuration (see `validate_config`).
+    scenario_id : str
+        Scenario identifier of the base run.
+    scenario_name : str
+        Scenario description shared by both runs.
+    seed : int, numpy.random.SeedSequence or None, optional
+        Seed of both runs (None draws fresh entropy, recorded in the manifests).
+    folder : str, optional
+        Export folder under `data/` (default 'unspecified_runs').
+    **kwargs
+        Further options of `run_pipeline` (export, load, structure cache, warm start).
+
+    Returns
+    -------
+    dict
+        The pair manifest, with each run's `run_pipeline` result under 'results'
+        (not written to the file).
+    """
+    if seed is None:
+        seed = np.random.SeedSequence()
+    created_at = datetime.now(timezone.utc)
+
+    runs = []
+    results = []
+    for side, suffix in ANTITHETIC_SIDES.items():
+        side_config = copy.deepcopy(config)
+        side_config['run_specs']['antithetic'] = side
+        print(f"Running the {side} run of the antithetic pair...\n")
+        result = run_pipeline(side_config, scenario_id + suffix, scenario_name, seed=seed, folder=folder, **kwargs)
+        results.append(result)
+        runs.append({
+            'antithetic': side,
+            'scenario_id': scenario_id + suffix,
+            'run_id': result['run_id'],
+            'kpis': oa.run_kpis(result['tables']),
+        })
+
+    manifest = {
+        'scenario_id': scenario_id,
+        'scenario_name': scenario_name,
+        'created_at': created_at.isoformat().replace("+00:00", "Z"),
+        'seed': describe_seed(seed),
+        'runs': runs,
+        'antithetic': oa.antithetic_summary([(runs[0]['kpis'], runs[1]['kpis'])]),
+    }
+    export_dir = etf.BASE_DIR / 'data' / folder
+    export_dir.mkdir(parents=True, exist_ok=True)
+    safe_stamp = re.sub(r'[<>:"/\\|?*]', '-', created_at.isoformat())
+    manifest_path = export_dir / f"antithetic_{scenario_id}_{safe_stamp}.json"
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Antithetic pair finished. Pair manifest written to {manifest_path}\n")
+    return dict(manifest, results=results)
+
+def resume_pipeline(checkpoint_path, **kwargs):
+    """
+    Continue an interrupted run from its checkpoint and finish the pipeline.
+
+    The scenario, config, run_id, export folder and seed are taken from the
+    checkpoint, so the run writes to its original folder and produces the
+    same output as an uninterrupted run.
+
+    Parameters
+    ----------
+    checkpoint_path : str or pathlib.Path
+        Checkpoint file, or the run folder containing it.
+    **kwargs
+        Export and load options of `run_pipeline` (schema, export_format,
+        compress, load_method, export_workers, part_rows).
+
+    Returns
+    -------
+    dict
+        Result of `run_pipeline`.
+    """
+    import checkpoint as ck
+
+    state = ck.load_checkpoint(checkpoint_path)
+    metadata = state['metadata']
+    print(f"Resuming run {metadata['run_id']} from {checkpoint_path}\n")
+    return run_pipeline(
+        state['config'],
+        state['scenario_id'],
+        state['scenario_name'],
+        seed=metadata['seed'],
+        folder=metadata['folder'],
+        run_id=metadata['run_id'],
+        resume_state=state,
+        **kwargs,
+    )
+
 def main():
     """
     Interactive entry point for running a single simulation.
@@ -82,8 +752,6 @@ def main():
 
     if start_bool.lower() == 'y':
         print('\nPlease enter the following information to begin...\n')
-        import simpy
-        from Plant import Plant
 
         counter = 0
         # Ask user to pick a run mode: time-driven or volume-driven
@@ -113,6 +781,7 @@ def main():
         # Collect work order limits
         wip_spec = input('\nOptional - Max concurrent Work-In-Progress (enter for no limit): ')
         poll_interval_spec = input('Optional - WIP poll interval in seconds (enter for default 60): ')
+        event_chunk_spec = input('Optional - Stream event logs to disk every N events (enter to keep in memory): ')
 
         scenario_val = input('\nEnter Scenario ID (e.g. SS1010TD50WSPS5060SE67R1): ')
         scenario_name = input('Enter Scenario Name (e.g. Small_Scale_Time_Driven): ')
@@ -121,14 +790,11 @@ def main():
         seed_check = input('\nInclude a Random Seed? (Y/N): ')
         if seed_check.lower() == 'y':
             seed_val = int(input('Enter Random Seed: '))
-            master_rng = np.random.default_rng(seed_val)
         elif seed_check.lower() == 'n':
             seed_val = None
-            master_rng = np.random.default_rng()
         else:
             print("Invalid response given, seed will be set to none")
             seed_val = None
-            master_rng = np.random.default_rng()
 
         # Request export folder and sanitize; default to 'unspecified_runs' if blank
         while True:
@@ -162,15 +828,6 @@ def main():
         print("----------------------------------------------------------------------------------------------------------------------\n\n")
         print("Setting up configuration values for run...")
 
-        # Create independent RNG streams seeded from the master RNG for reproducibility
-        rngs = {
-            'arrival': np.random.default_rng(master_rng.integers(1e9)),
-            'processing': np.random.default_rng(master_rng.integers(1e9)),
-            'failure': np.random.default_rng(master_rng.integers(1e9)),
-            'quality': np.random.default_rng(master_rng.integers(1e9)),
-            'structure': np.random.default_rng(master_rng.integers(1e9))
-        }
-
         # Configuration dictionary passed into Plant - keep units documented (seconds/minutes)
         config = {
             "cycle_times": {
@@ -230,81 +887,15 @@ def main():
                 'num_work_orders': hf.safe_int(work_order_volume_spec),
                 'wip_limit': 0 if wip_spec == '' else hf.safe_int(wip_spec),
                 'wip_poll_interval': 60 if poll_interval_spec == '' else hf.safe_int(poll_interval_spec),
-                'sim_horizon_days': hf.safe_float(sim_horizon_spec) #days
+                'sim_horizon_days': hf.safe_float(sim_horizon_spec), #days
+                'event_chunk_size': None if event_chunk_spec == '' else hf.safe_int(event_chunk_spec)
             }
         }
 
         print('Configuration setup complete.\n\n Initializing simulation environment...')
 
-        # Instantiate SimPy environment and Plant model
-        env = simpy.Environment()
-        plant = Plant(env, scenario_val, scenario_name, config, rngs)
+        run_pipeline(config, scenario_val, scenario_name, seed=seed_val, folder=folder_spec, schema=schema_spec, run_id=run_val)
 
-        print('Simulation environment initialized.\n') 
-        print('----------------------------------------------------------------------------------------------------------------------\n\n')
-        print('Beginning simulation run:\n\n')
-        env.process(plant.run())
-
-        # Run the environment until the Plant sets `done`
-        env.run(until=plant.done)
-        print('Simulation run complete.\n Collecting results...')
-
-        results = plant.collect_results()
-
-        print(f'Results collected.\n')
-        print('----------------------------------------------------------------------------------------------------------------------\n\n')
-       
-        print('Results tranfer initiating...\n')
-
-        # Unpack results into the canonical tables expected by exporters/loaders
-        dim_machine = results[0]
-        dim_product = results[1]
-        dim_process = results[2]
-        dim_process_route = results[3]
-        fact_work_order = results[4]
-        fact_production_event = results[5]
-        fact_downtime_event = results[6]
-        fact_quality_event = results[7]
-        dim_scenario = results[8]
-
-        tables = {
-            "dim_scenario": dim_scenario,
-            "dim_machine": dim_machine,
-            "dim_product": dim_product,
-            "dim_process": dim_process,
-            "dim_process_route": dim_process_route,
-            "fact_work_order": fact_work_order,
-            "fact_production_event": fact_production_event,
-            "fact_downtime_event": fact_downtime_event,
-            "fact_quality_event": fact_quality_event
-        }
-
-        # Export DataFrames to disk
-        print('Exporting data to specified folder...\n')
-        etf.export_tables(tables, scenario_id=scenario_val, run_id=run_val, folder_pointer=folder_spec)
-        
-        # Build export_dir base used by write_manifest (must match export_tables layout)
-        export_dir = Path(__file__).resolve().parent / 'data' / folder_spec
-        
-        # Write manifest that records filenames and row counts
-        print('Writing manifest file for data export...\n')
-        manifest_dir = etf.write_manifest(
-                            export_dir=export_dir,
-                            run_id=run_val,
-                            scenario_id=scenario_val,
-                            scenario_tag=scenario_name,
-                            run_specs=config['run_specs'],
-                            config=config,
-                            tables=tables,
-                            random_seed=seed_val
-                        )
-        print(f"Manifest file written to {manifest_dir}\n")
-
-        print('Data export complete.\n Loading data to PostgreSQL...\n')
-
-        ltp.load_run_to_postgres(tables, schema_selection=schema_spec)
-
-        print('Data load to PostgreSQL complete.\n')
         print('----------------------------------------------------------------------------------------------------------------------\n\n')
         print('Simulation process finished successfully.\n')
         print('See specified directories and databases for output. Thank you for using the Manufacturing Plant Simulation.\n')
@@ -314,195 +905,99 @@ def main():
         print('Exiting simulation setup. Please rerun when ready.')
         return
 
-if __name__ == '__main__':
-    main()
+def cli(argv=None):
+    """
+    Non-interactive entry point: run one simulation from a config file.
 
-"""
-    # Example configuration presets (formatted for easy editing)
+    Example
+    -------
+        python run_simulation.py --config configs/scenario_C.toml --seed 42 \
+            --output-folder batch_runs --format parquet --checkpoint-days 30
+        python run_simulation.py --resume ../data/batch_runs/scenario_C/<run_id>
 
-    # A - Large time-driven run with WIP limit enabled
-    config_A = {
-        "cycle_times": {
-            "type": "discrete_uniform",
-            "time_range": (600, 5400),  # seconds
-        },
-        "process_noise": {
-            "type": "normal clipped",
-            "mean_val": 1.0,
-            "var_val": 0.1,
-            "min_val": 0.85,
-            "max_val": 1.20,
-        },
-        "time_to_failure": {
-            "type": "exponential",
-            "low_range": 14400,   # seconds
-            "high_range": 288000, # seconds
-        },
-        "repair_behavior": {
-            "type": "lognormal_clipped",
-            "mean_val": 30,    # minutes
-            "var_val": 0.6,
-            "min_bound": 300,   # seconds
-            "max_bound": 86400, # seconds
-        },
-        "product_family_weights": {
-            "Logic Weight": 0.25,
-            "Memory Wight": 0.25,
-            "Analog Weight": 0.25,
-            "Power Weight": 0.25,
-        },
-        "step_bounds": {
-            "type": "discrete_uniform",
-            "min_steps": 3,
-            "max_steps": 6,
-        },
-        "work_order_interarrival": {
-            "type": "gamma",
-            "shape": 4.0,
-            "scale": 1200.0, mean = 3600s
-        },
-        "batch_sizes": {
-            "type": "poisson_clipped",
-            "lambda": 5,
-            "min_val": 1,
-            "max_val": 12,
-        },
-        "quality": {
-            "interrupt_penalty": 0.02,
-            "min_yield": 0.85,
-        },
-        "run_specs": {
-            "run_mode": "time",
-            "num_machines": 100,
-            "num_products": 50,
-            "num_work_orders": 0,        # not required in time mode
-            "wip_limit": 125,
-            "wip_poll_interval": 60,     # seconds
-            "sim_horizon_days": 180,     # days
-        },
-    }
+    Parameters
+    ----------
+    argv : list of str, optional
+        Command line arguments (default: `sys.argv[1:]`).
 
-    # B - Time-driven with increased interarrival (throttled arrivals), no WIP limit
-    config_B = {
-        "cycle_times": {
-            "type": "discrete_uniform",
-            "time_range": (600, 5400),
-        },
-        "process_noise": {
-            "type": "normal clipped",
-            "mean_val": 1.0,
-            "var_val": 0.1,
-            "min_val": 0.85,
-            "max_val": 1.20,
-        },
-        "time_to_failure": {
-            "type": "exponential",
-            "low_range": 14400,
-            "high_range": 288000,
-        },
-        "repair_behavior": {
-            "type": "lognormal_clipped",
-            "mean_val": 30,
-            "var_val": 0.6,
-            "min_bound": 300,
-            "max_bound": 86400,
-        },
-        "product_family_weights": {
-            "Logic Weight": 0.25,
-            "Memory Wight": 0.25,
-            "Analog Weight": 0.25,
-            "Power Weight": 0.25,
-        },
-        "step_bounds": {
-            "type": "discrete_uniform",
-            "min_steps": 3,
-            "max_steps": 6,
-        },
-        "work_order_interarrival": {
-            "type": "gamma",
-            "shape": 4.0,
-            "scale": 13.75,  
-        },
-        "batch_sizes": {
-            "type": "poisson_clipped",
-            "lambda": 5,
-            "min_val": 1,
-            "max_val": 12,
-        },
-        "quality": {
-            "interrupt_penalty": 0.02,
-            "min_yield": 0.85,
-        },
-        "run_specs": {
-            "run_mode": "time",
-            "num_machines": 100,
-            "num_products": 50,
-            "num_work_orders": 0,
-            "wip_limit": 5000,            # 0 or None = no limit
-            "wip_poll_interval": 60,    # ignored when wip_limit is 0
-            "sim_horizon_days": 30,
-        },
+    Returns
+    -------
+    dict or pathlib.Path
+        Result of `run_pipeline` (run identifiers, folders and tables), the
+        pair manifest with `--antithetic`, or the snapshot path with `--save-snapshot`.
+    """
+    parser = argparse.ArgumentParser(description="Run the Manufacturing Plant Simulation headlessly from a config file.")
+    parser.add_argument('--config', default=None, help="Config file (.json, .toml, .yaml/.yml) with the `config` dict layout, including run_specs. Presets live in configs/.")
+    parser.add_argument('--seed', type=int, default=None, help="Master random seed (default: unseeded).")
+    parser.add_argument('--scenario-id', default=None, help="Scenario ID (default: config file name).")
+    parser.add_argument('--scenario-name', default=None, help="Scenario name (default: the scenario ID).")
+    parser.add_argument('--output-folder', default='unspecified_runs', help="Export folder under data/ (default: unspecified_runs).")
+    parser.add_argument('--schema', default=None, help="PostgreSQL schema to load results into (default: skip the database load).")
+    parser.add_argument('--load-method', choices=['insert', 'copy', 'atomic'], default='insert', help="Database load method (default: insert).")
+    parser.add_argument('--format', choices=sorted(etf.FILE_FORMATS), default='csv', help="Export file format (default: csv).")
+    parser.add_argument('--compress', action='store_true', help="Gzip CSV exports.")
+    parser.add_argument('--export-workers', type=int, default=1, help="Threads used to write export files (default: 1). Only parquet/feather exports scale; CSV formatting holds the GIL.")
+    parser.add_argument('--part-rows', type=int, default=None, help="Split fact tables larger than this into part files.")
+    parser.add_argument('--structure-cache', default=None, help="Folder caching generated dimension tables between seeded runs (default: no cache).")
+    parser.add_argument('--crn', action='store_true', help="Common random numbers: per-machine and per-work-order substreams for paired scenario comparisons (sets run_specs.crn).")
+    parser.add_argument('--failure-clock', choices=FAILURE_CLOCKS, default=None, help="Run machine failures on calendar or operating time (overrides run_specs.failure_clock).")
+    parser.add_argument('--antithetic', action='store_true', help="Run an antithetic pair (second run with mirrored interarrival, batch-size, cycle-noise, failure and repair draws) and write the pair mean.")
+    parser.add_argument('--checkpoint-days', type=float, default=None, help="Save a checkpoint every N simulated days (overrides run_specs.checkpoint_interval_days).")
+    parser.add_argument('--resume', default=None, help="Continue an interrupted run from its checkpoint file or run folder (replaces --config).")
+    parser.add_argument('--warm-start', default=None, help="Start from a steady-state snapshot written with --save-snapshot instead of an empty plant.")
+    parser.add_argument('--save-snapshot', default=None, help="Only run the warm-up (--warmup-days) and save a warm-start snapshot to this file.")
+    parser.add_argument('--warmup-days', type=float, default=None, help="Warm-up length in simulated days for --save-snapshot.")
+    args = parser.parse_args(argv)
+
+    export_options = {
+        'schema': args.schema,
+        'export_format': args.format,
+        'compress': args.compress,
+        'load_method': args.load_method,
+        'export_workers': args.export_workers,
+        'part_rows': args.part_rows,
     }
+    if args.resume is not None:
+        return resume_pipeline(args.resume, **export_options)
+    if args.config is None:
+        parser.error("one of --config or --resume is required")
+
+    config = load_config(args.config)
+    # run_specs overrides apply to snapshots too, so a later --warm-start with the same flags matches
+    if args.checkpoint_days is not None:
+        config['run_specs']['checkpoint_interval_days'] = args.checkpoint_days
+    if args.crn:
+        config['run_specs']['crn'] = True
+    if args.failure_clock is not None:
+        config['run_specs']['failure_clock'] = args.failure_clock
+    if args.save_snapshot is not None:
+        if args.warmup_days is None:
+            parser.error("--save-snapshot requires --warmup-days")
+        return save_warm_snapshot(config, args.warmup_days, args.save_snapshot, seed=args.seed,
+                                  structure_cache=args.structure_cache)
+    scenario_id = args.scenario_id or Path(args.config).stem
+    # Replace characters invalid on Windows/other filesystems with underscore
+    folder = re.sub(r'[<>:"/\\|?*]', '_', args.output_folder).strip().rstrip('.') or 'unspecified_runs'
+
+    runner = run_antithetic_pair if args.antithetic else run_pipeline
+    return runner(
+        config,
+        scenario_id,
+        args.scenario_name or scenario_id,
+        seed=args.seed,
+        folder=folder,
+        structure_cache=args.structure_cache,
+        warm_start=args.warm_start,
+        **export_options,
+    )
 
-    # C - Time-driven with modest WIP cap (recommended realistic preset)
-    config_C = {
-        "cycle_times": {
-            "type": "discrete_uniform",
-            "time_range": (600, 5400),
-        },
-        "process_noise": {
-            "type": "normal clipped",
-            "mean_val": 1.0,
-            "var_val": 0.1,
-            "min_val": 0.85,
-            "max_val": 1.20,
-        },
-        "time_to_failure": {
-            "type": "exponential",
-            "low_range": 14400,
-            "high_range": 288000,
-        },
-        "repair_behavior": {
-            "type": "lognormal_clipped",
-            "mean_val": 30,
-            "var_val": 0.6,
-            "min_bound": 300,
-            "max_bound": 86400,
-        },
-        "product_family_weights": {
-            "Logic Weight": 0.25,
-            "Memory Wight": 0.25,
-            "Analog Weight": 0.25,
-            "Power Weight": 0.25,
-        },
-        "step_bounds": {
-            "type": "discrete_uniform",
-            "min_steps": 3,
-            "max_steps": 6,
-        },
-        "work_order_interarrival": {
-            "type": "gamma",
-            "shape": 4.0,
-            "scale": 10.0,
-        },
-        "batch_sizes": {
-            "type": "poisson_clipped",
-            "lambda": 5,
-            "min_val": 1,
-            "max_val": 12,
-        },
-        "quality": {
-            "interrupt_penalty": 0.02,
-            "min_yield": 0.85,
-        },
-        "run_specs": {
-            "run_mode": "time",
-            "num_machines": 100,
-            "num_products": 50,
-            "num_work_orders": 0,
-            "wip_limit": 80,           # modest WIP cap
-            "wip_poll_interval": 60,   # seconds
-            "sim_horizon_days": 180,
-        },
-    }
-"""
\ No newline at end of file
+if __name__ == '__main__':
+    # Any command line arguments select the non-interactive CLI
+    if len(sys.argv) > 1:
+        cli()
+    else:
+        main()
+
+# Example configuration presets A, B and C are provided as config files in configs/
+# (scenario_A.toml, scenario_B.toml, scenario_C.toml) for use with the CLI:
+#     python run_simulation.py --config configs/scenario_A.toml --seed 2025
@@ -0,0 +1,408 @@
+# Parameter sweep / design-of-experiments executor for the Manufacturing Plant Simulation
+"""
+Run a designed set of scenarios derived from one base config.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+Scenarios such as the A/B/C presets differ in only a few config keys
+(interarrival scale, WIP limit, step bounds, product mix). This module takes
+a base config plus parameter ranges, generates the design points (full
+factorial, Latin hypercube or random), runs every point through
+`run_simulation.run_pipeline` on a process pool, and keeps a ledger so an
+interrupted or partially failed sweep can be resumed.
+
+Sweep Spec
+----------
+A JSON/TOML/YAML file, e.g. configs/sweep_interarrival_wip.toml:
+
+    base_config = "scenario_C.toml"      # relative to the spec file
+    design = "latin_hypercube"           # "factorial", "latin_hypercube" or "random"
+    samples = 12                         # points for latin_hypercube / random
+    seed = 2025                          # design sampling and run seed
+    scenario_prefix = "SWP"
+
+    [parameters]
+    "work_order_interarrival.scale" = { low = 8.0, high = 16.0 }
+    "run_specs.wip_limit" = { low = 40, high = 160, integer = true }
+    "step_bounds.max_steps" = [6, 8, 10]
+
+Parameters are dotted paths into the config. A list gives discrete levels;
+a `{low, high}` table gives a range (`integer = true` for whole numbers and,
+for factorial designs, `levels = n` evenly spaced values).
+
+Key Behavior / Conventions
+--------------------------
+- Each point's config (plus run seed) is hashed (SHA-256 of canonical JSON);
+  the scenario_id is `<scenario_prefix><first 10 hex digits>`, so identical
+  points always map to the same scenario_id in `dim_scenario`.
+- Points whose hash is already `completed` in the ledger, or duplicated
+  within the design, are skipped. Failed and never-run points are scheduled.
+- The ledger (`data/<output_folder>/sweep_ledger.jsonl`) gets one JSON line
+  per finished point, written by the parent process as results arrive.
+- Every point runs in a fresh spawned worker process (`multiprocessing.Pool`
+  with `maxtasksperchild=1`, available on every supported Python version).
+- Points share a structure cache (`data/<output_folder>/structure_cache`), so
+  dimension tables are generated once per distinct structure (see
+  `structure_cache`); `--no-structure-cache` regenerates them per point.
+- Usage:
+      python run_sweep.py configs/sweep_interarrival_wip.toml --workers 4
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import argparse
+import contextlib
+import copy
+import hashlib
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import re
+import time
+import traceback
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import export_to_folder as etf
+import run_simulation as rs
+
+####################################################################
+
+# Supported experimental designs
+DESIGNS = ['factorial', 'latin_hypercube', 'random']
+
+####################################################################
+## Design Generation ##
+####################################################################
+
+def _to_python(value):
+    """
+    Convert NumPy scalars to plain Python values (for JSON and hashing).
+    """
+    return value.item() if isinstance(value, np.generic) else value
+
+def _levels(name, spec) -> list:
+    """
+    Return the discrete levels of one parameter for a factorial design.
+    """
+    if isinstance(spec, list):
+        return spec
+    if 'levels' not in spec:
+        raise ValueError(f"Parameter {name!r} needs a list of values or 'levels' for a factorial design")
+    values = np.linspace(spec['low'], spec['high'], int(spec['levels']))
+    if spec.get('integer'):
+        values = np.unique(np.round(values).astype(int))
+    return [_to_python(value) for value in values]
+
+def _from_unit(spec, u):
+    """
+    Map a uniform draw u in [0, 1) onto one parameter's levels or range.
+    """
+    if isinstance(spec, list):
+        return spec[min(int(u * len(spec)), len(spec) - 1)]
+    low, high = spec['low'], spec['high']
+    if spec.get('integer'):
+        return int(min(low + np.floor(u * (high - low + 1)), high))
+    return float(low + u * (high - low))
+
+def generate_design(parameters: dict, design: str = 'factorial', samples: int = None, seed=None) -> list:
+    """
+    Generate the design points of a sweep.
+
+    Parameters
+    ----------
+    parameters : dict
+        Mapping dotted config path -> list of levels or `{low, high[, integer][, levels]}`.
+    design : str, optional
+        'factorial' (every combination of levels), 'latin_hypercube' or 'random'.
+    samples : int, optional
+        Number of points for 'latin_hypercube' and 'random' designs.
+    seed : int, optional
+        Seed for the sampled designs.
+
+    Returns
+    -------
+    list of dict
+        One mapping dotted path -> value per design point.
+
+    Raises
+    ------
+    ValueError
+        For an unknown design or missing `samples`.
+    """
+    names = list(parameters)
+    if design == 'factorial':
+        grids = [_levels(name, parameters[name]) for name in names]
+        return [dict(zip(names, combination)) for combination in itertools.product(*grids)]
+
+    if design not in DESIGNS:
+        raise ValueError(f"Design must be one of {DESIGNS}, not {design!r}")
+    if not samples or samples < 1:
+        raise ValueError(f"A {design} design needs a positive 'samples' count")
+
+    rng = np.random.default_rng(seed)
+    if design == 'latin_hypercube':
+        # One draw per stratum [k/n, (k+1)/n), strata shuffled independently per parameter
+        unit = np.column_stack([(rng.permutation(samples) + rng.random(samples)) / samples for _ in names])
+    else:
+        unit = rng.random((samples, len(names)))
+    return [
+        {name: _to_python(_from_unit(parameters[name], u)) for name, u in zip(names, row)}
+        for row in unit
+    ]
+
+####################################################################
+## Config Handling ##
+####################################################################
+
+def apply_parameters(base_config: dict, point: dict) -> dict:
+    """
+    Return a copy of `base_config` with the design point's values set.
+
+    Parameters
+    ----------
+    base_config : dict
+    point : dict
+        Mapping dotted path (e.g. 'run_specs.wip_limit') -> value.
+
+    Returns
+    -------
+    dict
+
+    Raises
+    ------
+    KeyError
+        If a dotted path does not exist in the base config (catches typos).
+    """
+    config = copy.deepcopy(base_config)
+    for path, value in point.items():
+        keys = path.split('.')
+        target = config
+        for key in keys[:-1]:
+            target = target[key]
+        if keys[-1] not in target:
+            raise KeyError(f"Sweep parameter {path!r} does not exist in the base config")
+        target[keys[-1]] = value
+    return config
+
+def config_hash(config: dict, seed=None) -> str:
+    """
+    Return the SHA-256 hex digest identifying a run (config plus seed).
+
+    Parameters
+    ----------
+    config : dict
+    seed : int, optional
+
+    Returns
+    -------
+    str
+    """
+    payload = json.dumps({'config': config, 'seed': seed}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def read_ledger(ledger_path) -> dict:
+    """
+    Read the latest ledger record per config hash.
+
+    Parameters
+    ----------
+    ledger_path : pathlib.Path
+
+    Returns
+    -------
+    dict
+        Mapping config_hash -> last record written for it (empty if no ledger).
+    """
+    records = {}
+    if Path(ledger_path).exists():
+        with open(ledger_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    records[record['config_hash']] = record
+    return records
+
+####################################################################
+## Execution ##
+####################################################################
+
+def _run_point(task: dict) -> dict:
+    """
+    Worker entry point: run one design point and return its ledger record.
+
+    Failures are caught and reported in the record so the sweep continues.
+    """
+    task = dict(task)
+    record = task.pop('record')
+    verbose = task.pop('verbose')
+
+    start = time.perf_counter()
+    try:
+        if verbose:
+            result = rs.run_pipeline(**task)
+        else:
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = rs.run_pipeline(**task)
+        record['status'] = 'completed'
+        record['run_id'] = result['run_id']
+        record['run_dir'] = str(result['run_dir'].relative_to(etf.BASE_DIR / 'data' / task['folder']))
+        record['rows'] = {table: int(len(df)) for table, df in result['tables'].items()}
+    except Exception as exc:
+        record['status'] = 'failed'
+        record['error'] = repr(exc)
+        record['traceback'] = traceback.format_exc()
+    record['seconds'] = round(time.perf_counter() - start, 3)
+    record['finished_at'] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    return record
+
+def run_sweep(base_config: dict, parameters: dict, design: str = 'factorial', samples: int = None, seed=None,
+              scenario_prefix: str = 'SWP', workers: int = None, folder: str = 'sweeps', schema: str = None,
+              export_format: str = 'csv', compress: bool = False, load_method: str = 'insert',
+              structure_cache: bool = True, dry_run: bool = False, verbose: bool = False) -> list:
+    """
+    Generate a design, skip points already completed, and run the rest on a process pool.
+
+    Parameters
+    ----------
+    base_config : dict
+        Validated base configuration.
+    parameters : dict
+        Parameter specification (see `generate_design`).
+    design : str, optional
+        'factorial', 'latin_hypercube' or 'random'.
+    samples : int, optional
+        Points for sampled designs.
+    seed : int, optional
+        Seed for design sampling; also the run seed of every point, so points
+        differ only in their parameters.
+    scenario_prefix : str, optional
+        Prefix of the generated scenario IDs.
+    workers : int, optional
+        Worker processes (default: `os.cpu_count()`).
+    folder : str, optional
+        Export folder under `data/` holding the runs and the ledger.
+    schema : str, optional
+        PostgreSQL schema to load each point into (default: no load).
+    export_format, compress, load_method : optional
+        Passed to `run_simulation.run_pipeline`.
+    structure_cache : bool, optional
+        Share cached dimension tables between points (default True).
+    dry_run : bool, optional
+        Only report which points would run.
+    verbose : bool, optional
+        Show each worker's pipeline output.
+
+    Returns
+    -------
+    list of dict
+        Ledger records of the points run in this call (planned records for a dry run).
+    """
+    ledger_path = etf.BASE_DIR / 'data' / folder / 'sweep_ledger.jsonl'
+    cache_dir = etf.BASE_DIR / 'data' / folder / 'structure_cache' if structure_cache else None
+    ledger = read_ledger(ledger_path)
+
+    # Build tasks, deduplicating by config hash against the ledger and the design itself
+    tasks = []
+    seen = set()
+    skipped = 0
+    for point in generate_design(parameters, design, samples, seed):
+        config = rs.validate_config(apply_parameters(base_config, point))
+        digest = config_hash(config, seed)
+        if digest in seen or ledger.get(digest, {}).get('status') == 'completed':
+            skipped += 1
+            continue
+        seen.add(digest)
+
+        scenario_id = f"{scenario_prefix}{digest[:10]}"
+        scenario_name = ', '.join(f"{path}={value}" for path, value in point.items())
+        tasks.append({
+            'record': {'scenario_id': scenario_id, 'config_hash': digest, 'parameters': point, 'seed': seed},
+            'verbose': verbose,
+            'config': config,
+            'scenario_id': scenario_id,
+            'scenario_name': scenario_name,
+            'seed': seed,
+            'folder': folder,
+            'schema': schema,
+            'export_format': export_format,
+            'compress': compress,
+            'load_method': load_method,
+            'structure_cache': cache_dir,
+        })
+
+    print(f"Sweep design '{design}': {len(tasks) + skipped} point(s), {skipped} already completed or duplicated, {len(tasks)} to run.\n")
+    if dry_run or not tasks:
+        return [task['record'] for task in tasks]
+
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    ledger_path.parent.mkdir(parents=True, exist_ok=True)
+    records = []
+    start = time.perf_counter()
+    with multiprocessing.get_context('spawn').Pool(processes=workers, maxtasksperchild=1) as pool, \
+            open(ledger_path, 'a', encoding='utf-8') as ledger_file:
+        for record in pool.imap_unordered(_run_point, tasks):
+            records.append(record)
+            # Persist each result immediately so an interrupted sweep can resume
+            ledger_file.write(json.dumps({key: value for key, value in record.items() if key != 'traceback'}) + '\n')
+            ledger_file.flush()
+            print(f"[{len(records)}/{len(tasks)}] {record['scenario_id']} {record['status']} ({record['seconds']:.1f}s): {record.get('error', '')}")
+
+    failed = sum(record['status'] == 'failed' for record in records)
+    print(f"\nSweep finished in {time.perf_counter() - start:.1f}s: {len(records) - failed} completed, {failed} failed. Ledger: {ledger_path}\n")
+    return records
+
+def main(argv=None):
+    """
+    Command line entry point: run a sweep described by a spec file.
+    """
+    parser = argparse.ArgumentParser(description="Run a parameter sweep / design of experiments over a base config.")
+    parser.add_argument('spec', help="Sweep spec file (.json, .toml, .yaml/.yml); see configs/sweep_interarrival_wip.toml.")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument('--output-folder', default='sweeps', help="Export folder under data/ for runs and the ledger (default: sweeps).")
+    parser.add_argument('--schema', default=None, help="PostgreSQL schema to load each point into (default: skip).")
+    parser.add_argument('--load-method', choices=['insert', 'copy', 'atomic'], default='insert', help="Database load method (default: insert).")
+    parser.add_argument('--format', choices=sorted(etf.FILE_FORMATS), default='csv', help="Export file format (default: csv).")
+    parser.add_argument('--compress', action='store_true', help="Gzip CSV exports.")
+    parser.add_argument('--no-structure-cache', action='store_true', help="Regenerate dimension tables for every point.")
+    parser.add_argument('--dry-run', action='store_true', help="List the points that would run without running them.")
+    parser.add_argument('--verbose', action='store_true', help="Show the full pipeline output of every point.")
+    args = parser.parse_args(argv)
+
+    spec_path = Path(args.spec)
+    spec = rs.read_config_file(spec_path)
+    base_config = rs.load_config(spec_path.parent / spec['base_config'])
+    folder = re.sub(r'[<>:"/\\|?*]', '_', args.output_folder).strip().rstrip('.') or 'sweeps'
+
+    records = run_sweep(
+        base_config,
+        spec['parameters'],
+        design=spec.get('design', 'factorial'),
+        samples=spec.get('samples'),
+        seed=spec.get('seed'),
+        scenario_prefix=spec.get('scenario_prefix', 'SWP'),
+        workers=args.workers,
+        folder=folder,
+        schema=args.schema,
+        export_format=args.format,
+        compress=args.compress,
+        load_method=args.load_method,
+        structure_cache=not args.no_structure_cache,
+        dry_run=args.dry_run,
+        verbose=args.verbose,
+    )
+    if args.dry_run:
+        for record in records:
+            print(record['scenario_id'], record['parameters'])
+    return records
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+### Structure Cache Functions for Production Plant Simulation ###
+"""
+Content-addressed disk cache for the generated plant structure.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+`Plant.initialize_simulation` generates `dim_machine`, `dim_product`,
+`dim_process` and `dim_process_route` with `data_generators` on every run.
+When a sweep only varies release parameters (interarrival scale, WIP limit,
+horizon) under a fixed seed, every point regenerates the same structure.
+This module stores those four tables on disk under a key derived from
+everything that determines them, so the generation cost is paid once.
+
+Key Behavior / Conventions
+--------------------------
+- The key is a SHA-256 of `num_machines`, `num_products`, `step_bounds`,
+  `product_family_weights` and the states of the two RNGs the generators
+  draw from (`rngs['structure']` and `data_generators.local_rng`) *before*
+  generation. Release-only settings are not part of the key.
+- Each entry also stores both RNG states *after* generation. On a hit the
+  caller restores them, so the rest of the run (work order generation,
+  yields) draws exactly the same numbers as an uncached run.
+- Entries are pickled DataFrames (`<cache_dir>/<key>.pkl`) written to a
+  temporary file and renamed into place, so concurrent sweep workers can
+  share one cache directory.
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+
+####################################################################
+
+# Bump when the generators change in a way that invalidates cached tables
+CACHE_VERSION = 1
+
+# Tables held in a cache entry, in generation order
+STRUCTURE_TABLES = ['dim_machine', 'dim_product', 'dim_process', 'dim_process_route']
+
+####################################################################
+## Function Definitions ##
+####################################################################
+
+def structure_key(config: dict, structure_rng, fallback_rng) -> str:
+    """
+    Return the cache key for the structure a run is about to generate.
+
+    Parameters
+    ----------
+    config : dict
+        Run configuration (uses `run_specs`, `step_bounds`, `product_family_weights`).
+    structure_rng : numpy.random.Generator
+        The run's `rngs['structure']` stream, before generation.
+    fallback_rng : numpy.random.Generator
+        `data_generators.local_rng`, before generation.
+
+    Returns
+    -------
+    str
+        SHA-256 hex digest.
+    """
+    payload = {
+        'version': CACHE_VERSION,
+        'num_machines': config['run_specs']['num_machines'],
+        'num_products': config['run_specs']['num_products'],
+        'step_bounds': config['step_bounds'],
+        'product_family_weights': config['product_family_weights'],
+        'structure_rng': structure_rng.bit_generator.state,
+        'fallback_rng': fallback_rng.bit_generator.state,
+    }
+    text = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def load_structure(cache_dir, key: str):
+    """
+    Load a cache entry.
+
+    Parameters
+    ----------
+    cache_dir : str or pathlib.Path
+    key : str
+        Key from `structure_key`.
+
+    Returns
+    -------
+    dict or None
+        {'tables': {name: DataFrame}, 'rng_states': {'structure': ..., 'fallback': ...}},
+        or None if the entry does not exist.
+    """
+    path = Path(cache_dir) / f"{key}.pkl"
+    if not path.exists():
+        return None
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+def save_structure(cache_dir, key: str, tables: dict, structure_rng, fallback_rng) -> Path:
+    """
+    Store the generated tables and the post-generation RNG states.
+
+    Parameters
+    ----------
+    cache_dir : str or pathlib.Path
+        Cache folder (created if missing).
+    key : str
+        Key from `structure_key` (computed before generation).
+    tables : dict
+        Mapping table name -> DataFrame for every name in `STRUCTURE_TABLES`.
+    structure_rng, fallback_rng : numpy.random.Generator
+        The same generators passed to `structure_key`, after generation.
+
+    Returns
+    -------
+    pathlib.Path
+        Path of the cache entry.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    entry = {
+        'tables': {name: tables[name] for name in STRUCTURE_TABLES},
+        'rng_states': {
+            'structure': structure_rng.bit_generator.state,
+            'fallback': fallback_rng.bit_generator.state,
+        },
+    }
+
+    # Write to a process-unique temporary file and move it into place atomically
+    path = cache_dir / f"{key}.pkl"
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,166 @@
+# Antithetic variates tests for the Production Plant Simulation
+"""
+Checks that the mirror run of an antithetic pair really draws from 1 - U and
+that the pair statistics are computed correctly.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+Antithetic sampling only reduces variance if the two runs of a pair see
+mirrored uniforms. The base and mirror `AntitheticGenerator` are driven by
+generators with the same seed and their variates are mapped back to the
+uniform they came from (inversion symmetry), the Poisson CDF search is
+compared with the CDF, and `output_analysis.antithetic_summary` is checked
+on a two-pair input small enough to compute by hand.
+
+Notes / Conventions
+-------------------
+- Run from the repository root:
+      python -m unittest discover simulation/tests
+  (or `python -m pytest simulation/tests`).
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import math
+import sys
+import unittest
+from pathlib import Path
+from statistics import NormalDist
+
+import numpy as np
+import simpy
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import output_analysis as oa
+import run_simulation as rs
+from AntitheticGenerator import AntitheticGenerator
+from Plant import Plant
+
+####################################################################
+
+SEED = 11
+DRAWS = 200
+
+def _pair(seed=SEED):
+    """
+    Return the base and mirror wrappers of one antithetic pair.
+    """
+    return (AntitheticGenerator(np.random.default_rng(seed)),
+            AntitheticGenerator(np.random.default_rng(seed), mirror=True))
+
+class _FixedUniforms(object):
+    """
+    Stand-in for the wrapped Generator that returns the given uniforms in turn.
+    """
+    def __init__(self, uniforms):
+        self.uniforms = iter(uniforms)
+
+    def random(self):
+        return next(self.uniforms)
+
+def _poisson_cdf(k, lam):
+    return sum(math.exp(-lam) * lam ** i / math.factorial(i) for i in range(k + 1))
+
+class InversionSymmetryTest(unittest.TestCase):
+    def test_mirror_uniforms_are_one_minus_base(self):
+        base, mirror = _pair()
+        for _ in range(DRAWS):
+            self.assertAlmostEqual(base.uniform_quantile() + mirror.uniform_quantile(), 1.0)
+
+    def test_exponential_quantiles_of_u_and_one_minus_u(self):
+        base, mirror = _pair()
+        for _ in range(DRAWS):
+            # F(x) = 1 - exp(-x / scale) maps the pair back to U and 1 - U
+            u_base = 1 - math.exp(-base.exponential(scale=4.0) / 4.0)
+            u_mirror = 1 - math.exp(-mirror.exponential(scale=4.0) / 4.0)
+            self.assertAlmostEqual(u_base + u_mirror, 1.0)
+
+    def test_normal_quantiles_are_symmetric(self):
+        base, mirror = _pair()
+        for _ in range(DRAWS):
+            x_base, x_mirror = base.normal(10.0, 2.0), mirror.normal(10.0, 2.0)
+            self.assertAlmostEqual(x_base + x_mirror, 20.0, places=6)
+            self.assertAlmostEqual(NormalDist(10.0, 2.0).cdf(x_base) + NormalDist(10.0, 2.0).cdf(x_mirror), 1.0, places=6)
+
+    def test_lognormal_and_gamma_are_monotone_in_u(self):
+        base, mirror = _pair()
+        for _ in range(DRAWS):
+            self.assertAlmostEqual(math.log(base.lognormal(1.0, 0.5)) + math.log(mirror.lognormal(1.0, 0.5)), 2.0, places=6)
+        gammas = [AntitheticGenerator(_FixedUniforms([u])).gamma(2.0, 3.0) for u in (0.1, 0.5, 0.9)]
+        self.assertEqual(gammas, sorted(gammas))
+
+    def test_other_methods_are_forwarded(self):
+        rng = np.random.default_rng(SEED)
+        wrapper = AntitheticGenerator(np.random.default_rng(SEED), mirror=True)
+        np.testing.assert_array_equal(wrapper.integers(0, 100, size=10), rng.integers(0, 100, size=10))
+        self.assertEqual(wrapper.bit_generator.state, rng.bit_generator.state)
+
+    def test_plant_mirror_run_draws_one_minus_u(self):
+        config = rs.load_config(rs.CONFIG_DIR / 'scenario_C.toml')
+        arrival_rngs = {}
+        for side in ('base', 'mirror'):
+            config['run_specs']['antithetic'] = side
+            plant = Plant(simpy.Environment(), 'S1', 'antithetic test', rs.validate_config(config), rs.build_rngs(SEED))
+            arrival_rngs[side] = plant.arrival_rng
+        self.assertFalse(arrival_rngs['base'].mirror)
+        self.assertTrue(arrival_rngs['mirror'].mirror)
+        for _ in range(DRAWS):
+            self.assertAlmostEqual(arrival_rngs['base'].uniform_quantile() + arrival_rngs['mirror'].uniform_quantile(), 1.0)
+
+class PoissonSearchTest(unittest.TestCase):
+    def test_search_returns_smallest_k_with_cdf_at_least_u(self):
+        lam = 3.0
+        for u in (0.01, 0.05, 0.2, 0.4231, 0.5, 0.8, 0.95, 0.999):
+            with self.subTest(u=u):
+                k = AntitheticGenerator(_FixedUniforms([u])).poisson(lam)
+                self.assertGreaterEqual(_poisson_cdf(k, lam), u)
+                if k > 0:
+                    self.assertLess(_poisson_cdf(k - 1, lam), u)
+
+    def test_mirror_draws_mirror_the_cdf(self):
+        # U below P(0) gives 0 in the base run, and 1 - U the upper tail in the mirror run
+        u = 0.5 * math.exp(-3.0)
+        self.assertEqual(AntitheticGenerator(_FixedUniforms([u])).poisson(3.0), 0)
+        self.assertGreaterEqual(AntitheticGenerator(_FixedUniforms([u]), mirror=True).poisson(3.0), 7)
+
+    def test_pair_draws_have_poisson_mean_and_negative_correlation(self):
+        base, mirror = _pair()
+        draws = np.array([(base.poisson(5.0), mirror.poisson(5.0)) for _ in range(20_000)])
+        self.assertAlmostEqual(draws.mean(), 5.0, delta=0.05)
+        self.assertLess(np.corrcoef(draws.T)[0, 1], -0.9)
+
+class AntitheticSummaryTest(unittest.TestCase):
+    def test_two_pairs(self):
+        # Pair means 2 and 4; all four runs 1, 3, 2, 6
+        pairs = [({'throughput': 1.0, 'scrap_rate': None}, {'throughput': 3.0, 'scrap_rate': 0.1}),
+                 ({'throughput': 2.0, 'scrap_rate': 0.2}, {'throughput': 6.0, 'scrap_rate': 0.3})]
+        summary = oa.antithetic_summary(pairs)
+        self.assertEqual((summary['pairs'], summary['confidence']), (2, 0.95))
+
+        throughput = summary['kpis']['throughput']
+        self.assertAlmostEqual(throughput['mean'], 3.0)
+        self.assertAlmostEqual(throughput['pair_variance'], 2.0)
+        # Variance of the mean of two independent runs: var(1, 3, 2, 6) / 2 = (14 / 3) / 2
+        self.assertAlmostEqual(throughput['independent_variance'], 7.0 / 3.0)
+        self.assertAlmostEqual(throughput['variance_reduction'], 1.0 / 7.0)
+        self.assertAlmostEqual(throughput['correlation'], 1.0)
+        self.assertAlmostEqual(throughput['half_width'], oa.t_quantile(0.975, 1) * 1.0)
+
+        # Pairs with a missing side are skipped; one pair left gives only the mean
+        scrap_rate = summary['kpis']['scrap_rate']
+        self.assertAlmostEqual(scrap_rate['mean'], 0.25)
+        self.assertIsNone(scrap_rate['pair_variance'])
+        self.assertIsNone(scrap_rate['half_width'])
+
+    def test_kpi_missing_in_every_pair(self):
+        summary = oa.antithetic_summary([({'lead_time': None}, {'lead_time': 1.0})])
+        self.assertIsNone(summary['kpis']['lead_time'])
+
+if __name__ == '__main__':
+    unittest.main()
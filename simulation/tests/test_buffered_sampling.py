@@ -0,0 +1,124 @@
+# Buffered sampling tests for the Production Plant Simulation
+"""
+Checks that block-buffered sampling is deterministic and that its state
+survives a snapshot/restore round trip.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+`BufferedSampler` changes which variates a seeded run sees, so a run with
+`run_specs.rng_block_size` must at least be reproducible: the same seed and
+block size give the same tables. The unserved part of each block is part of
+the simulation state; restoring a `snapshot()` together with the wrapped
+Generator's state must continue the exact same sequence.
+
+Notes / Conventions
+-------------------
+- Run from the repository root:
+      python -m unittest discover simulation/tests
+  (or `python -m pytest simulation/tests`).
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import contextlib
+import io
+import itertools
+import pickle
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import simpy
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import Machine
+import run_simulation as rs
+from BufferedSampler import BufferedSampler
+from Plant import Plant
+
+####################################################################
+
+SEED = 7
+BLOCK_SIZE = 16
+
+def _draw(sampler, count):
+    """
+    Draw `count` rounds from every buffered distribution, interleaved as in a run.
+    """
+    values = []
+    for _ in range(count):
+        values += [sampler.normal(1.0, 0.1), sampler.lognormal(7.5, 0.6), sampler.gamma(3.0, 400.0),
+                   sampler.exponential(60000.0), sampler.integers(1, 10), sampler.poisson(4.0), sampler.random()]
+    return values
+
+def _run(block_size):
+    """
+    Run a small seeded scenario C plant with fresh ID counters and return its result tables.
+    """
+    for name in ['_event_id_counter', '_batch_id_counter', '_downtime_id_counter', '_quality_id_counter']:
+        setattr(Machine, name, itertools.count(start=1))
+    config = rs.load_config(rs.CONFIG_DIR / 'scenario_C.toml')
+    config['run_specs'].update(num_machines=20, num_products=10, wip_limit=12, sim_horizon_days=2, rng_block_size=block_size)
+    config = rs.validate_config(config)
+    rs.seed_module_rngs(SEED)
+    env = simpy.Environment()
+    plant = Plant(env, 'S1', 'buffered sampling test', config, rs.build_rngs(SEED))
+    env.process(plant.run())
+    with contextlib.redirect_stdout(io.StringIO()):
+        env.run(until=plant.done)
+        return plant.collect_results()
+
+class BufferedSamplerTest(unittest.TestCase):
+    def test_serves_block_values_in_order(self):
+        sampler = BufferedSampler(np.random.default_rng(SEED), BLOCK_SIZE)
+        block = np.random.default_rng(SEED).standard_normal(size=BLOCK_SIZE)
+        # Two blocks' worth of draws: the first block is served in order, then a new one is drawn
+        served = [sampler.normal(5.0, 2.0) for _ in range(2 * BLOCK_SIZE)]
+        np.testing.assert_allclose(served[:BLOCK_SIZE], 5.0 + 2.0 * block)
+        self.assertFalse(np.allclose(served[BLOCK_SIZE:], served[:BLOCK_SIZE]))
+
+    def test_same_seed_same_sequence(self):
+        self.assertEqual(_draw(BufferedSampler(np.random.default_rng(SEED), BLOCK_SIZE), 50),
+                         _draw(BufferedSampler(np.random.default_rng(SEED), BLOCK_SIZE), 50))
+
+    def test_snapshot_restore_round_trip(self):
+        rng = np.random.default_rng(SEED)
+        sampler = BufferedSampler(rng, BLOCK_SIZE)
+        _draw(sampler, 10)
+        # Blocks part-served and the Generator state, as a checkpoint saves them
+        snapshot = pickle.loads(pickle.dumps(sampler.snapshot()))
+        rng_state = rng.bit_generator.state
+        expected = _draw(sampler, 50)
+
+        restored_rng = np.random.default_rng()
+        restored_rng.bit_generator.state = rng_state
+        restored = BufferedSampler(restored_rng, BLOCK_SIZE)
+        restored.restore(snapshot)
+        self.assertEqual(_draw(restored, 50), expected)
+
+    def test_reset_discards_buffered_values(self):
+        rng = np.random.default_rng(SEED)
+        sampler = BufferedSampler(rng, BLOCK_SIZE)
+        _draw(sampler, 3)
+        rng.bit_generator.state = np.random.default_rng(SEED).bit_generator.state
+        sampler.reset()
+        self.assertEqual(sampler.snapshot(), {})
+        self.assertEqual(_draw(sampler, 20), _draw(BufferedSampler(np.random.default_rng(SEED), BLOCK_SIZE), 20))
+
+class BufferedRunTest(unittest.TestCase):
+    def test_same_seed_and_block_size_give_same_tables(self):
+        first, second = _run(64), _run(64)
+        self.assertEqual(len(first), len(second))
+        for first_table, second_table in zip(first, second):
+            pd.testing.assert_frame_equal(first_table, second_table, check_exact=True)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+# Checkpoint/resume regression test for the Production Plant Simulation
+"""
+Checks that a seeded run resumed from a checkpoint produces exactly the same
+tables as the uninterrupted run.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+`checkpoint` rebuilds the SimPy event queue from private SimPy internals
+(`env._queue`, `env._eid`, `Event._ok` / `_value`), so a SimPy update or a
+new piece of process state can break exact resume without any error. Each
+case runs a small plant once without interruption and once paused at a
+checkpoint, restored from the checkpoint file and run to the end, and
+compares every result table cell by cell.
+
+Notes / Conventions
+-------------------
+- Run from the repository root:
+      python -m unittest discover simulation/tests
+  (or `python -m pytest simulation/tests`).
+- Cases cover the run modes whose state the checkpoint has to carry: time-
+  and volume-driven release, streamed event chunks, common random numbers,
+  antithetic sampling, buffered sampling and operating-time failures.
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import contextlib
+import io
+import itertools
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+import simpy
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import Machine
+import checkpoint as ck
+import run_simulation as rs
+from EventSink import ChunkedFileSink, ChunkedTable
+from Plant import Plant
+
+####################################################################
+
+SEED = 7
+
+# Simulated time of the checkpoint (seconds); the runs below last 2 days
+PAUSE_AT = 1.25 * 86400
+
+# run_specs overrides per case, applied to a small scenario C plant
+CASES = {
+    'time': {},
+    'volume': {'run_mode': 'volume', 'num_work_orders': 600, 'sim_horizon_days': None},
+    'event_chunks': {'event_chunk_size': 100},
+    'crn': {'crn': True},
+    'antithetic_mirror': {'antithetic': 'mirror'},
+    'buffered_operating_clock': {'rng_block_size': 64, 'failure_clock': 'operating'},
+}
+
+def _config(overrides):
+    config = rs.load_config(rs.CONFIG_DIR / 'scenario_C.toml')
+    config['run_specs'].update(num_machines=20, num_products=10, wip_limit=12, sim_horizon_days=2)
+    config['run_specs'].update(overrides)
+    return rs.validate_config(config)
+
+def _sink(config, directory, keep_parts=False):
+    chunk_size = config['run_specs']['event_chunk_size']
+    return ChunkedFileSink(directory, chunk_size, keep_parts=keep_parts) if chunk_size else None
+
+def _start(config, event_sink):
+    """
+    Start a seeded plant with fresh module-level ID counters and RNGs.
+    """
+    for name in ['_event_id_counter', '_batch_id_counter', '_downtime_id_counter', '_quality_id_counter']:
+        setattr(Machine, name, itertools.count(start=1))
+    rs.seed_module_rngs(SEED)
+    env = simpy.Environment()
+    plant = Plant(env, 'S1', 'checkpoint test', config, rs.build_rngs(SEED), event_sink=event_sink)
+    env.process(plant.run())
+    return plant
+
+def _finish(plant):
+    plant.env.run(until=plant.done)
+    # Streamed event tables are read back from their chunk files for the comparison
+    return [table.to_frame() if isinstance(table, ChunkedTable) else table for table in plant.collect_results()]
+
+class CheckpointResumeTest(unittest.TestCase):
+    def test_resumed_run_matches_uninterrupted_run(self):
+        for name, overrides in CASES.items():
+            with self.subTest(case=name), tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+                tmp = Path(tmp)
+                config = _config(overrides)
+                expected = _finish(_start(config, _sink(config, tmp / 'uninterrupted')))
+
+                # Pause, checkpoint and keep going (the original run continues past the checkpoint)
+                plant = _start(config, _sink(config, tmp / 'interrupted'))
+                plant.env.run(until=PAUSE_AT)
+                self.assertFalse(plant.done.triggered, "run ended before the checkpoint")
+                ck.save_checkpoint(plant, tmp / ck.CHECKPOINT_FILE)
+                _finish(plant)
+
+                # Resume in the interrupted run's folder; chunks written after the checkpoint are dropped
+                state = ck.load_checkpoint(tmp)
+                resumed = _finish(ck.restore_plant(state, event_sink=_sink(config, tmp / 'interrupted', keep_parts=True)))
+
+                self.assertEqual(len(resumed), len(expected))
+                for expected_table, resumed_table in zip(expected, resumed):
+                    pd.testing.assert_frame_equal(resumed_table, expected_table, check_exact=True)
+
+    def test_warm_start_rejects_other_failure_clock(self):
+        # Calendar failure timers pending in the snapshot cannot run under operating-time failures
+        with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+            config = _config({})
+            path = rs.save_warm_snapshot(config, 1, Path(tmp) / 'snapshot.pkl', seed=SEED)
+            operating = _config({'failure_clock': 'operating'})
+            with self.assertRaisesRegex(ValueError, 'failure_clock'):
+                ck.warm_start_plant(ck.load_checkpoint(path), 'S2', 'warm start', rs.build_rngs(SEED), config=operating)
+
+if __name__ == '__main__':
+    unittest.main()
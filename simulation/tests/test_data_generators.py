@@ -0,0 +1,134 @@
+# Work order generation tests for the Production Plant Simulation
+"""
+Checks the vectorized work order generator in `data_generators`.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+`create_work_order_batch` draws every column of a block of work orders in
+one call per attribute and redraws only the IDs that collide, either with
+`existing_ids` or within the block. The collision handling is forced with
+a generator that hands out known IDs first, the sampled columns are checked
+against their documented ranges, and `create_work_orders` is checked to
+return the (full table, new rows) pair with the index continuing from the
+existing table.
+
+Notes / Conventions
+-------------------
+- Run from the repository root:
+      python -m unittest discover simulation/tests
+  (or `python -m pytest simulation/tests`).
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import data_generators as dg
+
+####################################################################
+
+SEED = 7
+
+# Upper bound of the work order ID numbers drawn by `create_work_order_batch`
+ID_HIGH = 1000000000
+
+def _dim_product():
+    """
+    Three products with distinct target yields.
+    """
+    return pd.DataFrame({'product_id': [101, 202, 303], 'target_yield_rate': [0.91, 0.82, 0.73]})
+
+class _PresetIds(object):
+    """
+    Stand-in for the structure Generator that returns `ids` for the first ID draw.
+
+    Every other call is forwarded to a seeded Generator, so redrawn IDs and
+    the remaining columns are sampled as usual.
+    """
+    def __init__(self, ids, seed=SEED):
+        self.ids = np.array(ids, dtype=np.int64)
+        self.rng = np.random.default_rng(seed)
+
+    def integers(self, low, high=None, size=None):
+        if self.ids is not None and high == ID_HIGH:
+            ids, self.ids = self.ids, None
+            return ids
+        return self.rng.integers(low, high, size=size)
+
+    def __getattr__(self, name):
+        return getattr(self.rng, name)
+
+class WorkOrderBatchTest(unittest.TestCase):
+    def test_columns_and_ranges(self):
+        dim_product = _dim_product()
+        batch = dg.create_work_order_batch(dim_product, num_work_orders=500, rngs={'structure': np.random.default_rng(SEED)},
+                                           start_index=40)
+        self.assertEqual(list(batch.columns), ['work_order_id', 'product_id', 'planned_quantity', 'target_yield_rate',
+                                               'batch_size', 'start_date', 'due_date', 'priority'])
+        self.assertTrue(batch.index.equals(pd.Index(np.arange(40, 540))))
+        self.assertTrue(batch['work_order_id'].is_unique)
+        self.assertTrue(batch['work_order_id'].str.startswith('WO-25').all())
+
+        lead_days = (batch['due_date'] - batch['start_date']).dt.days
+        self.assertTrue(lead_days.between(3, 20).all())
+        self.assertTrue((batch['start_date'].dt.year == 2025).all())
+        self.assertTrue(batch['planned_quantity'].between(100, 1999).all())
+        self.assertTrue((batch['batch_size'] >= 10).all())
+        self.assertTrue((batch['batch_size'] < np.maximum(11, batch['planned_quantity'] // 2)).all())
+        self.assertTrue(batch['priority'].isin([0, 1, 2, 3]).all())
+        # Target yields are looked up from the sampled product
+        yields = dict(zip(dim_product['product_id'], dim_product['target_yield_rate']))
+        self.assertEqual(batch['target_yield_rate'].tolist(), batch['product_id'].map(yields).tolist())
+
+    def test_same_seed_same_batch(self):
+        first = dg.create_work_order_batch(_dim_product(), num_work_orders=50, rngs={'structure': np.random.default_rng(SEED)})
+        second = dg.create_work_order_batch(_dim_product(), num_work_orders=50, rngs={'structure': np.random.default_rng(SEED)})
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_ids_colliding_with_existing_ids_are_redrawn(self):
+        existing_ids = {'WO-2511', 'WO-2533'}
+        batch = dg.create_work_order_batch(_dim_product(), num_work_orders=4, rngs={'structure': _PresetIds([11, 22, 33, 44])},
+                                           existing_ids=existing_ids)
+        ids = batch['work_order_id'].tolist()
+        self.assertEqual(len(set(ids)), 4)
+        self.assertTrue(existing_ids.isdisjoint(ids))
+        # IDs that did not collide are kept in place
+        self.assertEqual((ids[1], ids[3]), ('WO-2522', 'WO-2544'))
+
+    def test_duplicates_within_block_are_redrawn(self):
+        batch = dg.create_work_order_batch(_dim_product(), num_work_orders=5, rngs={'structure': _PresetIds([7, 7, 8, 7, 8])})
+        ids = batch['work_order_id'].tolist()
+        self.assertEqual(len(set(ids)), 5)
+        # The first occurrence of each repeated ID is kept
+        self.assertEqual((ids[0], ids[2]), ('WO-257', 'WO-258'))
+
+class CreateWorkOrdersTest(unittest.TestCase):
+    def test_new_table_is_the_new_rows(self):
+        df, df1 = dg.create_work_orders(_dim_product(), num_work_orders=10, rngs={'structure': np.random.default_rng(SEED)})
+        pd.testing.assert_frame_equal(df, df1)
+        self.assertTrue(df.index.equals(pd.Index(np.arange(10))))
+
+    def test_append_returns_full_table_and_new_rows(self):
+        rngs = {'structure': np.random.default_rng(SEED)}
+        existing, _ = dg.create_work_orders(_dim_product(), num_work_orders=10, rngs=rngs)
+        df, df1 = dg.create_work_orders(_dim_product(), fact_work_order=existing, num_work_orders=5, rngs=rngs)
+        self.assertEqual(len(df1), 5)
+        self.assertTrue(df1.index.equals(pd.Index(np.arange(10, 15))))
+        pd.testing.assert_frame_equal(df.iloc[:10], existing)
+        pd.testing.assert_frame_equal(df.iloc[10:], df1)
+        self.assertTrue(df['work_order_id'].is_unique)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+# Event buffer tests for the Production Plant Simulation
+"""
+Checks the typed, array-backed machine event log and its hand-off to a sink.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+`EventBuffer` replaces per-event dicts with one NumPy array per field and
+stores categorical fields as integer codes. Rows appended with the downtime
+schema of `Machine` must come back from `to_frame()` with the same values,
+the schema dtypes and the original category labels, including labels not
+declared up front. With a sink attached the buffer must hand over a chunk
+exactly when `chunk_size` rows are buffered, and the chunks written by
+`ChunkedFileSink` must read back with the same values and dtypes.
+
+Notes / Conventions
+-------------------
+- Run from the repository root:
+      python -m unittest discover simulation/tests
+  (or `python -m pytest simulation/tests`).
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from EventBuffer import EventBuffer
+from EventSink import ChunkedFileSink, EventSink
+from Machine import DOWNTIME_EVENT_SCHEMA, FAILURE_TYPES
+
+####################################################################
+
+CHUNK_SIZE = 4
+
+def _downtime_rows(count):
+    """
+    Downtime events in DOWNTIME_EVENT_SCHEMA order, cycling through a few failure types.
+    """
+    failure_types = [FAILURE_TYPES[3], FAILURE_TYPES[0], 'Unlisted Failure', FAILURE_TYPES[3]]
+    return [(i + 1, f'WO-25{i % 3}', 100 + i, 200 + i, 300 + i % 2, failure_types[i % len(failure_types)],
+             1.5 * i, 60.0 * i, 60.0 * i + 30.0) for i in range(count)]
+
+def _expected_frame(rows):
+    """
+    The rows as a DataFrame with the dtypes `EventBuffer.to_frame` should produce.
+    """
+    frame = pd.DataFrame(rows, columns=list(DOWNTIME_EVENT_SCHEMA))
+    for name, dtype in DOWNTIME_EVENT_SCHEMA.items():
+        frame[name] = frame[name].astype(dtype)
+    frame['failure_type'] = pd.Categorical(frame['failure_type'], categories=FAILURE_TYPES + ['Unlisted Failure'])
+    return frame
+
+class _MemorySink(EventSink):
+    """
+    Sink keeping each written chunk in a list.
+    """
+    def __init__(self, chunk_size):
+        super().__init__(chunk_size)
+        self.chunks = []
+
+    def write(self, table_name, frame):
+        self.chunks.append((table_name, frame.copy()))
+
+    def read(self, table_name):
+        return pd.concat([frame for name, frame in self.chunks if name == table_name], ignore_index=True)
+
+class EventBufferTest(unittest.TestCase):
+    def test_round_trip_values_codes_and_dtypes(self):
+        rows = _downtime_rows(10)
+        buffer = EventBuffer(DOWNTIME_EVENT_SCHEMA, {'failure_type': FAILURE_TYPES}, capacity=3)
+        for row in rows:
+            buffer.append(*row)
+        self.assertEqual(len(buffer), 10)
+        frame = buffer.to_frame()
+        pd.testing.assert_frame_equal(frame, _expected_frame(rows))
+        # Declared labels keep their position; the unseen one is appended after them
+        self.assertEqual(list(frame['failure_type'].cat.categories), FAILURE_TYPES + ['Unlisted Failure'])
+        self.assertEqual(frame['failure_type'].cat.codes.tolist()[:3], [3, 0, len(FAILURE_TYPES)])
+        self.assertEqual(buffer._arrays[list(DOWNTIME_EVENT_SCHEMA).index('failure_type')].dtype, np.int16)
+
+    def test_clear_keeps_categories(self):
+        buffer = EventBuffer(DOWNTIME_EVENT_SCHEMA, {'failure_type': FAILURE_TYPES})
+        for row in _downtime_rows(3):
+            buffer.append(*row)
+        buffer.clear()
+        self.assertEqual(len(buffer), 0)
+        self.assertTrue(buffer.to_frame().empty)
+        self.assertIn('Unlisted Failure', buffer.categories['failure_type'])
+
+    def test_snapshot_restore(self):
+        rows = _downtime_rows(6)
+        buffer = EventBuffer(DOWNTIME_EVENT_SCHEMA, {'failure_type': FAILURE_TYPES})
+        for row in rows[:5]:
+            buffer.append(*row)
+        restored = EventBuffer(DOWNTIME_EVENT_SCHEMA, {'failure_type': FAILURE_TYPES}, capacity=1)
+        restored.restore(buffer.snapshot())
+        for target in (buffer, restored):
+            target.append(*rows[5])
+        pd.testing.assert_frame_equal(restored.to_frame(), buffer.to_frame())
+
+    def test_sink_requires_table_name(self):
+        with self.assertRaises(ValueError):
+            EventBuffer(DOWNTIME_EVENT_SCHEMA, sink=_MemorySink(CHUNK_SIZE))
+
+class SinkFlushTest(unittest.TestCase):
+    def test_flush_at_chunk_size(self):
+        rows = _downtime_rows(10)
+        sink = _MemorySink(CHUNK_SIZE)
+        buffer = EventBuffer(DOWNTIME_EVENT_SCHEMA, {'failure_type': FAILURE_TYPES}, sink=sink, table_name='fact_downtime_event')
+        for count, row in enumerate(rows, start=1):
+            buffer.append(*row)
+            # A full buffer is handed over when the next row arrives, never before
+            self.assertEqual(len(sink.chunks), (count - 1) // CHUNK_SIZE)
+            self.assertLessEqual(len(buffer), CHUNK_SIZE)
+        buffer.flush()
+        self.assertEqual([len(frame) for _, frame in sink.chunks], [4, 4, 2])
+        self.assertEqual(len(buffer), 0)
+        pd.testing.assert_frame_equal(sink.read('fact_downtime_event'), _expected_frame(rows))
+        # Flushing an empty buffer writes nothing
+        buffer.flush()
+        self.assertEqual(len(sink.chunks), 3)
+
+    def test_parquet_parts_keep_values_and_dtypes(self):
+        rows = _downtime_rows(10)
+        with tempfile.TemporaryDirectory() as tmp:
+            sink = ChunkedFileSink(tmp, chunk_size=CHUNK_SIZE)
+            buffer = EventBuffer(DOWNTIME_EVENT_SCHEMA, {'failure_type': FAILURE_TYPES}, sink=sink, table_name='fact_downtime_event')
+            for row in rows:
+                buffer.append(*row)
+            buffer.flush()
+            table = sink.read('fact_downtime_event')
+            self.assertEqual(len(table.paths), 3)
+            self.assertEqual(len(table), 10)
+            frame = table.to_frame()
+        expected = _expected_frame(rows)
+        self.assertEqual(frame.dtypes.drop('failure_type').to_dict(), expected.dtypes.drop('failure_type').to_dict())
+        self.assertIsInstance(frame['failure_type'].dtype, pd.CategoricalDtype)
+        pd.testing.assert_frame_equal(frame.astype({'failure_type': object}), expected.astype({'failure_type': object}))
+
+if __name__ == '__main__':
+    unittest.main()
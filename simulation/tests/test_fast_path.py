@@ -0,0 +1,91 @@
+# Fast path tests for the Production Plant Simulation
+"""
+Checks that running failure-free steps as a single timeout leaves the
+result tables of a seeded run unchanged.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+`run_specs.fast_path` lets the work order process wait out a step that ends
+before its machine's next failure instead of starting a
+`Machine.process_order` process. The step draws, the logged events and the
+operating-time failure bookkeeping are meant to be the same either way, so
+a small seeded scenario C plant is run with the fast path off and on, for
+both failure clocks, and every result table is compared exactly. The fast
+path must also schedule fewer SimPy events.
+
+Notes / Conventions
+-------------------
+- Run from the repository root:
+      python -m unittest discover simulation/tests
+  (or `python -m pytest simulation/tests`).
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import contextlib
+import io
+import itertools
+import sys
+import unittest
+from pathlib import Path
+
+import pandas as pd
+import simpy
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import Machine
+import run_simulation as rs
+from Plant import Plant
+
+####################################################################
+
+SEED = 7
+
+def _run(failure_clock, fast_path):
+    """
+    Run a small seeded scenario C plant with fresh ID counters.
+
+    Returns
+    -------
+    tuple
+        (result tables, number of scheduled SimPy events)
+    """
+    for name in ['_event_id_counter', '_batch_id_counter', '_downtime_id_counter', '_quality_id_counter']:
+        setattr(Machine, name, itertools.count(start=1))
+    config = rs.load_config(rs.CONFIG_DIR / 'scenario_C.toml')
+    config['run_specs'].update(num_machines=20, num_products=10, wip_limit=12, sim_horizon_days=3,
+                               failure_clock=failure_clock, fast_path=fast_path)
+    config = rs.validate_config(config)
+    rs.seed_module_rngs(SEED)
+    env = simpy.Environment()
+    plant = Plant(env, 'S1', 'fast path test', config, rs.build_rngs(SEED))
+    env.process(plant.run())
+    with contextlib.redirect_stdout(io.StringIO()):
+        env.run(until=plant.done)
+        results = plant.collect_results()
+    # Event IDs are issued sequentially, so the next ID is the number of scheduled events
+    return results, next(env._eid)
+
+class FastPathEquivalenceTest(unittest.TestCase):
+    def test_off_by_default(self):
+        self.assertFalse(rs.RUN_SPEC_DEFAULTS['fast_path'])
+
+    def test_same_tables_with_fast_path_on_and_off(self):
+        for failure_clock in rs.FAILURE_CLOCKS:
+            with self.subTest(failure_clock=failure_clock):
+                normal, normal_events = _run(failure_clock, False)
+                fast, fast_events = _run(failure_clock, True)
+                self.assertEqual(len(normal), len(fast))
+                self.assertGreater(len(normal[5]), 0)
+                for normal_table, fast_table in zip(normal, fast):
+                    pd.testing.assert_frame_equal(normal_table, fast_table, check_exact=True)
+                self.assertLess(fast_events, normal_events)
+
+if __name__ == '__main__':
+    unittest.main()
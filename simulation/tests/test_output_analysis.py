@@ -0,0 +1,195 @@
+# Output analysis tests for the Production Plant Simulation
+"""
+Checks the steady-state statistics of `output_analysis`, the warm-up flags
+they produce in the result tables and the precision-based stop mode.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+The MSER-5 warm-up rule decides which rows every KPI is computed from, so
+its behaviour is pinned down on synthetic series with a known answer: a
+linear ramp followed by stationary noise, a pure trend and a series too
+short to judge. A small seeded plant then checks that the detected
+warm-up end reaches `dim_scenario` and the `warmup` column of every fact
+table. Student-t quantiles are compared with tabulated values, batch-means
+intervals with hand-computed ones, and a run with a loose
+`precision_target` must stop release early and record why in its manifest.
+
+Notes / Conventions
+-------------------
+- Run from the repository root:
+      python -m unittest discover simulation/tests
+  (or `python -m pytest simulation/tests`).
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+
+import numpy as np
+import simpy
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import export_to_folder as etf
+import output_analysis as oa
+import run_simulation as rs
+from Plant import Plant
+
+####################################################################
+
+SEED = 7
+
+# Length of the ramp in the synthetic series (a multiple of the MSER batch size)
+RAMP = 40
+
+def _ramp_with_noise(seed, ramp=RAMP, steady=160):
+    """
+    Linear ramp from 0 to 10 over `ramp` observations, then 10 plus N(0, 0.5) noise.
+    """
+    rng = np.random.default_rng(seed)
+    return np.concatenate([np.linspace(0, 10, ramp, endpoint=False), 10 + rng.normal(0, 0.5, steady)])
+
+def _run_plant(overrides):
+    """
+    Run a small seeded scenario C plant to completion and return it with its result tables.
+    """
+    config = rs.load_config(rs.CONFIG_DIR / 'scenario_C.toml')
+    config['run_specs'].update(num_machines=20, num_products=10, wip_limit=12)
+    config['run_specs'].update(overrides)
+    config = rs.validate_config(config)
+    rs.seed_module_rngs(SEED)
+    env = simpy.Environment()
+    plant = Plant(env, 'S1', 'output analysis test', config, rs.build_rngs(SEED))
+    env.process(plant.run())
+    with contextlib.redirect_stdout(io.StringIO()):
+        env.run(until=plant.done)
+        results = plant.collect_results()
+    return plant, results
+
+class WarmupDetectionTest(unittest.TestCase):
+    def test_truncation_at_end_of_ramp(self):
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                self.assertEqual(oa.mser_truncation(_ramp_with_noise(seed)), RAMP)
+
+    def test_stationary_series_needs_no_truncation(self):
+        self.assertEqual(oa.mser_truncation(np.full(100, 3.0)), 0)
+
+    def test_no_truncation_for_trend_or_short_series(self):
+        self.assertIsNone(oa.mser_truncation(np.arange(200.0)))
+        # Fewer than MIN_MSER_BATCHES batches
+        self.assertIsNone(oa.mser_truncation(_ramp_with_noise(0)[:oa.MSER_BATCH_SIZE * oa.MIN_MSER_BATCHES - 1]))
+
+    def test_latest_truncation_over_series(self):
+        series = {'wip': _ramp_with_noise(0), 'throughput': np.full(200, 2.0)}
+        self.assertEqual(oa.warmup_truncation(series), RAMP)
+        self.assertIsNone(oa.warmup_truncation(dict(series, trend=np.arange(200.0))))
+
+    def test_warmup_end_is_time_of_last_truncated_sample(self):
+        times = 3600.0 * np.arange(1, 201)
+        self.assertEqual(oa.detect_warmup_end(times, {'wip': _ramp_with_noise(0)}), times[RAMP - 1])
+        self.assertEqual(oa.detect_warmup_end(times, {'wip': np.full(200, 3.0)}), 0.0)
+        self.assertIsNone(oa.detect_warmup_end(times, {'wip': np.arange(200.0)}))
+
+class WarmupFlagTest(unittest.TestCase):
+    def test_fact_tables_flag_rows_before_warmup_end(self):
+        plant, results = _run_plant({'sim_horizon_days': 5, 'warmup_detection': True})
+        warmup_end = plant.warmup_end_time
+        self.assertIsNotNone(warmup_end)
+        self.assertEqual(results[8]['warmup_end_time'][0], warmup_end)
+
+        time_columns = {4: 'work_order_start_time', 5: 'process_start', 6: 'failure_start', 7: 'event_time'}
+        for index, column in time_columns.items():
+            with self.subTest(column=column):
+                table = results[index]
+                np.testing.assert_array_equal(table['warmup'], table[column] < warmup_end)
+        production = results[5]['warmup']
+        self.assertTrue(production.any() and not production.all())
+
+    def test_nothing_flagged_without_steady_state(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            plant, results = _run_plant({'sim_horizon_days': 3, 'warmup_detection': True})
+        self.assertIsNone(plant.warmup_end_time)
+        for table in results[4:8]:
+            self.assertFalse(table['warmup'].any())
+
+class ConfidenceIntervalTest(unittest.TestCase):
+    def test_t_quantiles_match_tables(self):
+        # Two-sided 95% (and one 90%) critical values from standard t tables
+        for probability, df, expected in [(0.975, 1, 12.706), (0.975, 2, 4.303), (0.975, 19, 2.093), (0.95, 1, 6.314)]:
+            with self.subTest(probability=probability, df=df):
+                self.assertAlmostEqual(oa.t_quantile(probability, df), expected, places=3)
+        self.assertAlmostEqual(oa.t_quantile(0.025, 19), -oa.t_quantile(0.975, 19))
+        with self.assertRaises(ValueError):
+            oa.t_quantile(0.975, 0)
+
+    def test_plain_mean_interval(self):
+        values = np.repeat([1.0, 2.0, 3.0, 4.0], 5)
+        estimate = oa.batch_means_interval(values, num_batches=4)
+        self.assertAlmostEqual(estimate['mean'], 2.5)
+        self.assertAlmostEqual(estimate['half_width'], oa.t_quantile(0.975, 3) * np.std([1, 2, 3, 4], ddof=1) / 2)
+        self.assertEqual((estimate['batches'], estimate['batch_size']), (4, 5))
+
+    def test_ratio_interval_weights_batches(self):
+        # Batch ratios 1, 2, 3, 4 over batch weights 5, 10, 5, 20; the leading observation does not fill a batch
+        batch_weights = np.array([5.0, 10.0, 5.0, 20.0])
+        batch_ratios = np.array([1.0, 2.0, 3.0, 4.0])
+        values = np.concatenate([[1000.0], np.repeat(batch_ratios * batch_weights / 5, 5)])
+        weights = np.concatenate([[1.0], np.repeat(batch_weights / 5, 5)])
+        estimate = oa.batch_means_interval(values, weights=weights, num_batches=4)
+        # Overall ratio of sums, not the mean of the batch ratios
+        self.assertAlmostEqual(estimate['mean'], 120.0 / 40.0)
+        half_width = oa.t_quantile(0.975, 3) * batch_ratios.std(ddof=1) / 2
+        self.assertAlmostEqual(estimate['half_width'], half_width)
+        self.assertAlmostEqual(estimate['relative_half_width'], half_width / 3.0)
+
+    def test_no_interval_for_short_series_or_empty_batch(self):
+        self.assertIsNone(oa.batch_means_interval(np.ones(19), num_batches=4))
+        weights = np.ones(20)
+        weights[:5] = 0.0
+        self.assertIsNone(oa.batch_means_interval(np.ones(20), weights=weights, num_batches=4))
+
+class PrecisionStopTest(unittest.TestCase):
+    def test_loose_target_stops_release_early(self):
+        horizon_days = 30
+        plant, results = _run_plant({'sim_horizon_days': horizon_days, 'precision_target': 0.25})
+        stop_time = plant.precision_stop_time
+        self.assertIsNotNone(stop_time)
+        self.assertLess(stop_time, horizon_days * 86400)
+        # Release ends at the stop time and the run only drains the work in flight afterwards
+        self.assertEqual(plant.release_horizon, stop_time)
+        self.assertLess(plant.env.now, horizon_days * 86400)
+        self.assertTrue(results[4]['work_order_end_time'].notna().all())
+
+        summary = plant.output_summary()
+        self.assertEqual(summary['precision_stop_time'], stop_time)
+        for name, estimate in summary['kpis'].items():
+            with self.subTest(kpi=name):
+                self.assertLessEqual(estimate['relative_half_width'], 0.25)
+
+        # The summary is recorded in the run manifest
+        names = ['dim_machine', 'dim_product', 'dim_process', 'dim_process_route', 'fact_work_order',
+                 'fact_production_event', 'fact_downtime_event', 'fact_quality_event', 'dim_scenario']
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest_dir = etf.write_manifest(Path(tmp), 'R1', 'S1', 'output analysis test', plant.run_specs,
+                                              plant.config, dict(zip(names, results)), output_analysis=summary)
+            with open(manifest_dir / 'manifest.json', encoding='utf-8') as f:
+                manifest = json.load(f)
+        self.assertEqual(manifest['output_analysis']['precision_stop_time'], stop_time)
+        self.assertEqual(manifest['output_analysis']['precision_target'], 0.25)
+
+if __name__ == '__main__':
+    unittest.main()
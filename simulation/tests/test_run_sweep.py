@@ -0,0 +1,141 @@
+# Parameter sweep tests for the Production Plant Simulation
+"""
+Checks the design generation and the resume ledger of `run_sweep`.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+A sweep must be safe to re-run: points are identified by the hash of their
+config and seed, duplicated points run once, points already `completed` in
+the ledger are skipped and failed or never-run points are scheduled again.
+The ledger handling is checked with dry runs against a hand-written ledger,
+and a two-point sweep of a small plant is run for real and then repeated,
+which must find nothing left to run.
+
+Notes / Conventions
+-------------------
+- Run from the repository root:
+      python -m unittest discover simulation/tests
+  (or `python -m pytest simulation/tests`).
+- The sweeps write under `data/zz_sweep_test`, which is removed afterwards.
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import contextlib
+import io
+import json
+import shutil
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import export_to_folder as etf
+import run_simulation as rs
+import run_sweep
+
+####################################################################
+
+SEED = 7
+FOLDER = 'zz_sweep_test'
+
+# Three WIP limits, one of them listed twice
+PARAMETERS = {'run_specs.wip_limit': [8, 12, 8], 'work_order_interarrival.scale': [10.0]}
+
+def _base_config():
+    """
+    Small scenario C plant with a one-day horizon.
+    """
+    config = rs.load_config(rs.CONFIG_DIR / 'scenario_C.toml')
+    config['run_specs'].update(num_machines=10, num_products=5, sim_horizon_days=1)
+    return rs.validate_config(config)
+
+def _sweep(**kwargs):
+    """
+    Run `run_sweep.run_sweep` on the test parameters with its output suppressed.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        return run_sweep.run_sweep(_base_config(), PARAMETERS, seed=SEED, folder=FOLDER, **kwargs)
+
+class DesignTest(unittest.TestCase):
+    def test_factorial_levels(self):
+        design = run_sweep.generate_design({'a': [1, 2], 'b': {'low': 0, 'high': 10, 'levels': 3, 'integer': True}})
+        self.assertEqual(design, [{'a': a, 'b': b} for a in (1, 2) for b in (0, 5, 10)])
+        with self.assertRaises(ValueError):
+            run_sweep.generate_design({'b': {'low': 0, 'high': 10}})
+
+    def test_latin_hypercube_fills_every_stratum(self):
+        samples = 8
+        design = run_sweep.generate_design({'x': {'low': 0.0, 'high': 1.0}}, 'latin_hypercube', samples=samples, seed=SEED)
+        strata = sorted(int(point['x'] * samples) for point in design)
+        self.assertEqual(strata, list(range(samples)))
+        self.assertEqual(design, run_sweep.generate_design({'x': {'low': 0.0, 'high': 1.0}}, 'latin_hypercube', samples=samples, seed=SEED))
+        with self.assertRaises(ValueError):
+            run_sweep.generate_design({'x': [1]}, 'random')
+
+    def test_apply_parameters_rejects_unknown_paths(self):
+        config = _base_config()
+        updated = run_sweep.apply_parameters(config, {'run_specs.wip_limit': 99})
+        self.assertEqual(updated['run_specs']['wip_limit'], 99)
+        self.assertNotEqual(config['run_specs']['wip_limit'], 99)
+        with self.assertRaises(KeyError):
+            run_sweep.apply_parameters(config, {'run_specs.wip_limt': 99})
+
+    def test_hash_depends_on_config_and_seed(self):
+        config = _base_config()
+        self.assertEqual(run_sweep.config_hash(config, SEED), run_sweep.config_hash(_base_config(), SEED))
+        self.assertNotEqual(run_sweep.config_hash(config, SEED), run_sweep.config_hash(config, SEED + 1))
+
+class LedgerTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = etf.BASE_DIR / 'data' / FOLDER
+        self.ledger_path = self.folder / 'sweep_ledger.jsonl'
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def _write_ledger(self, records):
+        self.folder.mkdir(parents=True)
+        with open(self.ledger_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record) + '\n')
+
+    def test_duplicate_points_run_once(self):
+        planned = _sweep(dry_run=True)
+        self.assertEqual([record['parameters']['run_specs.wip_limit'] for record in planned], [8, 12])
+        self.assertEqual(len({record['scenario_id'] for record in planned}), 2)
+        for record in planned:
+            self.assertTrue(record['scenario_id'].startswith('SWP'))
+            self.assertEqual(record['scenario_id'][3:], record['config_hash'][:10])
+
+    def test_completed_points_are_skipped_and_failed_points_rerun(self):
+        first, second = _sweep(dry_run=True)
+        # The latest record per hash counts: `first` failed and then completed, `second` the reverse
+        self._write_ledger([dict(first, status='failed'), dict(first, status='completed'),
+                            dict(second, status='completed'), dict(second, status='failed')])
+        self.assertEqual(run_sweep.read_ledger(self.ledger_path)[first['config_hash']]['status'], 'completed')
+        self.assertEqual([record['config_hash'] for record in _sweep(dry_run=True)], [second['config_hash']])
+
+    def test_sweep_records_points_and_resumes(self):
+        records = _sweep(workers=1)
+        self.assertEqual(sorted(record['status'] for record in records), ['completed', 'completed'])
+        ledger = run_sweep.read_ledger(self.ledger_path)
+        self.assertEqual(set(ledger), {record['config_hash'] for record in records})
+        for record in ledger.values():
+            self.assertTrue((self.folder / record['run_dir']).is_dir())
+            self.assertGreater(record['rows']['fact_work_order'], 0)
+            self.assertNotIn('traceback', record)
+        # Nothing is left to run the second time
+        self.assertEqual(_sweep(workers=1), [])
+        with open(self.ledger_path, encoding='utf-8') as f:
+            self.assertEqual(sum(1 for line in f if line.strip()), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+# Work order store tests for the Production Plant Simulation
+"""
+Checks the append-only column store used for the work order staging table.
+
+Author
+------
+Patrick Ortiz
+
+Purpose
+-------
+`WorkOrderStore` replaces repeated `pd.concat` calls on the staging table,
+so it must behave like the concatenated DataFrame: batches appended past
+the preallocated capacity keep every earlier row, `lookup` and `column`
+return the stored values, `to_frame` matches the batches it was built from
+and a batch reusing a work order ID is rejected without changing the store.
+
+Notes / Conventions
+-------------------
+- Run from the repository root:
+      python -m unittest discover simulation/tests
+  (or `python -m pytest simulation/tests`).
+"""
+####################################################################
+## Required Setup ##
+####################################################################
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import data_generators as dg
+from WorkOrderStore import WorkOrderStore
+
+####################################################################
+
+SEED = 7
+
+def _batches(sizes, seed=SEED):
+    """
+    Generate work order batches of the given sizes with unique IDs across batches.
+    """
+    rng = np.random.default_rng(seed)
+    dim_product = pd.DataFrame({'product_id': [101, 202, 303], 'target_yield_rate': [0.91, 0.82, 0.73]})
+    batches, ids, start = [], set(), 0
+    for size in sizes:
+        batch = dg.create_work_order_batch(dim_product, num_work_orders=size, rngs={'structure': rng},
+                                           existing_ids=ids, start_index=start)
+        ids.update(batch['work_order_id'])
+        batches.append(batch)
+        start += size
+    return batches
+
+class WorkOrderStoreTest(unittest.TestCase):
+    def test_append_and_grow_keep_every_row(self):
+        batches = _batches([3, 5, 1, 9])
+        store = WorkOrderStore(capacity=4)
+        ranges = [store.append(batch) for batch in batches]
+        self.assertEqual(ranges, [(0, 3), (3, 8), (8, 9), (9, 18)])
+        self.assertEqual(len(store), 18)
+        # Capacity doubled from 4 to 32 to fit 18 rows
+        self.assertEqual(store._capacity, 32)
+        expected = pd.concat(batches)
+        pd.testing.assert_frame_equal(store.to_frame(), expected, check_index_type=False)
+        pd.testing.assert_frame_equal(store.to_frame(3, 8), batches[1], check_index_type=False)
+
+    def test_frame_dtypes_match_generated_batches(self):
+        batch = _batches([6])[0]
+        store = WorkOrderStore()
+        store.append(batch)
+        self.assertEqual(store.to_frame().dtypes.to_dict(), batch.dtypes.to_dict())
+
+    def test_lookup_and_membership(self):
+        batches = _batches([4, 4])
+        store = WorkOrderStore(capacity=2)
+        for batch in batches:
+            store.append(batch)
+        for row in pd.concat(batches).itertuples():
+            self.assertIn(row.work_order_id, store)
+            self.assertEqual(store.row_index[row.work_order_id], row.Index)
+            self.assertEqual(store.lookup(row.work_order_id, 'planned_quantity'), row.planned_quantity)
+            self.assertEqual(store.lookup(row.work_order_id, 'due_date'), np.datetime64(row.due_date))
+        self.assertNotIn('WO-25missing', store)
+        with self.assertRaises(KeyError):
+            store.lookup('WO-25missing', 'planned_quantity')
+
+    def test_column_ranges(self):
+        batch = _batches([10])[0]
+        store = WorkOrderStore()
+        store.append(batch)
+        quantities = batch['planned_quantity'].to_numpy()
+        np.testing.assert_array_equal(store.column('planned_quantity'), quantities)
+        np.testing.assert_array_equal(store.column('planned_quantity', 2, 5), quantities[2:5])
+        # Ranges are clipped to the filled rows
+        np.testing.assert_array_equal(store.column('planned_quantity', 7, 100), quantities[7:])
+        self.assertEqual(len(store.column('planned_quantity', 12, 20)), 0)
+        self.assertTrue(store.to_frame(12, 20).empty)
+
+    def test_duplicate_ids_are_rejected(self):
+        first, second = _batches([5, 3])
+        store = WorkOrderStore()
+        store.append(first)
+        duplicate = pd.concat([second, first.iloc[[2]]])
+        with self.assertRaises(ValueError):
+            store.append(duplicate)
+        # The rejected batch leaves the store unchanged
+        self.assertEqual(len(store), 5)
+        self.assertEqual(set(store.ids), set(first['work_order_id']))
+        self.assertEqual(store.append(second), (5, 8))
+
+if __name__ == '__main__':
+    unittest.main()